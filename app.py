@@ -34,12 +34,27 @@ tables = init_db()
 # Initialize services
 auth_service = AuthService(db_module)
 
+# Hash and precompress static/ so pages can link fingerprinted, immutable URLs
+from services.assets import asset_url, static_assets
+
+static_assets.build()
+
 # Create FastHTML app
 app, rt = fast_app(
-    hdrs=(Link(rel="stylesheet", href="/static/style.css"),),
+    hdrs=(Link(rel="stylesheet", href=asset_url("style.css")),),
     pico=False
 )
 
+# Resolve the session user once per request; serves /static and /health directly
+from routes.middleware import AuthMiddleware
+
+app.add_middleware(AuthMiddleware, auth_service=auth_service)
+
+# Outermost: gzip/brotli for HTML and JSON (large leaderboard tables on mobile)
+from routes.middleware import CompressionMiddleware
+
+app.add_middleware(CompressionMiddleware)
+
 # Initialize route utilities with services
 init_routes(auth_service, db_module)
 
@@ -93,12 +108,71 @@ scheduler.add_job(
     replace_existing=True
 )
 
+# Job 4: Send queued GroupMe notifications (pick confirmations) with retries
+from config import NOTIFY_DISPATCH_SECONDS
+from jobs.notification_jobs import dispatch_notifications_job
+
+scheduler.add_job(
+    dispatch_notifications_job,
+    'interval',
+    seconds=NOTIFY_DISPATCH_SECONDS,
+    args=[db_module],
+    id='dispatch_notifications',
+    replace_existing=True
+)
+
+# Job 5: Delete expired sessions in batches so the session table stays bounded
+from config import SESSION_PURGE_INTERVAL_MINUTES
+from jobs.session_jobs import purge_sessions_job
+
+scheduler.add_job(
+    purge_sessions_job,
+    'interval',
+    minutes=SESSION_PURGE_INTERVAL_MINUTES,
+    args=[db_module],
+    id='purge_sessions',
+    replace_existing=True
+)
+
+# Job 6: Push changed standings rows to open leaderboard pages. Not lease-gated:
+# each worker serves its own Server-Sent Events subscribers (idle if it has none)
+from config import LIVE_POLL_SECONDS
+from services.live_updates import publish_standings_changes
+
+scheduler.add_job(
+    publish_standings_changes,
+    'interval',
+    seconds=LIVE_POLL_SECONDS,
+    args=[db_module],
+    id='publish_standings_changes',
+    replace_existing=True
+)
+
+# Lease heartbeat: every worker schedules the jobs above, but only the lease
+# holder runs them (see services/leader.py)
+from config import LEASE_HEARTBEAT_SECONDS
+from services.leader import renew_leases, release_leases
+
+scheduler.add_job(
+    renew_leases,
+    'interval',
+    seconds=LEASE_HEARTBEAT_SECONDS,
+    args=[db_module],
+    id='lease_heartbeat',
+    replace_existing=True
+)
+
 # Start the scheduler
 scheduler.start()
-logger.info("APScheduler started with 2 background jobs (lock_picks_job disabled)")
+logger.info(f"APScheduler started with {len(scheduler.get_jobs())} background jobs (lock_picks_job disabled)")
 
-# Ensure scheduler shuts down gracefully when app exits
+# Ensure scheduler shuts down gracefully when app exits, handing leases over
 atexit.register(lambda: scheduler.shutdown())
+atexit.register(release_leases, db_module)
+
+# Close pooled outbound HTTP connections (DataGolf, GroupMe) on exit
+from services.http import close_http_clients
+atexit.register(close_http_clients)
 
 
 # ============ Run Server ============
@@ -1,13 +1,15 @@
 """Page layout components."""
 from fasthtml.common import *
 
+from services.assets import asset_url
+
 
 def page_head():
     """Common head elements."""
     return (
         Meta(charset="utf-8"),
         Meta(name="viewport", content="width=device-width, initial-scale=1"),
-        Link(rel="stylesheet", href="/static/style.css"),
+        Link(rel="stylesheet", href=asset_url("style.css")),
     )
 
 
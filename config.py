@@ -17,13 +17,66 @@ DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DATABASE_PATH}")
 
 # DataGolf API
 DATAGOLF_API_KEY = os.getenv("DATAGOLF_API_KEY", "")
+DATAGOLF_BASE_URL = os.getenv("DATAGOLF_BASE_URL", "https://feeds.datagolf.com")  # Point at scripts/datagolf_stub.py to run offline
+DATAGOLF_RECORD_DIR = os.getenv("DATAGOLF_RECORD_DIR", "")  # When set, every DataGolf response is saved here as a cassette
 
 # GroupMe Integration
 GROUPME_BOT_ID = os.getenv("GROUPME_BOT_ID", "")
 GROUPME_ACCESS_TOKEN = os.getenv("GROUPME_ACCESS_TOKEN", "")  # For API verification
 GROUPME_GROUP_ID = os.getenv("GROUPME_GROUP_ID", "")  # Group to verify membership
+GROUPME_MEMBER_CACHE_SECONDS = int(os.getenv("GROUPME_MEMBER_CACHE_SECONDS", "300"))  # Member list refreshed in the background after this
+GROUPME_MEMBER_MISS_REFRESH_SECONDS = int(os.getenv("GROUPME_MEMBER_MISS_REFRESH_SECONDS", "30"))  # Unknown name re-fetches at most this often
 
 # App settings
 APP_NAME = "Golf Pick'em"
-SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-change-in-production")
+SECRET_KEY = os.getenv("SECRET_KEY", "")  # Signs session cookies in signed SESSION_MODE (required for it; generate with openssl rand -hex 32)
 SESSION_DAYS = 30
+SESSION_CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", "1024"))  # Session tokens kept in the per-process lookup cache
+SESSION_CACHE_TTL_SECONDS = float(os.getenv("SESSION_CACHE_TTL_SECONDS", "30"))  # How long a cached session is trusted before re-checking the DB
+SESSION_MODE = os.getenv("SESSION_MODE", "db").lower()  # "db" (random token looked up per request) or "signed" (HMAC cookie, validated in memory)
+SESSION_REVOCATION_REFRESH_SECONDS = float(os.getenv("SESSION_REVOCATION_REFRESH_SECONDS", "10"))  # Signed mode: how often revoked sessions are re-read
+SESSION_PURGE_INTERVAL_MINUTES = int(os.getenv("SESSION_PURGE_INTERVAL_MINUTES", "60"))  # How often expired sessions are deleted
+SESSION_PURGE_BATCH_SIZE = int(os.getenv("SESSION_PURGE_BATCH_SIZE", "500"))  # Rows deleted per transaction by the purge
+SETTINGS_VERSION_CHECK_SECONDS = float(os.getenv("SETTINGS_VERSION_CHECK_SECONDS", "5"))  # How stale cached app settings may get across processes
+
+# Outbound HTTP - shared pooled clients for DataGolf and GroupMe
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+HTTP_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "60"))
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "false").lower() in ("1", "true", "yes")  # Requires the h2 package
+
+# Live-results ETL scheduling (etl/live_schedule.py)
+ETL_LIVE_INTERVAL_MINUTES = float(os.getenv("ETL_LIVE_INTERVAL_MINUTES", "2"))  # Sync interval while players are on course
+ETL_ROUND_COMPLETE_INTERVAL_MINUTES = float(os.getenv("ETL_ROUND_COMPLETE_INTERVAL_MINUTES", "30"))  # Back-off after a round when no tee times are known
+ETL_IDLE_INTERVAL_MINUTES = float(os.getenv("ETL_IDLE_INTERVAL_MINUTES", "60"))  # Check interval when nothing is in play
+
+# Leaderboard rows per page (pick'em entries and tournament golfers)
+LEADERBOARD_PAGE_SIZE = int(os.getenv("LEADERBOARD_PAGE_SIZE", "50"))
+
+# Rendered leaderboard tables kept per process, keyed by tournament standings version
+FRAGMENT_CACHE_SIZE = int(os.getenv("FRAGMENT_CACHE_SIZE", "64"))
+
+# Live leaderboard updates (Server-Sent Events)
+LIVE_POLL_SECONDS = int(os.getenv("LIVE_POLL_SECONDS", "5"))  # How often each web worker checks watched tournaments for new standings
+LIVE_HEARTBEAT_SECONDS = int(os.getenv("LIVE_HEARTBEAT_SECONDS", "20"))  # Keep-alive comment on idle streams (below proxy idle timeouts)
+LIVE_QUEUE_SIZE = int(os.getenv("LIVE_QUEUE_SIZE", "8"))  # Events buffered per connection before it is told to reload
+LIVE_RETRY_MS = int(os.getenv("LIVE_RETRY_MS", "5000"))  # Browser reconnect delay after a dropped stream
+LIVE_ROWS_POLL_SECONDS = int(os.getenv("LIVE_ROWS_POLL_SECONDS", "30"))  # Fallback polling of /leaderboard/rows without SSE
+
+# Response compression (HTML/JSON pages); brotli is used when the brotli package is installed
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))  # Smaller responses are sent as-is
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+
+# Scheduler leases - only the process holding a job's lease runs that job
+LEASE_TTL_SECONDS = int(os.getenv("LEASE_TTL_SECONDS", "90"))
+LEASE_HEARTBEAT_SECONDS = int(os.getenv("LEASE_HEARTBEAT_SECONDS", "30"))
+
+# Notification outbox - GroupMe messages queued with the write that caused them
+NOTIFY_DISPATCH_SECONDS = int(os.getenv("NOTIFY_DISPATCH_SECONDS", "10"))
+NOTIFY_MAX_ATTEMPTS = int(os.getenv("NOTIFY_MAX_ATTEMPTS", "8"))
+NOTIFY_BACKOFF_SECONDS = int(os.getenv("NOTIFY_BACKOFF_SECONDS", "30"))  # Doubles per failed attempt
+NOTIFY_BACKOFF_MAX_SECONDS = int(os.getenv("NOTIFY_BACKOFF_MAX_SECONDS", "3600"))
+GROUPME_DIGEST_WINDOW_SECONDS = int(os.getenv("GROUPME_DIGEST_WINDOW_SECONDS", "0"))  # 0 = one message per pick
+GROUPME_DIGEST_UNTIL_LOCK = os.getenv("GROUPME_DIGEST_UNTIL_LOCK", "false").lower() in ("1", "true", "yes")
+GROUPME_MIN_POST_INTERVAL_SECONDS = int(os.getenv("GROUPME_MIN_POST_INTERVAL_SECONDS", "5"))
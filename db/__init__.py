@@ -99,6 +99,9 @@ tournament_field = None
 picks = None
 tournament_results = None
 pickem_standings = None
+tournament_result_history = None
+scheduler_leases = None
+notification_outbox = None
 
 
 def init_db():
@@ -106,6 +109,7 @@ def init_db():
     from db.models import create_tables
     global users, sessions, app_settings, tournaments, golfers
     global tournament_field, picks, tournament_results, pickem_standings
+    global tournament_result_history, scheduler_leases, notification_outbox
 
     tables = create_tables(db)
     users = tables['users']
@@ -117,5 +121,8 @@ def init_db():
     picks = tables['picks']
     tournament_results = tables['tournament_results']
     pickem_standings = tables['pickem_standings']
+    tournament_result_history = tables['tournament_result_history']
+    scheduler_leases = tables['scheduler_leases']
+    notification_outbox = tables['notification_outbox']
 
     return tables
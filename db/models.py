@@ -21,6 +21,7 @@ class Session:
     token: str
     expires_at: str
     created_at: Optional[str] = None
+    revoked_at: Optional[str] = None  # Set on logout/user deletion; signed sessions check this
 
 
 @dataclass
@@ -43,6 +44,7 @@ class Tournament:
     last_synced_at: Optional[str] = None  # When results were last synced from DataGolf
     entry_price: Optional[int] = None  # Price for 1 entry (in dollars)
     three_entry_price: Optional[int] = None  # Discounted price for 3 entries (in dollars)
+    standings_version: Optional[int] = None  # Bumped whenever results/standings change (leaderboard cache key)
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
 
@@ -95,6 +97,21 @@ class TournamentResult:
     updated_at: Optional[str] = None
 
 
+@dataclass
+class TournamentResultHistory:
+    """Append-only score trajectory: one row per golfer per sync where something changed."""
+    id: int
+    tournament_id: int
+    golfer_id: int
+    round_num: Optional[int] = None  # Current-round score, as in tournament_result
+    thru: Optional[int] = None
+    score_to_par: Optional[int] = None
+    position: Optional[int] = None
+    status: Optional[str] = None
+    current_round: Optional[int] = None  # Event round (1-4) the row was recorded in
+    recorded_at: Optional[str] = None
+
+
 @dataclass
 class PickemStanding:
     id: int
@@ -112,11 +129,42 @@ class PickemStanding:
     fourth_best_score: Optional[int] = None  # 4th lowest score (None if < 4 made cut)
     has_fourth_made_cut: Optional[bool] = None  # True if 4th golfer made cut
     updated_at: Optional[str] = None
+    changed_version: Optional[int] = None  # tournament.standings_version when this row last changed
+    row_hash: Optional[str] = None  # Fingerprint of the displayed row, to detect changes
+
+
+@dataclass
+class SchedulerLease:
+    """Which process currently runs a scheduled job (see services/leader.py)."""
+    id: int
+    name: str
+    holder: Optional[str] = None
+    acquired_at: Optional[str] = None
+    heartbeat_at: Optional[str] = None
+    expires_at: Optional[str] = None
+
+
+@dataclass
+class NotificationOutbox:
+    """Queued GroupMe notification, written in the same transaction as its cause."""
+    id: int
+    kind: str  # pick
+    tournament_id: Optional[int] = None
+    payload: Optional[str] = None  # JSON
+    status: str = "pending"  # pending, sent, failed, skipped
+    attempts: int = 0
+    next_attempt_at: Optional[str] = None
+    last_error: Optional[str] = None
+    created_at: Optional[str] = None
+    sent_at: Optional[str] = None
 
 
 def create_tables(db):
     """Create all database tables and return table references."""
 
+    # Bring existing tables up to date before fastsql maps them to the dataclasses
+    _add_columns(db)
+
     users = db.create(
         User,
         pk='id',
@@ -171,9 +219,28 @@ def create_tables(db):
         transform=True
     )
 
+    tournament_result_history = db.create(
+        TournamentResultHistory,
+        pk='id',
+        transform=True
+    )
+
+    scheduler_leases = db.create(
+        SchedulerLease,
+        pk='id',
+        transform=True
+    )
+
+    notification_outbox = db.create(
+        NotificationOutbox,
+        pk='id',
+        transform=True
+    )
+
     # Add UNIQUE constraints to datagolf_id to prevent duplicates on sync
     # This must be done after table creation
     _add_unique_constraints(db)
+    _add_indexes(db)
 
     return {
         'users': users,
@@ -184,7 +251,10 @@ def create_tables(db):
         'tournament_field': tournament_field,
         'picks': picks,
         'tournament_results': tournament_results,
-        'pickem_standings': pickem_standings
+        'pickem_standings': pickem_standings,
+        'tournament_result_history': tournament_result_history,
+        'scheduler_leases': scheduler_leases,
+        'notification_outbox': notification_outbox
     }
 
 
@@ -225,3 +295,70 @@ def _add_unique_constraints(db):
         logger.warning(f"Could not create UNIQUE constraints: {e}. Upserts may create duplicates.")
 
 
+# Columns added to existing tables after they were first created. db.create()
+# never alters a table, so these are added on startup, before the tables are
+# mapped (new databases get them from the dataclasses). The matching files in
+# migrations/ do the same by hand. Every column here must also be declared on
+# its dataclass: fastsql maps whole rows, so an undeclared column breaks reads
+# and inserts once it exists.
+ADDED_COLUMNS = [
+    ("session", "revoked_at", "TEXT"),  # migrations/003
+    ("tournament", "standings_version", "INTEGER"),  # migrations/004
+    ("pickem_standing", "changed_version", "INTEGER"),  # migrations/005
+    ("pickem_standing", "row_hash", "TEXT"),  # migrations/005
+    ("tournament_result_history", "current_round", "INTEGER"),  # migrations/006
+]
+
+
+def _add_columns(db):
+    """Add any ADDED_COLUMNS missing from existing tables. Safe to call multiple times."""
+    import logging
+    import sqlalchemy as sa
+    from sqlalchemy import text
+
+    logger = logging.getLogger(__name__)
+
+    inspector = sa.inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    for table, column, column_type in ADDED_COLUMNS:
+        if table not in existing_tables:
+            # Created below with every dataclass column
+            continue
+        try:
+            if column in {c['name'] for c in inspector.get_columns(table)}:
+                continue
+            with db.engine.connect() as conn:
+                conn.execute(text(f'ALTER TABLE "{table}" ADD COLUMN {column} {column_type}'))
+                conn.commit()
+            logger.info(f"Added column {table}.{column}")
+        except Exception as e:
+            # Another process may have just added it
+            logger.warning(f"Could not add column {table}.{column}: {e}")
+
+
+def _add_indexes(db):
+    """Add lookup indexes. Safe to call multiple times on SQLite and PostgreSQL."""
+    import logging
+    from sqlalchemy import text
+
+    logger = logging.getLogger(__name__)
+
+    statements = [
+        "CREATE INDEX IF NOT EXISTS idx_session_token ON session(token)",
+        "CREATE INDEX IF NOT EXISTS idx_session_expires_at ON session(expires_at)",
+        "CREATE INDEX IF NOT EXISTS idx_result_history_golfer "
+        "ON tournament_result_history(tournament_id, golfer_id, recorded_at)",
+        "CREATE INDEX IF NOT EXISTS idx_pickem_standing_order "
+        "ON pickem_standing(tournament_id, rank, user_id, entry_number)",
+        "CREATE INDEX IF NOT EXISTS idx_pick_tournament ON pick(tournament_id, user_id)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_scheduler_lease_name ON scheduler_lease(name)",
+        "CREATE INDEX IF NOT EXISTS idx_notification_outbox_due "
+        "ON notification_outbox(status, next_attempt_at)",
+    ]
+    for sql in statements:
+        try:
+            with db.engine.connect() as conn:
+                conn.execute(text(sql))
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Could not create index ({sql}): {e}")
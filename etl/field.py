@@ -22,6 +22,7 @@ def auto_assign_field(db, datagolf_client, tournament_id) -> dict:
     Returns dict with 'assigned_count' and 'created_count' keys.
     """
     from sqlalchemy import text
+    from etl.resolver import golfer_resolver, ResolvedGolfer
 
     tournament = None
     for t in db.tournaments():
@@ -41,21 +42,21 @@ def auto_assign_field(db, datagolf_client, tournament_id) -> dict:
             f"Tournament mismatch: DB='{tournament.datagolf_name}' vs DataGolf='{dg_event_name}'"
         )
 
-    golfers_by_dg_id = {g.datagolf_id: g for g in db.golfers()}
+    golfers_by_dg_id = golfer_resolver.resolve_many(db, (p.get('dg_id') for p in field_players))
 
     # Create any golfers in the field that are missing from the DB
-    golfers_to_create = [
-        p for p in field_players
-        if str(p.get('dg_id', '')) and str(p.get('dg_id', '')) not in golfers_by_dg_id
-    ]
+    golfers_to_create = {}
+    for p in field_players:
+        dg_id = str(p.get('dg_id', ''))
+        if dg_id and dg_id not in golfers_by_dg_id:
+            golfers_to_create[dg_id] = p
 
     created_count = 0
     if golfers_to_create:
         now = datetime.now().isoformat()
         values_list = []
         params = {}
-        for i, p in enumerate(golfers_to_create):
-            dg_id = str(p.get('dg_id', ''))
+        for i, (dg_id, p) in enumerate(golfers_to_create.items()):
             raw_name = p.get('player_name', '')
             if ', ' in raw_name:
                 last, first = raw_name.split(', ', 1)
@@ -75,14 +76,17 @@ def auto_assign_field(db, datagolf_client, tournament_id) -> dict:
             sql = f"""
                 INSERT INTO golfer (datagolf_id, name, country, updated_at)
                 VALUES {', '.join(values_list)}
-                ON CONFLICT (datagolf_id) DO NOTHING
+                ON CONFLICT (datagolf_id) WHERE datagolf_id IS NOT NULL DO NOTHING
+                RETURNING id, datagolf_id, dg_skill
             """
-            conn.execute(text(sql), params)
+            created = [tuple(row) for row in conn.execute(text(sql), params).fetchall()]
             conn.commit()
 
-        # Refresh lookup after creating new golfers
-        golfers_by_dg_id = {g.datagolf_id: g for g in db.golfers()}
-        created_count = len(golfers_to_create)
+        # Learn the new ids instead of reloading the golfer table
+        golfer_resolver.learn(created)
+        for golfer_id, dg_id, dg_skill in created:
+            golfers_by_dg_id[str(dg_id)] = ResolvedGolfer(golfer_id, dg_skill)
+        created_count = len(created)
         logger.info(f"Created {created_count} golfers")
 
     # Match field players to DB golfers and sort by skill
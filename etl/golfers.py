@@ -5,21 +5,45 @@ from datetime import datetime
 logger = logging.getLogger(__name__)
 
 
-def sync_golfers(db, datagolf_client) -> dict:
-    """Sync golfers from DataGolf rankings into DB.
+def fetch_golfer_feeds(datagolf_client) -> tuple:
+    """Fetch the rankings and player list feeds used by the golfer sync.
 
-    Fetches top 400 ranked players (covers most tournament fields) and upserts
-    into the golfer table. Returns dict with 'golfer_count' key.
+    Returns (rankings, players).
     """
-    from sqlalchemy import text
-    from config import DATABASE_URL
-
     logger.info("Starting golfer sync - fetching rankings...")
-    rankings = datagolf_client.get_rankings()[:400]
+    rankings = datagolf_client.get_rankings()
     logger.info(f"Fetched {len(rankings)} rankings from DataGolf")
 
     players = datagolf_client.get_player_list()
     logger.info(f"Fetched {len(players)} players from DataGolf")
+    return rankings, players
+
+
+def _load_golfer_state(conn) -> dict:
+    """Current golfer rows keyed by datagolf_id: dg_id -> (name, country, dg_skill)."""
+    from sqlalchemy import text
+
+    rows = conn.execute(text(
+        "SELECT datagolf_id, name, country, dg_skill FROM golfer WHERE datagolf_id IS NOT NULL"
+    )).fetchall()
+    return {row[0]: (row[1], row[2], row[3]) for row in rows}
+
+
+def apply_golfers(conn, rankings, players) -> dict:
+    """Upsert the top 400 ranked players into the golfer table.
+
+    Compares each player against the current (name, country, dg_skill) for
+    their datagolf_id and writes only new or changed rows, with an
+    ON CONFLICT upsert so existing golfers keep their primary key (picks and
+    tournament_field reference it).
+
+    Runs on the caller's connection and does not commit, so it can share a
+    transaction with other sync steps. Returns dict with 'golfer_count',
+    'inserted', 'updated' and 'unchanged' keys.
+    """
+    from sqlalchemy import text
+
+    rankings = rankings[:400]
 
     # Build lookup: dg_id -> {name, country}
     player_info = {}
@@ -30,16 +54,28 @@ def sync_golfers(db, datagolf_client) -> dict:
             'country': p.get('country', '')
         }
 
-    now = datetime.now().isoformat()
-    values_list = []
-    params = {}
-    for i, r in enumerate(rankings):
+    # Desired state, de-duplicated by dg_id (a repeated id would make the
+    # upsert touch the same row twice, which PostgreSQL rejects)
+    desired = {}
+    for r in rankings:
         dg_id = str(r.get('dg_id', ''))
-        skill = r.get('dg_skill_estimate', 0)
         info = player_info.get(dg_id, {})
-        name = info.get('name', r.get('player_name', ''))
-        country = info.get('country', '')
+        desired[dg_id] = (
+            info.get('name', r.get('player_name', '')),
+            info.get('country', ''),
+            r.get('dg_skill_estimate', 0),
+        )
+
+    current = _load_golfer_state(conn)
+    inserted = [dg_id for dg_id in desired if dg_id not in current]
+    updated = [dg_id for dg_id in desired if dg_id in current and current[dg_id] != desired[dg_id]]
+    unchanged = len(desired) - len(inserted) - len(updated)
 
+    now = datetime.now().isoformat()
+    values_list = []
+    params = {}
+    for i, dg_id in enumerate(inserted + updated):
+        name, country, skill = desired[dg_id]
         values_list.append(f"(:dg_id_{i}, :name_{i}, :country_{i}, :skill_{i}, :updated_at_{i})")
         params[f"dg_id_{i}"] = dg_id
         params[f"name_{i}"] = name
@@ -47,27 +83,46 @@ def sync_golfers(db, datagolf_client) -> dict:
         params[f"skill_{i}"] = skill
         params[f"updated_at_{i}"] = now
 
-    logger.info(f"Batch upserting {len(values_list)} golfers...")
-    with db.db.engine.connect() as conn:
-        if DATABASE_URL.startswith("postgresql"):
-            sql = f"""
-                INSERT INTO golfer (datagolf_id, name, country, dg_skill, updated_at)
-                VALUES {', '.join(values_list)}
-                ON CONFLICT (datagolf_id) DO UPDATE SET
-                    name = EXCLUDED.name,
-                    country = EXCLUDED.country,
-                    dg_skill = EXCLUDED.dg_skill,
-                    updated_at = EXCLUDED.updated_at
-            """
-            conn.execute(text(sql), params)
-        else:
-            sql = f"""
-                INSERT OR REPLACE INTO golfer (datagolf_id, name, country, dg_skill, updated_at)
-                VALUES {', '.join(values_list)}
-            """
-            conn.execute(text(sql), params)
-
-        conn.commit()
-
-    logger.info(f"Synced {len(rankings)} ranked players to database")
-    return {"golfer_count": len(rankings)}
+    if values_list:
+        logger.info(f"Upserting {len(inserted)} new and {len(updated)} changed golfers...")
+        # The WHERE clause lets the conflict target match the partial unique
+        # index on SQLite; PostgreSQL accepts it against a full constraint too
+        sql = f"""
+            INSERT INTO golfer (datagolf_id, name, country, dg_skill, updated_at)
+            VALUES {', '.join(values_list)}
+            ON CONFLICT (datagolf_id) WHERE datagolf_id IS NOT NULL DO UPDATE SET
+                name = excluded.name,
+                country = excluded.country,
+                dg_skill = excluded.dg_skill,
+                updated_at = excluded.updated_at
+        """
+        conn.execute(text(sql), params)
+
+    logger.info(
+        f"Golfer sync: {len(inserted)} inserted, {len(updated)} updated, "
+        f"{unchanged} unchanged"
+    )
+    return {
+        "golfer_count": len(desired),
+        "inserted": len(inserted),
+        "updated": len(updated),
+        "unchanged": unchanged,
+    }
+
+
+def sync_golfers(db, datagolf_client) -> dict:
+    """Sync golfers from DataGolf rankings into DB.
+
+    Fetches top 400 ranked players (covers most tournament fields) and upserts
+    new or changed rows into the golfer table. Returns dict with
+    'golfer_count', 'inserted', 'updated' and 'unchanged' keys.
+    """
+    rankings, players = fetch_golfer_feeds(datagolf_client)
+
+    from etl.resolver import golfer_resolver
+
+    with db.db.engine.begin() as conn:
+        result = apply_golfers(conn, rankings, players)
+
+    golfer_resolver.invalidate()
+    return result
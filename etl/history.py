@@ -0,0 +1,115 @@
+"""ETL: Append-only score history for tournament results.
+
+tournament_result is overwritten on every sync; tournament_result_history keeps
+the trajectory. A row is appended for a golfer only when their round score,
+thru, score, position or status differs from what tournament_result held
+before the sync, so idle syncs add nothing.
+
+round_num is copied from tournament_result, where it holds DataGolf's
+current-round score; each row is tagged with the event's round number in
+current_round.
+
+Once a tournament completes, compact_history() keeps just the last row per
+golfer per round (the end-of-round snapshot) and drops the in-round detail.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+_TRACKED_FIELDS = ('round_num', 'thru', 'score_to_par', 'position', 'status')
+
+
+def load_current_results(conn, tournament_id: int) -> dict:
+    """Current tournament_result rows for a tournament: golfer_id -> tracked values."""
+    from sqlalchemy import text
+
+    rows = conn.execute(
+        text(
+            "SELECT golfer_id, round_num, thru, score_to_par, position, status "
+            "FROM tournament_result WHERE tournament_id = :tid"
+        ),
+        {"tid": tournament_id}
+    ).fetchall()
+    return {row[0]: tuple(row[1:]) for row in rows}
+
+
+def append_history(conn, previous: dict, results_data: list, recorded_at: str,
+                   current_round=None) -> int:
+    """Append history rows for results that changed since `previous`.
+
+    Args:
+        conn: open SQLAlchemy connection (caller commits)
+        previous: from load_current_results(), taken before the results were rewritten
+        results_data: result dicts as written to tournament_result
+        recorded_at: ISO timestamp for the new rows
+        current_round: round the event is in (live stats current_round)
+
+    Returns the number of rows appended.
+    """
+    from sqlalchemy import text
+
+    changed = [
+        r for r in results_data
+        if previous.get(r['golfer_id']) != tuple(r[f] for f in _TRACKED_FIELDS)
+    ]
+    if not changed:
+        return 0
+
+    values_list = []
+    params = {}
+    for i, r in enumerate(changed):
+        values_list.append(
+            f"(:tid_{i}, :gid_{i}, :round_{i}, :thru_{i}, :score_{i}, :pos_{i}, :status_{i}, "
+            f":current_round, :ts_{i})"
+        )
+        params[f"tid_{i}"] = r['tournament_id']
+        params[f"gid_{i}"] = r['golfer_id']
+        params[f"round_{i}"] = r['round_num']
+        params[f"thru_{i}"] = r['thru']
+        params[f"score_{i}"] = r['score_to_par']
+        params[f"pos_{i}"] = r['position']
+        params[f"status_{i}"] = r['status']
+        params[f"ts_{i}"] = recorded_at
+    params["current_round"] = current_round
+
+    sql = f"""
+        INSERT INTO tournament_result_history
+        (tournament_id, golfer_id, round_num, thru, score_to_par, position, status, current_round, recorded_at)
+        VALUES {', '.join(values_list)}
+    """
+    conn.execute(text(sql), params)
+    return len(changed)
+
+
+def compact_history(db, tournament_id: int) -> int:
+    """Keep only the end-of-round row per golfer per round for a tournament.
+
+    Called when a tournament completes. Rows recorded without a current_round
+    (before it was tracked) are kept as they are. Never raises; a failure is
+    only logged.
+    Returns the number of rows deleted.
+    """
+    from sqlalchemy import text
+
+    try:
+        with db.db.engine.begin() as conn:
+            result = conn.execute(
+                text("""
+                    DELETE FROM tournament_result_history
+                    WHERE tournament_id = :tid
+                      AND current_round IS NOT NULL
+                      AND id NOT IN (
+                          SELECT MAX(id) FROM tournament_result_history
+                          WHERE tournament_id = :tid AND current_round IS NOT NULL
+                          GROUP BY golfer_id, current_round
+                      )
+                """),
+                {"tid": tournament_id}
+            )
+            deleted = result.rowcount or 0
+    except Exception as e:
+        logger.error(f"Failed to compact score history for tournament {tournament_id}: {e}", exc_info=True)
+        return 0
+
+    logger.info(f"Compacted score history for tournament {tournament_id}: removed {deleted} rows")
+    return deleted
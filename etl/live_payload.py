@@ -0,0 +1,167 @@
+"""ETL: Parse a DataGolf live-stats payload into typed column arrays.
+
+The results sync, the on-course count and the completion check all need the
+same per-player fields. parse_live_stats() decodes them once into parallel
+stdlib `array`s (struct-of-arrays), with position strings like "T5", "CUT",
+"WD" resolved to an integer position plus a status code:
+
+    live = parse_live_stats(client.get_live_stats())
+    live.position[i], live.status[i], live.thru[i] ...
+
+Missing or unparseable integers are stored as MISSING. NumPy isn't a
+dependency, so whole-column operations are plain comprehensions over the
+arrays (see the helper methods on LiveStats).
+"""
+import hashlib
+from array import array
+
+MISSING = -(2 ** 31)
+
+STATUS_ACTIVE = 0
+STATUS_CUT = 1
+STATUS_WD = 2
+STATUS_DQ = 3
+STATUS_NAMES = ('active', 'cut', 'wd', 'dq')
+
+_STATUS_BY_POSITION = {
+    'CUT': STATUS_CUT,
+    'MC': STATUS_CUT,
+    'WD': STATUS_WD,
+    'W/D': STATUS_WD,
+    'DQ': STATUS_DQ,
+}
+
+
+def parse_thru(thru):
+    """Normalize a live-stats 'thru' value to holes completed (int) or None.
+
+    DataGolf sends ints, digit strings, or 'F' for a finished round.
+    """
+    if thru is None:
+        return None
+    if isinstance(thru, int):
+        return thru
+    text = str(thru).strip().upper()
+    if text == 'F':
+        return 18
+    if text.isdigit():
+        return int(text)
+    return None
+
+
+def parse_position(pos) -> tuple:
+    """Parse a position string into (position or None, status code).
+
+    "5" and "T5" are position 5; "CUT"/"MC", "WD"/"W/D" and "DQ" map to a
+    status with no position. Anything else is an active player without a
+    position yet.
+    """
+    if pos is None or pos == '':
+        return None, STATUS_ACTIVE
+    if isinstance(pos, int):
+        return pos, STATUS_ACTIVE
+    text = str(pos)
+    clean = text.replace('T', '').strip()
+    if clean.isascii() and clean.isdigit():
+        return int(clean), STATUS_ACTIVE
+    return None, _STATUS_BY_POSITION.get(text.upper(), STATUS_ACTIVE)
+
+
+def _to_int(value):
+    """Int for ints and integral numeric strings, else None."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    text = str(value).strip()
+    if text.lstrip('+-').isascii() and text.lstrip('+-').isdigit():
+        return int(text)
+    return None
+
+
+def _stored(value):
+    return MISSING if value is None else value
+
+
+def _loaded(value):
+    return None if value == MISSING else value
+
+
+class LiveStats:
+    """Struct-of-arrays view of one live-stats payload.
+
+    Columns (all the same length, one entry per player):
+        dg_id     array('q')
+        position  array('l')  finishing position, MISSING if none
+        status    array('b')  STATUS_* code
+        total     array('l')  score to par
+        thru      array('l')  holes completed this round (F = 18)
+        round     array('l')  current round score
+    """
+
+    __slots__ = ('event_name', 'current_round', 'dg_id', 'position', 'status',
+                 'total', 'thru', 'round')
+
+    def __init__(self, event_name='', current_round=None):
+        self.event_name = event_name
+        self.current_round = current_round
+        self.dg_id = array('q')
+        self.position = array('l')
+        self.status = array('b')
+        self.total = array('l')
+        self.thru = array('l')
+        self.round = array('l')
+
+    def __len__(self):
+        return len(self.dg_id)
+
+    def append(self, player: dict):
+        """Decode one live_stats entry onto the end of every column."""
+        position, status = parse_position(player.get('position'))
+        self.dg_id.append(_stored(_to_int(player.get('dg_id'))))
+        self.position.append(_stored(position))
+        self.status.append(status)
+        self.total.append(_stored(_to_int(player.get('total'))))
+        self.thru.append(_stored(parse_thru(player.get('thru'))))
+        self.round.append(_stored(_to_int(player.get('round'))))
+
+    def rows(self):
+        """Yield (dg_id, position, status_name, total, thru, round) with None for missing."""
+        for i in range(len(self.dg_id)):
+            yield (
+                _loaded(self.dg_id[i]),
+                _loaded(self.position[i]),
+                STATUS_NAMES[self.status[i]],
+                _loaded(self.total[i]),
+                _loaded(self.thru[i]),
+                _loaded(self.round[i]),
+            )
+
+    def on_course_count(self) -> tuple:
+        """(players still playing this round, players finished this round)."""
+        started = [t for t in self.thru if t != MISSING]
+        on_course = sum(1 for t in started if t < 18)
+        return on_course, len(started) - on_course
+
+    def positioned_finished_count(self) -> tuple:
+        """(players holding a position, of those how many are through 18)."""
+        positioned = [t for p, t in zip(self.position, self.thru) if p != MISSING]
+        return len(positioned), sum(1 for t in positioned if t >= 18)
+
+    def fingerprint(self) -> str:
+        """Hash of every column, to detect an unchanged payload cheaply."""
+        digest = hashlib.sha1(self.event_name.encode())
+        for column in (self.dg_id, self.position, self.status, self.total, self.thru, self.round):
+            digest.update(column.tobytes())
+        return digest.hexdigest()
+
+
+def parse_live_stats(live_data) -> LiveStats:
+    """Parse a get_live_stats() payload into a LiveStats."""
+    live_data = live_data or {}
+    parsed = LiveStats(live_data.get('event_name', '') or '', live_data.get('current_round'))
+    for player in live_data.get('live_stats', []) or []:
+        parsed.append(player)
+    return parsed
@@ -0,0 +1,124 @@
+"""ETL: Decide when the next live-results sync should run.
+
+Instead of syncing on a fixed interval all week, the runner asks
+next_sync_delay() after every sync:
+
+  - players on course           -> every ETL_LIVE_INTERVAL_MINUTES (default 2)
+  - next tee time known         -> sleep until just before it (covers Tue/Wed
+                                   before play, overnight and between rounds)
+  - round complete, no tee time -> back off to ETL_ROUND_COMPLETE_INTERVAL_MINUTES
+  - quiet hours, no tee time    -> sleep until quiet hours end
+  - nothing known               -> ETL_IDLE_INTERVAL_MINUTES
+"""
+import logging
+from datetime import datetime, timedelta
+
+from config import (
+    ETL_IDLE_INTERVAL_MINUTES,
+    ETL_LIVE_INTERVAL_MINUTES,
+    ETL_ROUND_COMPLETE_INTERVAL_MINUTES,
+)
+from etl.live_payload import LiveStats, parse_live_stats
+
+logger = logging.getLogger(__name__)
+
+TEE_TIME_LEAD_MINUTES = 10  # Start live syncing this long before the first tee time
+QUIET_START_HOUR = 21  # No golf between 9 PM and 6 AM ET
+QUIET_END_HOUR = 6
+MAX_SLEEP_MINUTES = 18 * 60  # Never sleep longer than this, even on a bad tee time
+
+_TEE_TIME_FORMATS = ("%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S")
+_CLOCK_FORMATS = ("%I:%M%p", "%I:%M %p", "%H:%M")
+
+
+def count_players_on_course(live_stats) -> tuple:
+    """Count players still playing vs finished for the current round.
+
+    A player is on course if they have started (thru is set) but not finished
+    18 holes. Accepts a raw live_stats list or a parsed LiveStats.
+    Returns (players_on_course, players_finished).
+    """
+    if not isinstance(live_stats, LiveStats):
+        live_stats = parse_live_stats({'live_stats': live_stats})
+    return live_stats.on_course_count()
+
+
+def _parse_tee_time(value, round_num, tournament_start):
+    """Parse one tee time string into a datetime, or None.
+
+    Time-only values ("8:05am") are placed on tournament start date + round - 1.
+    """
+    if not value:
+        return None
+    text = str(value).strip()
+    for fmt in _TEE_TIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            pass
+    if tournament_start is None or not round_num:
+        return None
+    for fmt in _CLOCK_FORMATS:
+        try:
+            clock = datetime.strptime(text.upper(), fmt).time()
+        except ValueError:
+            continue
+        day = tournament_start.date() + timedelta(days=int(round_num) - 1)
+        return datetime.combine(day, clock)
+    return None
+
+
+def parse_tee_times(field_data, tournament_start=None) -> list:
+    """Extract all tee times from a field-updates payload, sorted.
+
+    Handles both per-player 'r1_teetime'..'r4_teetime' keys and a per-player
+    'teetimes' list of {'round_num', 'teetime'} entries.
+    """
+    tee_times = []
+    for player in (field_data or {}).get('field', []):
+        for round_num in range(1, 5):
+            tee = _parse_tee_time(player.get(f'r{round_num}_teetime'), round_num, tournament_start)
+            if tee:
+                tee_times.append(tee)
+        for entry in player.get('teetimes') or []:
+            tee = _parse_tee_time(entry.get('teetime'), entry.get('round_num'), tournament_start)
+            if tee:
+                tee_times.append(tee)
+    return sorted(set(tee_times))
+
+
+def next_sync_delay(players_on_course: int, players_finished: int, tee_times=None,
+                    now: datetime = None) -> tuple:
+    """Minutes until the next live sync, with a short reason for the log.
+
+    Args:
+        players_on_course: from count_players_on_course()
+        players_finished: from count_players_on_course()
+        tee_times: sorted tee times from parse_tee_times(), may be empty
+        now: current time (default: datetime.now())
+
+    Returns (minutes, reason).
+    """
+    now = now or datetime.now()
+
+    if players_on_course > 0:
+        return ETL_LIVE_INTERVAL_MINUTES, f"{players_on_course} players on course"
+
+    upcoming = [t for t in (tee_times or []) if t + timedelta(minutes=ETL_LIVE_INTERVAL_MINUTES) > now]
+    if upcoming:
+        wake = upcoming[0] - timedelta(minutes=TEE_TIME_LEAD_MINUTES)
+        minutes = (wake - now).total_seconds() / 60
+        if minutes <= ETL_LIVE_INTERVAL_MINUTES:
+            return ETL_LIVE_INTERVAL_MINUTES, f"next tee time {upcoming[0]:%a %H:%M}"
+        return min(minutes, MAX_SLEEP_MINUTES), f"sleeping until tee time {upcoming[0]:%a %H:%M}"
+
+    if now.hour >= QUIET_START_HOUR or now.hour < QUIET_END_HOUR:
+        wake = now.replace(hour=QUIET_END_HOUR, minute=0, second=0, microsecond=0)
+        if wake <= now:
+            wake += timedelta(days=1)
+        return (wake - now).total_seconds() / 60, "overnight"
+
+    if players_finished > 0:
+        return ETL_ROUND_COMPLETE_INTERVAL_MINUTES, f"round complete ({players_finished} finished)"
+
+    return ETL_IDLE_INTERVAL_MINUTES, "no play in progress"
@@ -0,0 +1,48 @@
+"""ETL: Live-ingestion pipeline for an active tournament.
+
+One live-stats payload, fetched once and parsed once, flows through:
+
+    ingest      -> sync_results: tournament_result (+ history)
+    standings   -> ScoringService.calculate_standings
+    completion  -> complete the tournament if everyone has finished round 4
+
+so a tournament completes within one sync interval of the last putt without
+a separate DataGolf call. The runner's complete_tournaments job remains as a
+fallback.
+"""
+import logging
+
+from etl.live_payload import LiveStats, parse_live_stats
+from etl.results import sync_results
+from etl.tournament_state import complete_tournament, tournament_is_complete
+
+logger = logging.getLogger(__name__)
+
+
+def run_live_sync(db, datagolf_client, tournament, live_data=None) -> dict:
+    """Run ingest, standings and completion for one tournament.
+
+    Pass live_data (raw payload or parsed LiveStats) to reuse an already
+    fetched payload; otherwise it is fetched here.
+
+    Raises:
+        ValueError: if the DataGolf event name doesn't match the tournament.
+
+    Returns dict with 'result_count', 'history_count' and 'completed' keys.
+    """
+    from services.scoring import ScoringService
+
+    if live_data is None:
+        live_data = datagolf_client.get_live_stats()
+    live = live_data if isinstance(live_data, LiveStats) else parse_live_stats(live_data)
+
+    result = sync_results(db, datagolf_client, tournament, live_data=live)
+
+    if result['result_count']:
+        ScoringService(db).calculate_standings(tournament.id)
+
+    completed = False
+    if tournament.status == 'active' and tournament_is_complete(tournament, live):
+        completed = complete_tournament(db, tournament)
+
+    return {**result, 'completed': completed}
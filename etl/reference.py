@@ -0,0 +1,53 @@
+"""ETL: Sync golfers and the tournament schedule from DataGolf in one pass.
+
+The three feeds behind an admin "Sync from DataGolf" (rankings, player list,
+schedule) are independent, so they are fetched concurrently and the writes
+are applied afterwards in a single transaction.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from etl.golfers import apply_golfers
+from etl.resolver import golfer_resolver
+from etl.tournaments import apply_tournaments
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_reference_feeds(datagolf_client) -> dict:
+    """Fetch rankings, player list and schedule concurrently.
+
+    Wall time is roughly that of the slowest call. Any fetch error is raised
+    before anything is written.
+
+    Returns dict with 'rankings', 'players' and 'schedule' keys.
+    """
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="datagolf-fetch") as pool:
+        futures = {
+            'rankings': pool.submit(datagolf_client.get_rankings),
+            'players': pool.submit(datagolf_client.get_player_list),
+            'schedule': pool.submit(datagolf_client.get_schedule),
+        }
+        feeds = {name: future.result() for name, future in futures.items()}
+
+    logger.info(
+        f"Fetched {len(feeds['rankings'])} rankings, {len(feeds['players'])} players, "
+        f"{len(feeds['schedule'])} scheduled events from DataGolf"
+    )
+    return feeds
+
+
+def sync_reference_data(db, datagolf_client) -> dict:
+    """Sync golfers and tournaments from DataGolf.
+
+    Returns dict with 'golfer_count' and 'tournament_count' keys.
+    """
+    feeds = fetch_reference_feeds(datagolf_client)
+
+    with db.db.engine.begin() as conn:
+        golfer_result = apply_golfers(conn, feeds['rankings'], feeds['players'])
+        tournament_result = apply_tournaments(conn, feeds['schedule'])
+
+    golfer_resolver.invalidate()
+
+    return {**golfer_result, **tournament_result}
@@ -0,0 +1,105 @@
+"""ETL: Resolve DataGolf ids to golfer rows without rescanning the golfer table.
+
+Every ETL path that maps live/field payloads onto golfers used to rebuild
+{datagolf_id: Golfer} from a full table scan. golfer_resolver keeps that
+mapping in memory instead:
+
+  - loaded once (and again after MAX_AGE_SECONDS, to pick up changes made by
+    another process)
+  - ids it hasn't seen are looked up in one targeted query per call
+  - new golfers are learned straight from INSERT ... RETURNING
+  - invalidate() after a golfer sync drops it so skills are re-read
+"""
+import logging
+import threading
+import time
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_AGE_SECONDS = 3600
+
+
+class ResolvedGolfer(NamedTuple):
+    id: int
+    dg_skill: Optional[float]
+
+
+class GolferResolver:
+    """In-memory datagolf_id -> ResolvedGolfer map."""
+
+    def __init__(self, max_age_seconds: float = MAX_AGE_SECONDS):
+        self.max_age_seconds = max_age_seconds
+        self._by_dg_id = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Drop the mapping; the next lookup reloads it."""
+        with self._lock:
+            self._by_dg_id = None
+
+    def learn(self, rows):
+        """Add (id, datagolf_id, dg_skill) rows, e.g. from INSERT ... RETURNING."""
+        with self._lock:
+            if self._by_dg_id is None:
+                return
+            for golfer_id, dg_id, dg_skill in rows:
+                self._by_dg_id[str(dg_id)] = ResolvedGolfer(golfer_id, dg_skill)
+
+    def resolve_many(self, db, dg_ids) -> dict:
+        """Resolve DataGolf ids to golfers. Returns dg_id -> ResolvedGolfer for known ids.
+
+        Ids not in memory are fetched with one targeted query; ids that still
+        aren't found are simply absent from the result.
+        """
+        dg_ids = {str(d) for d in dg_ids if d not in (None, '')}
+        mapping = self._mapping(db)
+
+        found = {d: mapping[d] for d in dg_ids if d in mapping}
+        missing = dg_ids - found.keys()
+        if missing:
+            rows = self._query(db, missing)
+            if rows:
+                self.learn(rows)
+                for golfer_id, dg_id, dg_skill in rows:
+                    found[str(dg_id)] = ResolvedGolfer(golfer_id, dg_skill)
+        return found
+
+    def resolve(self, db, dg_id) -> Optional[ResolvedGolfer]:
+        """Resolve a single DataGolf id, or None if there's no such golfer."""
+        return self.resolve_many(db, [dg_id]).get(str(dg_id))
+
+    def _mapping(self, db) -> dict:
+        with self._lock:
+            stale = time.monotonic() - self._loaded_at > self.max_age_seconds
+            if self._by_dg_id is not None and not stale:
+                return self._by_dg_id
+
+        rows = self._query(db)
+        mapping = {str(dg_id): ResolvedGolfer(golfer_id, dg_skill) for golfer_id, dg_id, dg_skill in rows}
+        with self._lock:
+            self._by_dg_id = mapping
+            self._loaded_at = time.monotonic()
+        logger.info(f"Loaded {len(mapping)} golfers into resolver")
+        return mapping
+
+    @staticmethod
+    def _query(db, dg_ids=None) -> list:
+        """Fetch (id, datagolf_id, dg_skill) rows, optionally only for some ids."""
+        from sqlalchemy import text
+
+        sql = "SELECT id, datagolf_id, dg_skill FROM golfer WHERE datagolf_id IS NOT NULL"
+        params = {}
+        if dg_ids is not None:
+            placeholders = []
+            for i, dg_id in enumerate(sorted(dg_ids)):
+                placeholders.append(f":dg_id_{i}")
+                params[f"dg_id_{i}"] = dg_id
+            sql += f" AND datagolf_id IN ({', '.join(placeholders)})"
+
+        with db.db.engine.connect() as conn:
+            return [tuple(row) for row in conn.execute(text(sql), params).fetchall()]
+
+
+golfer_resolver = GolferResolver()
@@ -2,6 +2,8 @@
 import logging
 from datetime import datetime
 
+from etl.live_payload import MISSING, LiveStats, parse_live_stats
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,72 +30,65 @@ def _tournament_names_match(db_name: str, api_name: str) -> bool:
     return False
 
 
-def sync_results(db, datagolf_client, tournament) -> dict:
+def sync_results(db, datagolf_client, tournament, live_data=None) -> dict:
     """Sync live tournament results from DataGolf into tournament_result table.
 
     Validates that the DataGolf API is returning data for the correct tournament.
     Does NOT call calculate_standings — callers must do that separately.
+    Pass live_data (raw payload or parsed LiveStats) to reuse an already
+    fetched live-stats payload.
+    Rows that changed since the last sync are also appended to
+    tournament_result_history (see etl/history.py).
 
     Raises:
         ValueError: if the DataGolf event name doesn't match the tournament.
 
-    Returns dict with 'result_count' key.
+    Returns dict with 'result_count' and 'history_count' keys.
     """
     from sqlalchemy import text
+    from etl.history import load_current_results, append_history
+    from etl.resolver import golfer_resolver
 
     tournament_id = tournament.id
 
-    live_data = datagolf_client.get_live_stats()
+    if live_data is None:
+        live_data = datagolf_client.get_live_stats()
+    live = live_data if isinstance(live_data, LiveStats) else parse_live_stats(live_data)
 
     # Validate tournament name match before writing anything
-    api_event_name = live_data.get('event_name', '')
+    api_event_name = live.event_name
     if not _tournament_names_match(tournament.name, api_event_name):
         raise ValueError(
             f"Tournament mismatch: DataGolf is returning data for '{api_event_name}', "
             f"not '{tournament.name}'. Sync cancelled."
         )
 
-    live_stats = live_data.get('live_stats', [])
-    golfers_by_dg_id = {g.datagolf_id: g for g in db.golfers()}
+    golfers_by_dg_id = golfer_resolver.resolve_many(db, (d for d in live.dg_id if d != MISSING))
 
     now = datetime.now().isoformat()
     results_data = []
+    history_count = 0
 
-    for player in live_stats:
-        dg_id = str(player.get('dg_id', ''))
-        golfer = golfers_by_dg_id.get(dg_id)
+    for dg_id, position, status, total, thru, round_score in live.rows():
+        golfer = golfers_by_dg_id.get(str(dg_id))
         if not golfer:
             continue
 
-        pos_str = player.get('position', '')
-        position = None
-        status = 'active'
-
-        if pos_str:
-            pos_clean = pos_str.replace('T', '').strip()
-            if pos_clean.isdigit():
-                position = int(pos_clean)
-            elif pos_str.upper() in ('CUT', 'MC'):
-                status = 'cut'
-            elif pos_str.upper() in ('WD', 'W/D'):
-                status = 'wd'
-            elif pos_str.upper() == 'DQ':
-                status = 'dq'
-
         results_data.append({
             'tournament_id': tournament_id,
             'golfer_id': golfer.id,
             'position': position,
-            'score_to_par': player.get('total'),
+            'score_to_par': total,
             'status': status,
-            'round_num': player.get('round'),
-            'thru': player.get('thru'),
+            'round_num': round_score,
+            'thru': thru,
             'updated_at': now
         })
 
     if results_data:
         logger.info(f"Batch upserting {len(results_data)} tournament results...")
         with db.db.engine.connect() as conn:
+            previous = load_current_results(conn, tournament_id)
             conn.execute(
                 text("DELETE FROM tournament_result WHERE tournament_id = :tid"),
                 {"tid": tournament_id}
@@ -120,11 +115,15 @@ def sync_results(db, datagolf_client, tournament) -> dict:
                 VALUES {', '.join(values_list)}
             """
             conn.execute(text(sql), params)
+            history_count = append_history(conn, previous, results_data, now, live.current_round)
             conn.commit()
 
-        logger.info(f"Synced {len(results_data)} results for tournament {tournament_id}")
+        logger.info(
+            f"Synced {len(results_data)} results for tournament {tournament_id} "
+            f"({history_count} history rows)"
+        )
 
     # Update tournament last_synced_at timestamp
     db.tournaments.update(id=tournament_id, last_synced_at=now)
 
-    return {"result_count": len(results_data)}
+    return {"result_count": len(results_data), "history_count": history_count}
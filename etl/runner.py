@@ -6,11 +6,15 @@ Run as a separate process:
 Environment variables:
     DATABASE_URL                - SQLAlchemy connection string (same as web app)
     DATAGOLF_API_KEY            - DataGolf API key
-    ETL_SYNC_INTERVAL_MINUTES   - How often to sync live results (default: 10)
+    ETL_SYNC_INTERVAL_MINUTES   - Live sync retry interval after an error (default: 10)
+    ETL_LIVE_INTERVAL_MINUTES   - Live sync interval while players are on course (default: 2)
+    ETL_ROUND_COMPLETE_INTERVAL_MINUTES - Back-off after a round with no tee times known (default: 30)
+    ETL_IDLE_INTERVAL_MINUTES   - Check interval when nothing is in play (default: 60)
 """
 import logging
 import os
 import sys
+from datetime import datetime, timedelta
 
 # Ensure the project root is on the Python path when invoked directly
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -26,13 +30,23 @@ from apscheduler.schedulers.blocking import BlockingScheduler
 from db import init_db
 import db as db_module
 from services.datagolf import DataGolfClient
+from services.http import close_http_clients
+from services.leader import acquire_lease, renew_leases, release_leases
+from config import ETL_IDLE_INTERVAL_MINUTES, LEASE_HEARTBEAT_SECONDS, SESSION_PURGE_INTERVAL_MINUTES
+from jobs.session_jobs import purge_sessions_job
 
 from etl.tournament_state import activate_tournaments, complete_tournaments
-from etl.results import sync_results
+from etl.results import _tournament_names_match
+from etl.pipeline import run_live_sync
+from etl.live_payload import parse_live_stats
+from etl.live_schedule import next_sync_delay, parse_tee_times
 
 
 def _activate_job():
     """Job: activate upcoming tournaments on Tuesday of tournament week."""
+    if not acquire_lease(db_module, 'activate_tournaments'):
+        logger.debug("Skipping activate_tournaments - another process holds the lease")
+        return
     logger.info("ETL job: activate_tournaments")
     try:
         count = activate_tournaments(db_module)
@@ -42,7 +56,10 @@ def _activate_job():
 
 
 def _complete_job():
-    """Job: complete finished tournaments when all players finish round 4."""
+    """Job: fallback completion check (the live sync normally completes tournaments)."""
+    if not acquire_lease(db_module, 'complete_tournaments'):
+        logger.debug("Skipping complete_tournaments - another process holds the lease")
+        return
     logger.info("ETL job: complete_tournaments")
     try:
         client = DataGolfClient()
@@ -52,31 +69,107 @@ def _complete_job():
         logger.error(f"complete_tournaments failed: {e}", exc_info=True)
 
 
-def _sync_results_job():
-    """Job: sync live results and recalculate standings for the active tournament."""
-    logger.info("ETL job: sync_results")
+# Fingerprint of the last live payload written per tournament, so an unchanged
+# feed (overnight, between rounds) doesn't rewrite results and standings
+_last_written = {}
+
+# Tee times per tournament from field-updates: tournament_id -> (fetched_at, tee_times)
+_tee_time_cache = {}
+TEE_TIME_REFRESH_MINUTES = 60
+
+
+def _get_tee_times(client, tournament) -> list:
+    """Tee times for the tournament from field-updates, refreshed at most hourly."""
+    cached = _tee_time_cache.get(tournament.id)
+    if cached and datetime.now() - cached[0] < timedelta(minutes=TEE_TIME_REFRESH_MINUTES):
+        return cached[1]
+
+    tee_times = []
     try:
-        active = [t for t in db_module.tournaments() if t.status == 'active']
-        if not active:
-            logger.debug("No active tournament, skipping results sync")
-            return
+        field_data = client.get_field_updates()
+        if _tournament_names_match(tournament.name, field_data.get('event_name', '')):
+            start = None
+            if tournament.start_date:
+                try:
+                    start = datetime.fromisoformat(tournament.start_date)
+                except ValueError:
+                    pass
+            tee_times = parse_tee_times(field_data, start)
+    except Exception as e:
+        logger.warning(f"Could not fetch tee times: {e}")
 
-        client = DataGolfClient()
-        tournament = active[0]
-        result = sync_results(db_module, client, tournament)
+    _tee_time_cache[tournament.id] = (datetime.now(), tee_times)
+    return tee_times
 
-        from services.scoring import ScoringService
-        ScoringService(db_module).calculate_standings(tournament.id)
 
-        logger.info(
-            f"ETL job done: synced {result['result_count']} results "
-            f"for '{tournament.name}', standings recalculated"
-        )
-    except ValueError as e:
-        # Tournament name mismatch — not an error condition, just skip
-        logger.warning(f"Results sync skipped: {e}")
+def _sync_live_results(now: datetime) -> tuple:
+    """Sync live results if the feed changed. Returns (minutes until next sync, reason).
+
+    `now` is naive Eastern time, matching tee times and quiet hours.
+    """
+    active = [t for t in db_module.tournaments() if t.status == 'active']
+    if not active:
+        return ETL_IDLE_INTERVAL_MINUTES, "no active tournament"
+
+    client = DataGolfClient()
+    tournament = active[0]
+    live = parse_live_stats(client.get_live_stats())
+
+    on_course, finished = 0, 0
+    if _tournament_names_match(tournament.name, live.event_name):
+        on_course, finished = live.on_course_count()
+
+    fingerprint = live.fingerprint()
+    if _last_written.get(tournament.id) == fingerprint:
+        logger.info("Live stats unchanged since last sync, skipping write")
+    else:
+        try:
+            result = run_live_sync(db_module, client, tournament, live_data=live)
+
+            _last_written[tournament.id] = fingerprint
+            logger.info(
+                f"ETL job done: synced {result['result_count']} results "
+                f"for '{tournament.name}', standings recalculated"
+            )
+            if result['completed']:
+                return ETL_IDLE_INTERVAL_MINUTES, "tournament completed"
+        except ValueError as e:
+            # Tournament name mismatch — not an error condition, just skip
+            logger.warning(f"Results sync skipped: {e}")
+
+    tee_times = [] if on_course else _get_tee_times(client, tournament)
+    return next_sync_delay(on_course, finished, tee_times, now=now)
+
+
+def _sync_results_job(scheduler, fallback_minutes):
+    """Job: sync live results, then schedule the next run based on play state.
+
+    Syncs every couple of minutes while players are on course and sleeps
+    until the next tee time otherwise (see etl/live_schedule.py).
+    """
+    logger.info("ETL job: sync_results")
+    minutes, reason = fallback_minutes, "fallback interval"
+    try:
+        if not acquire_lease(db_module, 'sync_results'):
+            # Another runner is syncing; check back in case it goes away
+            minutes, reason = fallback_minutes, "another process holds the lease"
+            return
+
+        now = datetime.now(scheduler.timezone).replace(tzinfo=None)
+        minutes, reason = _sync_live_results(now)
     except Exception as e:
         logger.error(f"sync_results failed: {e}", exc_info=True)
+    finally:
+        run_date = datetime.now(scheduler.timezone) + timedelta(minutes=minutes)
+        scheduler.add_job(
+            _sync_results_job,
+            'date',
+            run_date=run_date,
+            args=[scheduler, fallback_minutes],
+            id='sync_results',
+            replace_existing=True
+        )
+        logger.info(f"Next live sync at {run_date:%a %H:%M} ({reason})")
 
 
 if __name__ == "__main__":
@@ -84,7 +177,7 @@ if __name__ == "__main__":
     init_db()
 
     sync_interval = int(os.getenv("ETL_SYNC_INTERVAL_MINUTES", "10"))
-    logger.info(f"ETL runner starting (live results sync interval: {sync_interval} min)...")
+    logger.info(f"ETL runner starting (adaptive live sync, fallback interval: {sync_interval} min)...")
 
     scheduler = BlockingScheduler(timezone='America/New_York')
 
@@ -107,17 +200,40 @@ if __name__ == "__main__":
         replace_existing=True
     )
 
-    # Job 3: Sync live results every N minutes
+    # Job 3: Sync live results now; each run schedules the next one adaptively
     scheduler.add_job(
         _sync_results_job,
-        'interval',
-        minutes=sync_interval,
+        'date',
+        args=[scheduler, sync_interval],
         id='sync_results',
         replace_existing=True
     )
 
-    logger.info("ETL scheduler started with 3 jobs")
+    # Job 4: Delete expired sessions (shares a lease with the web workers' job)
+    scheduler.add_job(
+        purge_sessions_job,
+        'interval',
+        minutes=SESSION_PURGE_INTERVAL_MINUTES,
+        args=[db_module],
+        id='purge_sessions',
+        replace_existing=True
+    )
+
+    # Keep the leases this process holds from expiring between runs
+    scheduler.add_job(
+        renew_leases,
+        'interval',
+        seconds=LEASE_HEARTBEAT_SECONDS,
+        args=[db_module],
+        id='lease_heartbeat',
+        replace_existing=True
+    )
+
+    logger.info("ETL scheduler started with 4 jobs")
     try:
         scheduler.start()
     except (KeyboardInterrupt, SystemExit):
         logger.info("ETL runner stopped")
+    finally:
+        release_leases(db_module)
+        close_http_clients()
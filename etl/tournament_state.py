@@ -2,6 +2,9 @@
 import logging
 from datetime import datetime, timedelta
 
+from etl.history import compact_history
+from etl.live_payload import parse_live_stats
+
 logger = logging.getLogger(__name__)
 
 
@@ -103,10 +106,63 @@ def activate_tournaments(db) -> int:
     return activated_count
 
 
+def tournament_is_complete(tournament, live) -> bool:
+    """True if the parsed live stats show every positioned player through round 4.
+
+    Args:
+        tournament: an active tournament row
+        live: LiveStats from etl.live_payload.parse_live_stats()
+    """
+    if not tournament.datagolf_name:
+        return False
+    if not _tournament_names_match(tournament.datagolf_name, live.event_name):
+        return False
+    if live.current_round != 4:
+        return False
+
+    active_count, finished_count = live.positioned_finished_count()
+    if active_count > 0 and finished_count == active_count:
+        logger.info(
+            f"Tournament {tournament.name}: "
+            f"{finished_count}/{active_count} players finished round 4"
+        )
+        return True
+
+    logger.debug(
+        f"Tournament {tournament.name}: {finished_count}/{active_count} "
+        "players finished (waiting for all to finish)"
+    )
+    return False
+
+
+def complete_tournament(db, tournament) -> bool:
+    """Mark a tournament completed, compact its history and send the final leaderboard.
+
+    The status change is conditional on the tournament still being active, so
+    when two paths detect completion at once only one sends the GroupMe message.
+    Returns True if this call completed it.
+    """
+    from sqlalchemy import text
+
+    with db.db.engine.begin() as conn:
+        result = conn.execute(
+            text("UPDATE tournament SET status = 'completed' WHERE id = :id AND status = 'active'"),
+            {"id": tournament.id}
+        )
+    if result.rowcount != 1:
+        return False
+
+    logger.info(f"Completing tournament: {tournament.name}")
+    compact_history(db, tournament.id)
+    send_final_leaderboard_groupme(db, tournament.id)
+    return True
+
+
 def complete_tournaments(db, datagolf_client, groupme_client=None) -> int:
     """Complete active tournaments when all players finish round 4.
 
-    Fetches live stats from DataGolf and checks if all active players have
+    Fallback for the completion stage of the live sync (etl/pipeline.py):
+    fetches live stats from DataGolf and checks if all active players have
     finished round 4 (thru == 18 or 'F'). On completion, sends the final
     leaderboard to GroupMe.
 
@@ -118,47 +174,15 @@ def complete_tournaments(db, datagolf_client, groupme_client=None) -> int:
     logger.info("Running complete_tournaments...")
     completed_count = 0
 
-    live_data = datagolf_client.get_live_stats()
-    live_stats = live_data.get('live_stats', [])
-    current_event_name = live_data.get('event_name', '')
-    current_round = live_data.get('current_round')
-
-    logger.info(f"DataGolf event: {current_event_name}, round: {current_round}")
+    live = parse_live_stats(datagolf_client.get_live_stats())
+    logger.info(f"DataGolf event: {live.event_name}, round: {live.current_round}")
 
     for tournament in db.tournaments():
-        if tournament.status != 'active' or not tournament.datagolf_name:
-            continue
-
-        if not _tournament_names_match(tournament.datagolf_name, current_event_name):
-            continue
-
-        if current_round != 4:
+        if tournament.status != 'active':
             continue
 
-        active_players = []
-        for player in live_stats:
-            pos = player.get('position', '')
-            clean_pos = pos.replace('T', '').strip() if pos else ''
-            if clean_pos and clean_pos.isdigit():
-                active_players.append(player)
-        finished_players = [
-            p for p in active_players
-            if p.get('thru') in [18, 'F', '18']
-        ]
-
-        if len(active_players) > 0 and len(finished_players) == len(active_players):
-            logger.info(
-                f"Completing tournament: {tournament.name} "
-                f"({len(finished_players)}/{len(active_players)} players finished round 4)"
-            )
-            db.tournaments.update(id=tournament.id, status='completed')
-            send_final_leaderboard_groupme(db, tournament.id)
+        if tournament_is_complete(tournament, live) and complete_tournament(db, tournament):
             completed_count += 1
-        else:
-            logger.debug(
-                f"Tournament {tournament.name}: {len(finished_players)}/{len(active_players)} "
-                "players finished (waiting for all to finish)"
-            )
 
     logger.info(f"complete_tournaments done - completed {completed_count} tournaments")
     return completed_count
@@ -0,0 +1,21 @@
+"""APScheduler job wrapper for the notification outbox dispatcher.
+
+The dispatching logic lives in services/notifications.py; like the tournament
+jobs, only the process holding the lease runs it.
+"""
+import logging
+
+from services.leader import acquire_lease
+
+logger = logging.getLogger(__name__)
+
+
+def dispatch_notifications_job(db_module):
+    """Send queued GroupMe notifications that are due."""
+    if not acquire_lease(db_module, 'dispatch_notifications'):
+        return
+    from services.notifications import dispatch_notifications
+    try:
+        dispatch_notifications(db_module)
+    except Exception as e:
+        logger.error(f"Error in dispatch_notifications job: {e}", exc_info=True)
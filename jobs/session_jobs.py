@@ -0,0 +1,23 @@
+"""APScheduler job wrapper for purging expired sessions.
+
+The purge itself lives in services/auth.py; like the other jobs, only the
+process holding the lease runs it.
+"""
+import logging
+
+from services.leader import acquire_lease
+
+logger = logging.getLogger(__name__)
+
+
+def purge_sessions_job(db_module):
+    """Delete expired rows from the session table."""
+    if not acquire_lease(db_module, 'purge_sessions'):
+        logger.debug("Skipping purge_sessions job - another process holds the lease")
+        return
+    from services.auth import purge_expired_sessions
+    try:
+        count = purge_expired_sessions(db_module)
+        logger.info(f"Finished purge_sessions job - deleted {count} expired sessions")
+    except Exception as e:
+        logger.error(f"Error in purge_sessions job: {e}", exc_info=True)
@@ -3,14 +3,23 @@
 Each function is a thin wrapper around the corresponding ETL function in
 etl/tournament_state.py. The actual business logic lives there; this module
 exists solely to give app.py named callables to register with APScheduler.
+
+Every web worker (and the ETL runner) schedules these jobs, so each one first
+takes its lease from services/leader.py and skips the run if another process
+holds it.
 """
 import logging
 
+from services.leader import acquire_lease
+
 logger = logging.getLogger(__name__)
 
 
 def activate_tournaments_job(db_module):
     """Activate upcoming tournaments on Tuesday of tournament week."""
+    if not acquire_lease(db_module, 'activate_tournaments'):
+        logger.debug("Skipping activate_tournaments job - another process holds the lease")
+        return
     logger.info("Running activate_tournaments job...")
     from etl.tournament_state import activate_tournaments
     try:
@@ -22,6 +31,9 @@ def activate_tournaments_job(db_module):
 
 def lock_picks_job(db_module):
     """Lock picks when tournament starts. Currently disabled in production."""
+    if not acquire_lease(db_module, 'lock_picks'):
+        logger.debug("Skipping lock_picks job - another process holds the lease")
+        return
     logger.info("Running lock_picks job...")
     from etl.tournament_state import lock_picks
     try:
@@ -33,6 +45,9 @@ def lock_picks_job(db_module):
 
 def complete_tournaments_job(db_module):
     """Complete finished tournaments when all players finish round 4."""
+    if not acquire_lease(db_module, 'complete_tournaments'):
+        logger.debug("Skipping complete_tournaments job - another process holds the lease")
+        return
     logger.info("Running complete_tournaments job...")
     from services.datagolf import DataGolfClient
     from etl.tournament_state import complete_tournaments
@@ -0,0 +1,13 @@
+-- Migration: Add session revocation (PostgreSQL)
+-- Date: 2026-10-19
+-- Signed session cookies (SESSION_MODE=signed) are validated without a DB
+-- lookup; logging out or deleting a user marks the session revoked instead.
+-- The app adds this column itself on startup (db/models.py ADDED_COLUMNS);
+-- run this only to add it ahead of a deploy.
+--
+-- For Render/Supabase:
+-- psql -U postgres -h {host} -d {database} < migrations/003_add_session_revoked_at.postgresql.sql
+-- Or use Supabase SQL editor
+
+ALTER TABLE "session"
+ADD COLUMN IF NOT EXISTS revoked_at TEXT;
@@ -0,0 +1,11 @@
+-- Migration: Add session revocation
+-- Date: 2026-10-19
+-- Signed session cookies (SESSION_MODE=signed) are validated without a DB
+-- lookup; logging out or deleting a user marks the session revoked instead.
+-- The app adds this column itself on startup (db/models.py ADDED_COLUMNS);
+-- run this only to add it ahead of a deploy.
+
+-- SQLite
+-- To run: sqlite3 data/golf_pickem.db < migrations/003_add_session_revoked_at.sql
+
+ALTER TABLE "session" ADD COLUMN [revoked_at] TEXT;
@@ -0,0 +1,12 @@
+-- Migration: Add tournament standings version (PostgreSQL)
+-- Date: 2026-10-19
+-- Bumped whenever standings are recalculated; the leaderboard caches its
+-- rendered tables by it. The app adds this column itself on startup
+-- (db/models.py ADDED_COLUMNS); run this only to add it ahead of a deploy.
+--
+-- For Render/Supabase:
+-- psql -U postgres -h {host} -d {database} < migrations/004_add_tournament_standings_version.postgresql.sql
+-- Or use Supabase SQL editor
+
+ALTER TABLE "tournament"
+ADD COLUMN IF NOT EXISTS standings_version INTEGER;
@@ -0,0 +1,10 @@
+-- Migration: Add tournament standings version
+-- Date: 2026-10-19
+-- Bumped whenever standings are recalculated; the leaderboard caches its
+-- rendered tables by it. The app adds this column itself on startup
+-- (db/models.py ADDED_COLUMNS); run this only to add it ahead of a deploy.
+
+-- SQLite
+-- To run: sqlite3 data/golf_pickem.db < migrations/004_add_tournament_standings_version.sql
+
+ALTER TABLE "tournament" ADD COLUMN [standings_version] INTEGER;
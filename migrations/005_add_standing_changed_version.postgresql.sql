@@ -0,0 +1,13 @@
+-- Migration: Track which standings rows changed in which version (PostgreSQL)
+-- Date: 2026-10-19
+-- Live leaderboard updates send only the rows whose display changed since a
+-- client's version. The app adds these columns itself on startup
+-- (db/models.py ADDED_COLUMNS); run this only to add them ahead of a deploy.
+--
+-- For Render/Supabase:
+-- psql -U postgres -h {host} -d {database} < migrations/005_add_standing_changed_version.postgresql.sql
+-- Or use Supabase SQL editor
+
+ALTER TABLE "pickem_standing"
+ADD COLUMN IF NOT EXISTS changed_version INTEGER,
+ADD COLUMN IF NOT EXISTS row_hash TEXT;
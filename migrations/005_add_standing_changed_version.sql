@@ -0,0 +1,11 @@
+-- Migration: Track which standings rows changed in which version
+-- Date: 2026-10-19
+-- Live leaderboard updates send only the rows whose display changed since a
+-- client's version. The app adds these columns itself on startup
+-- (db/models.py ADDED_COLUMNS); run this only to add them ahead of a deploy.
+
+-- SQLite
+-- To run: sqlite3 data/golf_pickem.db < migrations/005_add_standing_changed_version.sql
+
+ALTER TABLE "pickem_standing" ADD COLUMN [changed_version] INTEGER;
+ALTER TABLE "pickem_standing" ADD COLUMN [row_hash] TEXT;
@@ -0,0 +1,13 @@
+-- Migration: Record the event round on score history rows (PostgreSQL)
+-- Date: 2026-10-19
+-- tournament_result_history.round_num holds DataGolf's current-round score, so
+-- history is compacted per golfer per current_round instead. The app adds this
+-- column itself on startup (db/models.py ADDED_COLUMNS); run this only to add
+-- it ahead of a deploy.
+--
+-- For Render/Supabase:
+-- psql -U postgres -h {host} -d {database} < migrations/006_add_result_history_current_round.postgresql.sql
+-- Or use Supabase SQL editor
+
+ALTER TABLE "tournament_result_history"
+ADD COLUMN IF NOT EXISTS current_round INTEGER;
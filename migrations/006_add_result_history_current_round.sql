@@ -0,0 +1,11 @@
+-- Migration: Record the event round on score history rows
+-- Date: 2026-10-19
+-- tournament_result_history.round_num holds DataGolf's current-round score, so
+-- history is compacted per golfer per current_round instead. The app adds this
+-- column itself on startup (db/models.py ADDED_COLUMNS); run this only to add
+-- it ahead of a deploy.
+
+-- SQLite
+-- To run: sqlite3 data/golf_pickem.db < migrations/006_add_result_history_current_round.sql
+
+ALTER TABLE "tournament_result_history" ADD COLUMN [current_round] INTEGER;
@@ -12,11 +12,9 @@ logger = logging.getLogger(__name__)
 
 
 def _get_groupme_bot_id(db_module) -> str:
-    """Get GroupMe bot ID from app_settings."""
-    for setting in db_module.app_settings():
-        if setting.key == 'groupme_bot_id':
-            return setting.value
-    return None
+    """Get GroupMe bot ID from app_settings (cached)."""
+    from services.settings import settings_service
+    return settings_service.groupme_bot_id(db_module)
 
 
 def _mask_bot_id(bot_id: str) -> str:
@@ -139,6 +137,7 @@ def setup_admin_routes(app):
             "Admin",
             Div(
                 H1("Admin Dashboard"),
+                A("Metrics", href="/admin/metrics", cls="btn btn-sm btn-secondary"),
                 *messages,
 
                 card(
@@ -335,14 +334,16 @@ def setup_admin_routes(app):
             for standing in standings_to_delete:
                 db.pickem_standings.delete(standing.id)
 
-            # Delete sessions
-            sessions_to_delete = [s for s in db.sessions() if s.user_id == user_id]
-            for session in sessions_to_delete:
-                db.sessions.delete(session.id)
+            # End their sessions
+            get_auth_service().revoke_user_sessions(user_id)
 
             # Finally delete the user
             db.users.delete(user_id)
 
+            # Their entries disappear from every leaderboard
+            from services.scoring import bump_standings_version
+            bump_standings_version(db)
+
             logger.info(f"Admin {user.groupme_name} deleted user {user_to_delete.groupme_name} (id={user_id})")
             return RedirectResponse("/admin?success=User deleted successfully", status_code=303)
 
@@ -434,6 +435,8 @@ def setup_admin_routes(app):
                 if t.status != 'completed':
                     db.tournaments.update(id=t.id, status='completed')
                     logger.info(f"Admin {user.groupme_name} marked {t.name} as completed")
+                    from etl.history import compact_history
+                    compact_history(db, tournament_id)
                     # Auto-send final leaderboard to GroupMe
                     _send_final_leaderboard_groupme(db, tournament_id)
                 break
@@ -509,17 +512,16 @@ def setup_admin_routes(app):
             return RedirectResponse("/", status_code=303)
 
         from services.datagolf import DataGolfClient
-        from etl.golfers import sync_golfers
-        from etl.tournaments import sync_tournaments
+        from etl.reference import sync_reference_data
 
         client = DataGolfClient()
 
         try:
-            golfer_result = sync_golfers(db_module, client)
-            tournament_result = sync_tournaments(db_module, client)
+            result = sync_reference_data(db_module, client)
             logger.info(
-                f"Sync complete: {golfer_result['golfer_count']} players, "
-                f"{tournament_result['tournament_count']} tournaments"
+                f"Sync complete: {result['golfer_count']} players "
+                f"({result['inserted']} new, {result['updated']} updated), "
+                f"{result['tournament_count']} tournaments"
             )
         except Exception as e:
             logger.error(f"Sync error: {e}", exc_info=True)
@@ -646,8 +648,9 @@ def setup_admin_routes(app):
             # Check if tournament matches
             is_match = tournament.datagolf_name and tournament.datagolf_name == dg_event_name
             
-            # Get golfers from DB to see which are missing
-            golfers_by_dg_id = {g.datagolf_id: g for g in db_module.golfers()}
+            # Resolve field golfers to see which are missing
+            from etl.resolver import golfer_resolver
+            golfers_by_dg_id = golfer_resolver.resolve_many(db_module, (p.get('dg_id') for p in field_players))
             
             matched = []
             missing = []
@@ -914,14 +917,8 @@ def setup_admin_routes(app):
 
         if bot_id and bot_id.strip():
             bot_id = bot_id.strip()
-            # Find existing setting or create new one
-            settings = list(db.app_settings())
-            existing = [s for s in settings if s.key == 'groupme_bot_id']
-
-            if existing:
-                db.app_settings.update(id=existing[0].id, value=bot_id)
-            else:
-                db.app_settings.insert(key='groupme_bot_id', value=bot_id)
+            from services.settings import settings_service
+            settings_service.set(db, 'groupme_bot_id', bot_id)
 
             logger.info(f"Updated GroupMe bot_id (length: {len(bot_id)})")
             return RedirectResponse("/admin?success=GroupMe bot ID saved", status_code=303)
@@ -958,6 +955,84 @@ def setup_admin_routes(app):
             return RedirectResponse("/admin?error=Error sending test message", status_code=303)
 
 
+    @app.get("/admin/metrics")
+    def admin_metrics(request):
+        """Operational metrics: outbound API latency and errors per host, scheduler leases, leaderboard cache."""
+        db = get_db()
+        user = get_current_user(request)
+        if not user or not user.is_admin:
+            return RedirectResponse("/", status_code=303)
+
+        from services.http import get_http_metrics
+        from services.leader import HOLDER_ID, get_leases
+        from services.fragment_cache import leaderboard_fragments
+        from services.live_updates import live_hub
+
+        http_metrics = get_http_metrics()
+        leases = get_leases(db)
+        fragments = leaderboard_fragments.stats()
+
+        def lease_state(lease):
+            if lease['expired']:
+                return "expired"
+            return "held (this process)" if lease['mine'] else "held"
+
+        return page_shell(
+            "Metrics",
+            Div(
+                H1("Metrics"),
+                card(
+                    "Outbound HTTP",
+                    Table(
+                        Thead(Tr(Th("Host"), Th("Requests"), Th("Errors"), Th("Avg ms"), Th("Max ms"), Th("Last Error"))),
+                        Tbody(*[Tr(
+                            Td(host),
+                            Td(str(m['requests'])),
+                            Td(str(m['errors'])),
+                            Td(f"{m['avg_ms']:.0f}"),
+                            Td(f"{m['max_ms']:.0f}"),
+                            Td(m['last_error'] or "-"),
+                        ) for host, m in sorted(http_metrics.items())]),
+                        cls="admin-table"
+                    ) if http_metrics else P("No outbound requests since this process started."),
+                ),
+                card(
+                    "Scheduler Leases",
+                    P(f"This process: {HOLDER_ID}"),
+                    Table(
+                        Thead(Tr(Th("Job"), Th("Holder"), Th("State"), Th("Acquired"), Th("Heartbeat"), Th("Expires"))),
+                        Tbody(*[Tr(
+                            Td(lease['name']),
+                            Td(lease['holder'] or "-"),
+                            Td(lease_state(lease)),
+                            Td(lease['acquired_at'] or "-"),
+                            Td(lease['heartbeat_at'] or "-"),
+                            Td(lease['expires_at'] or "-"),
+                        ) for lease in leases]),
+                        cls="admin-table"
+                    ) if leases else P("No scheduled job has run yet."),
+                ),
+                card(
+                    "Leaderboard Cache",
+                    Table(
+                        Thead(Tr(Th("Cached Tables"), Th("Hits"), Th("Misses"), Th("Hit Rate"), Th("Live Viewers"))),
+                        Tbody(Tr(
+                            Td(str(fragments['entries'])),
+                            Td(str(fragments['hits'])),
+                            Td(str(fragments['misses'])),
+                            Td(f"{fragments['hit_rate']:.0%}"),
+                            # Open streams on this worker only
+                            Td(str(live_hub.subscriber_count())),
+                        )),
+                        cls="admin-table"
+                    ),
+                ),
+                A("← Back to Admin", href="/admin", cls="btn btn-secondary"),
+                cls="admin-page"
+            ),
+            user=user
+        )
+
     @app.get("/admin/picks-debug")
     def picks_debug(request, tournament_id: int = None):
         """Diagnostic: show pick golfer IDs vs tournament_result scores to find mismatches."""
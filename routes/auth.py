@@ -1,6 +1,7 @@
 """Authentication routes."""
 from fasthtml.common import *
 from components.layout import page_shell, alert, card
+from routes.utils import get_current_user
 
 
 def setup_auth_routes(app, auth_service):
@@ -8,7 +9,7 @@ def setup_auth_routes(app, auth_service):
 
     @app.get("/login")
     def login_page(request, error: str = None):
-        user = auth_service.get_user_from_token(request.cookies.get('session'))
+        user = get_current_user(request)
         if user:
             return RedirectResponse("/", status_code=303)
 
@@ -56,7 +57,7 @@ def setup_auth_routes(app, auth_service):
 
     @app.get("/register")
     def register_page(request, invite: str = None, error: str = None):
-        user = auth_service.get_user_from_token(request.cookies.get('session'))
+        user = get_current_user(request)
         if user:
             return RedirectResponse("/", status_code=303)
 
@@ -2,7 +2,7 @@
 from fasthtml.common import *
 
 from components.layout import page_shell, card
-from routes.utils import get_current_user, get_db
+from routes.utils import get_current_user, get_db, get_auth_service
 
 
 def setup_home_routes(app):
@@ -62,10 +62,6 @@ def setup_home_routes(app):
             user=user
         )
 
-    @rt("/static/{fname:path}")
-    def static_file(fname: str):
-        return FileResponse(f"static/{fname}")
-
     @rt("/about")
     def about_page(request):
         """About page describing the app and features."""
@@ -203,11 +199,16 @@ def setup_home_routes(app):
                 return RedirectResponse("/profile?error=GroupMe name not found in group. Please check spelling.", status_code=303)
 
         # Update user's groupme_name (and also update display_name for backwards compatibility)
-        db.user.update(
+        db.users.update(
             id=user.id,
             groupme_name=groupme_name,
             display_name=groupme_name
         )
+        get_auth_service().invalidate_user(user.id)
+
+        # The new name shows on every leaderboard (and is pushed to open ones)
+        from services.scoring import bump_standings_version
+        bump_standings_version(db, user_id=user.id)
 
         return RedirectResponse("/profile?success=Profile updated successfully", status_code=303)
 
@@ -1,13 +1,19 @@
 """Leaderboard routes."""
+import asyncio
 import logging
 from datetime import datetime
 import time
 
 from fasthtml.common import *
-from starlette.responses import RedirectResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import HTMLResponse, RedirectResponse, Response, StreamingResponse
 
 from components.layout import page_shell, card
-from routes.utils import get_current_user, get_db, format_score
+from config import LEADERBOARD_PAGE_SIZE, LIVE_HEARTBEAT_SECONDS, LIVE_RETRY_MS, LIVE_ROWS_POLL_SECONDS
+from routes.utils import get_current_user, get_db, format_score, page_etag, not_modified, etag_headers
+from services.assets import asset_url
+from services.fragment_cache import leaderboard_fragments
+from services.scoring import supports_row_versions
 
 logger = logging.getLogger(__name__)
 
@@ -39,27 +45,43 @@ def _tournament_names_match(db_name: str, api_name: str) -> bool:
     return False
 
 
-def _build_tournament_leaderboard(db, tournament, results, golfers_by_id):
-    """Build the tournament leaderboard showing actual golfer results."""
-    
-    # Sort results by position (None positions go to bottom)
-    sorted_results = sorted(
-        results.values(),
-        key=lambda r: (
-            r.position is None,  # None positions at bottom
-            r.position if r.position is not None else 999,
-            r.score_to_par if r.score_to_par is not None else 999
+# Golfer results in leaderboard order: by position (None positions at the bottom), then score
+_RESULTS_SELECT = """
+    SELECT r.id, r.golfer_id, r.position, r.score_to_par, r.status, r.thru, g.name AS golfer_name,
+           CASE WHEN r.position IS NULL THEN 1 ELSE 0 END AS no_position,
+           COALESCE(r.position, 999) AS sort_position, COALESCE(r.score_to_par, 999) AS sort_score
+    FROM tournament_result r
+    LEFT JOIN golfer g ON g.id = r.golfer_id
+    WHERE r.tournament_id = :tid
+"""
+_RESULTS_ORDER = (
+    "CASE WHEN r.position IS NULL THEN 1 ELSE 0 END", "COALESCE(r.position, 999)",
+    "COALESCE(r.score_to_par, 999)", "r.id",
+)
+
+
+def _result_cursor(result) -> tuple:
+    return (result.no_position, result.sort_position, result.sort_score, result.id)
+
+
+def _build_tournament_leaderboard(db, tournament, after=None, before=None):
+    """Build one page of the tournament leaderboard showing actual golfer results."""
+    from sqlalchemy import text
+
+    with db.db.engine.connect() as conn:
+        total = conn.execute(
+            text("SELECT COUNT(*) FROM tournament_result WHERE tournament_id = :tid"), {"tid": tournament.id}
+        ).scalar()
+        page_results, prev_cursor, next_cursor = _page(
+            conn, _RESULTS_SELECT, _RESULTS_ORDER, {"tid": tournament.id}, _result_cursor,
+            after=after, before=before
         )
-    )
-    
-    logger.info(f"Building tournament leaderboard with {len(sorted_results)} results")
-    
-    if not sorted_results:
+
+    if not total:
         return P("No tournament results yet. Results will appear once the tournament starts.")
     
     def golfer_row(result):
-        golfer = golfers_by_id.get(result.golfer_id)
-        name = golfer.name if golfer else "Unknown"
+        name = result.golfer_name or "Unknown"
         
         # Position display
         if result.position:
@@ -110,56 +132,10 @@ def _build_tournament_leaderboard(db, tournament, results, golfers_by_id):
             Td(thru_display),
         )
     
-    # Build mobile cards too
-    def golfer_card(result):
-        golfer = golfers_by_id.get(result.golfer_id)
-        name = golfer.name if golfer else "Unknown"
-        
-        if result.position:
-            pos_display = f"T{result.position}" if result.position else str(result.position)
-        elif result.status == 'cut':
-            pos_display = "MC"
-        elif result.status == 'wd':
-            pos_display = "WD"
-        elif result.status == 'dq':
-            pos_display = "DQ"
-        else:
-            pos_display = "-"
-        
-        if result.score_to_par is not None:
-            if result.score_to_par == 0:
-                score_display = "E"
-            elif result.score_to_par > 0:
-                score_display = f"+{result.score_to_par}"
-            else:
-                score_display = str(result.score_to_par)
-        else:
-            score_display = "-"
-        
-        thru_display = "F" if result.thru == 18 else (str(result.thru) if result.thru else "-")
-        
-        score_cls = ""
-        if result.score_to_par is not None:
-            if result.score_to_par < 0:
-                score_cls = "under-par"
-            elif result.score_to_par > 0:
-                score_cls = "over-par"
-        if result.status in ('cut', 'wd', 'dq'):
-            score_cls = "missed-cut"
-        
-        return Div(
-            Span(pos_display, cls="card-rank"),
-            Span(name, cls="card-player"),
-            Span(score_display, cls=f"card-score {score_cls}"),
-            Span(thru_display, cls="card-thru"),
-            cls="tournament-card"
-        )
-    
-    desktop_rows = [golfer_row(r) for r in sorted_results[:50]]  # Top 50
-    mobile_cards = [golfer_card(r) for r in sorted_results[:50]]
-    
+    desktop_rows = [golfer_row(r) for r in page_results]
+
     return Div(
-        P(f"Showing top {min(50, len(sorted_results))} of {len(sorted_results)} golfers", cls="tournament-count"),
+        P(f"Showing {len(page_results)} of {total} golfers", cls="tournament-count"),
         # Desktop table - use same class as pick'em leaderboard
         Table(
             Thead(
@@ -170,14 +146,337 @@ def _build_tournament_leaderboard(db, tournament, results, golfers_by_id):
             Tbody(*desktop_rows),
             cls="leaderboard-table"
         ),
+        _pager(tournament, "tournament", prev_cursor, next_cursor),
+    )
+
+
+# Pick'em entries in persisted standings order (rank, then user and entry for a
+# stable order within ties). Entries without a standing yet sort last.
+_PICKEM_SELECT = """
+    SELECT p.user_id, COALESCE(p.entry_number, 1) AS entry_number,
+           p.tier1_golfer_id, p.tier2_golfer_id, p.tier3_golfer_id, p.tier4_golfer_id,
+           u.groupme_name, u.username,
+           s.tier1_position, s.tier2_position, s.tier3_position, s.tier4_position,
+           s.best_two_total, s.rank, COALESCE(s.rank, 999999) AS sort_rank
+    FROM pick p
+    LEFT JOIN "user" u ON u.id = p.user_id
+    LEFT JOIN pickem_standing s
+        ON s.tournament_id = p.tournament_id AND s.user_id = p.user_id
+        AND s.entry_number = COALESCE(p.entry_number, 1)
+    WHERE p.tournament_id = :tid
+"""
+_PICKEM_ORDER = ("COALESCE(s.rank, 999999)", "p.user_id", "COALESCE(p.entry_number, 1)")
+
+
+def _pickem_cursor(entry) -> tuple:
+    return (entry.sort_rank, entry.user_id, entry.entry_number)
+
+
+def _name_filter(search: str):
+    """SQL condition and params for entries whose player name contains search."""
+    escaped = search.strip().lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return (
+        " AND LOWER(COALESCE(NULLIF(u.groupme_name, ''), u.username)) LIKE :q ESCAPE '\\'",
+        {"q": f"%{escaped}%"}
+    )
+
+
+def _pickem_rows(db, tournament, entries):
+    """Table rows for pick'em entries (same for every viewer; rows carry data-user)."""
+    from sqlalchemy import text
+
+    if not entries:
+        return []
+
+    golfer_ids = sorted({
+        g for e in entries
+        for g in (e.tier1_golfer_id, e.tier2_golfer_id, e.tier3_golfer_id, e.tier4_golfer_id) if g
+    })
+    user_ids = sorted({e.user_id for e in entries})
+    golfer_params = {f"g_{i}": g for i, g in enumerate(golfer_ids)}
+    user_params = {f"u_{i}": u for i, u in enumerate(user_ids)}
+
+    with db.db.engine.connect() as conn:
+        golfer_names = dict(conn.execute(
+            text(f"SELECT id, name FROM golfer WHERE id IN ({', '.join(':' + k for k in golfer_params)})"),
+            golfer_params
+        ).fetchall()) if golfer_ids else {}
+        # Count entries per user to know when to show entry numbers
+        entries_per_user = dict(conn.execute(
+            text(f"SELECT user_id, COUNT(*) FROM pick WHERE tournament_id = :tid "
+                 f"AND user_id IN ({', '.join(':' + k for k in user_params)}) GROUP BY user_id"),
+            {"tid": tournament.id, **user_params}
+        ).fetchall())
+        # Get results for thru info
+        results = {
+            r.golfer_id: r for r in conn.execute(
+                text("SELECT golfer_id, status, thru FROM tournament_result WHERE tournament_id = :tid"),
+                {"tid": tournament.id}
+            ).fetchall()
+        }
+
+    def get_golfer_name(golfer_id):
+        return golfer_names.get(golfer_id, "-")
+
+    # Check if tournament has any results (has it started?)
+    has_results = len(results) > 0
+
+    def pick_row(entry):
+        entry_number = entry.entry_number
+
+        # Show entry number if user has multiple entries
+        display_name = (entry.groupme_name or entry.username) if entry.username else "Unknown"
+        if entries_per_user.get(entry.user_id, 1) > 1:
+            display_name = f"{display_name} ({entry_number})"
+
+        def cell(golfer_id, score):
+            name = get_golfer_name(golfer_id)
+            result = results.get(golfer_id)
+
+            # Determine display based on score and tournament state
+            if score is None:
+                if not has_results:
+                    # Tournament hasn't started yet
+                    score_display = "-"
+                    cls = "golfer-cell not-started"
+                elif result and result.status in ('cut', 'mc'):
+                    # Actually missed the cut
+                    score_display = "MC"
+                    cls = "golfer-cell missed-cut"
+                elif result and result.status == 'wd':
+                    score_display = "WD"
+                    cls = "golfer-cell withdrawn"
+                elif result and result.status == 'dq':
+                    score_display = "DQ"
+                    cls = "golfer-cell disqualified"
+                elif result is None:
+                    # No result for this golfer - hasn't teed off or not in field
+                    score_display = "-"
+                    cls = "golfer-cell not-started"
+                else:
+                    # Has result but no score - still playing
+                    score_display = "E"
+                    cls = "golfer-cell"
+            else:
+                score_display = format_score(score)
+                cls = "golfer-cell"
+                if score < 0:
+                    cls += " under-par"
+                elif score > 0:
+                    cls += " over-par"
+
+            # Add thru info if available and tournament is active
+            thru_info = ""
+            if result and result.thru and tournament.status == 'active':
+                if result.thru == 18:
+                    thru_info = " (F)"
+                else:
+                    thru_info = f" ({result.thru})"
+
+            return Td(
+                Div(
+                    Span(name, cls="golfer-name-lb"),
+                    Span(f"{score_display}{thru_info}", cls="golfer-score"),
+                    cls="golfer-cell-content"
+                ),
+                cls=cls
+            )
+
+        # Get scores from standing (stored in tier*_position columns; None without a standing)
+        t1_score = entry.tier1_position
+        t2_score = entry.tier2_position
+        t3_score = entry.tier3_position
+        t4_score = entry.tier4_position
+
+        total = entry.best_two_total
+        if not has_results:
+            # Tournament hasn't started
+            total_display = "-"
+        elif total is None:
+            # Has results but DQ (less than 2 valid scores)
+            total_display = "DQ"
+        else:
+            total_display = format_score(total)
+
+        # Persisted rank; DQ entries (and entries not yet scored) show no rank
+        rank_display = str(entry.rank) if total is not None else "-"
+
+        # Table row
+        return Tr(
+            Td(rank_display, cls="rank"),
+            Td(display_name, cls="player-name"),
+            cell(entry.tier1_golfer_id, t1_score),
+            cell(entry.tier2_golfer_id, t2_score),
+            cell(entry.tier3_golfer_id, t3_score),
+            cell(entry.tier4_golfer_id, t4_score),
+            Td(total_display, cls="total"),
+            # Cached for all viewers; the viewer's rows are highlighted after
+            data_user=str(entry.user_id),
+            # Live updates replace rows by entry and re-sort them by rank
+            data_entry=f"{entry.user_id}-{entry_number}",
+            data_rank=str(entry.sort_rank)
+        )
+
+    return [pick_row(entry) for entry in entries]
+
+
+def _encode_cursor(values) -> str:
+    return ".".join(str(v) for v in values)
+
+
+def _parse_cursor(value, size: int):
+    """Cursor tuple from a query string value, or None if missing or malformed."""
+    if not value:
+        return None
+    try:
+        values = tuple(int(v) for v in value.split("."))
+    except ValueError:
+        return None
+    return values if len(values) == size else None
+
+
+def _seek(conn, sql: str, order, params: dict, cursor=None, op: str = ">", limit: int = LEADERBOARD_PAGE_SIZE):
+    """Up to limit rows after (>, >=) or before (<) a cursor in `order`, and whether more lie that way.
+
+    Seeks on the order columns instead of using OFFSET, so any page costs the same.
+    """
+    from sqlalchemy import text
+
+    descending = op.startswith("<")
+    if cursor is not None:
+        placeholders = ", ".join(f":c_{i}" for i in range(len(order)))
+        sql += f" AND ({', '.join(order)}) {op} ({placeholders})"
+        params = {**params, **{f"c_{i}": value for i, value in enumerate(cursor)}}
+    sql += " ORDER BY " + ", ".join(f"{col} {'DESC' if descending else 'ASC'}" for col in order) + " LIMIT :limit"
+
+    rows = conn.execute(text(sql), {**params, "limit": limit + 1}).fetchall()
+    more = len(rows) > limit
+    rows = rows[:limit]
+    return (rows[::-1] if descending else rows), more
+
+
+def _page(conn, sql: str, order, params: dict, key, after=None, before=None, around=None,
+          limit: int = LEADERBOARD_PAGE_SIZE):
+    """One page of rows plus (previous, next) cursors; `around` centres the page on a row."""
+    if around is not None:
+        above, has_prev = _seek(conn, sql, order, params, around, "<", limit // 2)
+        below, has_next = _seek(conn, sql, order, params, around, ">=", limit - len(above))
+        rows = above + below
+    elif before is not None:
+        rows, has_prev = _seek(conn, sql, order, params, before, "<", limit)
+        has_next = True
+    else:
+        rows, has_next = _seek(conn, sql, order, params, after, ">", limit)
+        has_prev = after is not None
+    prev_cursor = key(rows[0]) if rows and has_prev else None
+    next_cursor = key(rows[-1]) if rows and has_next else None
+    return rows, prev_cursor, next_cursor
+
+
+def _pager(tournament, view: str, prev_cursor, next_cursor, search: str = None):
+    """Previous/Next links for a cursor-paginated leaderboard."""
+    from urllib.parse import quote
+
+    base = f"/leaderboard?tournament_id={tournament.id}&view={view}" + (f"&q={quote(search)}" if search else "")
+    links = []
+    if prev_cursor:
+        links.append(A("← Previous", href=f"{base}&before={_encode_cursor(prev_cursor)}", cls="btn btn-sm btn-secondary"))
+    if next_cursor:
+        links.append(A("Next →", href=f"{base}&after={_encode_cursor(next_cursor)}", cls="btn btn-sm btn-secondary"))
+    return Div(*links, cls="leaderboard-pager")
+
+
+def _my_entry_cursor(db, tournament, user_id: int):
+    """Cursor of a user's best-placed entry, or None if they have no entry."""
+    with db.db.engine.connect() as conn:
+        rows, _ = _seek(conn, _PICKEM_SELECT + " AND p.user_id = :uid", _PICKEM_ORDER,
+                        {"tid": tournament.id, "uid": user_id}, limit=1)
+    return _pickem_cursor(rows[0]) if rows else None
+
+
+def _build_pickem_table(db, tournament, after=None, before=None, around=None, search: str = None):
+    """Build one page of the pick'em standings table (same for every viewer)."""
+    from sqlalchemy import text
+
+    sql, params = _PICKEM_SELECT, {"tid": tournament.id}
+    condition = ""
+    if search:
+        condition, search_params = _name_filter(search)
+        sql, params = sql + condition, {**params, **search_params}
+
+    with db.db.engine.connect() as conn:
+        total = conn.execute(text("SELECT COUNT(*) FROM pick WHERE tournament_id = :tid"), {"tid": tournament.id}).scalar()
+        matching = conn.execute(
+            text('SELECT COUNT(*) FROM pick p LEFT JOIN "user" u ON u.id = p.user_id '
+                 'WHERE p.tournament_id = :tid' + condition),
+            params
+        ).scalar() if search else total
+        entries, prev_cursor, next_cursor = _page(
+            conn, sql, _PICKEM_ORDER, params, _pickem_cursor, after=after, before=before, around=around
+        )
+
+    if not entries:
+        return P(f'No players matching "{search}".' if search else "No entries on this page.")
+
+    count = (f"Showing {len(entries)} of {matching} matching entries" if search
+             else f"Showing {len(entries)} of {total} entries")
+    return Div(
+        P(count, cls="tournament-count"),
+        Table(
+            Thead(
+                Tr(
+                    Th("Rank"), Th("Player"),
+                    Th("Tier 1"), Th("Tier 2"), Th("Tier 3"), Th("Tier 4"),
+                    Th("Best 2", cls="total-header")
+                )
+            ),
+            Tbody(*_pickem_rows(db, tournament, entries)),
+            cls="leaderboard-table",
+            id="pickem-table",
+            data_tournament=str(tournament.id),
+            data_version=str(tournament.standings_version or ""),
+            data_total=str(total),
+            # Rank window of this page; live updates only place rows inside it
+            data_rank_min=str(entries[0].sort_rank) if prev_cursor else "",
+            data_rank_max=str(entries[-1].sort_rank) if next_cursor else ""
+        ),
+        _pager(tournament, "pickem", prev_cursor, next_cursor, search),
     )
 
 
+def render_changed_rows(db, tournament, since: int):
+    """HTML of the pick'em rows whose standing changed after version `since`.
+
+    Returns (html, total_entries); total_entries lets clients detect entries
+    they don't have (added or deleted picks) and reload instead.
+    """
+    from sqlalchemy import text
+
+    with db.db.engine.connect() as conn:
+        total = conn.execute(text("SELECT COUNT(*) FROM pick WHERE tournament_id = :tid"), {"tid": tournament.id}).scalar()
+        changed = conn.execute(
+            text(_PICKEM_SELECT + " AND s.changed_version > :since ORDER BY " + ", ".join(_PICKEM_ORDER)),
+            {"tid": tournament.id, "since": since}
+        ).fetchall()
+    rows = _pickem_rows(db, tournament, changed)
+    return "".join(to_xml(row) for row in rows), total
+
+
+def _cached_fragment(tournament, view: str, render, page=None) -> str:
+    """Rendered HTML for a leaderboard table page, cached by the tournament's standings version."""
+    version = tournament.standings_version
+    if version is None:
+        # Never bumped yet: nothing to key the cache on
+        return to_xml(render())
+    return leaderboard_fragments.get_or_render((tournament.id, view, version, tournament.status, page), render)
+
+
 def setup_leaderboard_routes(app):
     """Register leaderboard routes."""
 
     @app.get("/leaderboard")
-    def leaderboard_page(request, tournament_id: int = None, message: str = None, view: str = "pickem"):
+    def leaderboard_page(request, tournament_id: int = None, message: str = None, view: str = "pickem",
+                         after: str = None, before: str = None, q: str = None, jump: str = None):
         db = get_db()
         user = get_current_user(request)
         if not user:
@@ -232,87 +531,20 @@ def setup_leaderboard_routes(app):
             logger.info(f"Auto-syncing {tournament.name} (>10 min since last sync)")
             try:
                 from services.datagolf import DataGolfClient
-                from services.scoring import ScoringService
-                from sqlalchemy import text
+                from etl.pipeline import run_live_sync
                 
                 client = DataGolfClient()
-                scoring = ScoringService(db)
                 
                 live_data = client.get_live_stats()
                 api_event_name = live_data.get('event_name', '')
                 
                 # Only sync if tournament matches
                 if _tournament_names_match(tournament.name, api_event_name):
-                    live_stats = live_data.get('live_stats', [])
-                    golfers_by_dg_id = {g.datagolf_id: g for g in db.golfers()}
-                    
-                    now = datetime.now().isoformat()
-                    results_data = []
-                    
-                    for player in live_stats:
-                        dg_id = str(player.get('dg_id', ''))
-                        golfer = golfers_by_dg_id.get(dg_id)
-                        if not golfer:
-                            continue
-                        
-                        pos_str = player.get('position', '')
-                        position = None
-                        status = 'active'
-                        
-                        if pos_str:
-                            pos_clean = pos_str.replace('T', '').strip()
-                            if pos_clean.isdigit():
-                                position = int(pos_clean)
-                            elif pos_str.upper() in ('CUT', 'MC'):
-                                status = 'cut'
-                            elif pos_str.upper() in ('WD', 'W/D'):
-                                status = 'wd'
-                            elif pos_str.upper() == 'DQ':
-                                status = 'dq'
-                        
-                        results_data.append({
-                            'tournament_id': tournament.id,
-                            'golfer_id': golfer.id,
-                            'position': position,
-                            'score_to_par': player.get('total'),
-                            'status': status,
-                            'round_num': player.get('round'),
-                            'thru': player.get('thru'),
-                            'updated_at': now
-                        })
+                    result = run_live_sync(db, client, tournament, live_data=live_data)
+                    logger.info(f"Auto-sync complete: {result['result_count']} results")
                     
-                    if results_data:
-                        with db.db.engine.connect() as conn:
-                            conn.execute(text("DELETE FROM tournament_result WHERE tournament_id = :tid"), 
-                                        {"tid": tournament.id})
-                            
-                            values_list = []
-                            params = {}
-                            for i, r in enumerate(results_data):
-                                values_list.append(f"(:tid_{i}, :gid_{i}, :pos_{i}, :score_{i}, :status_{i}, :round_{i}, :thru_{i}, :updated_{i})")
-                                params[f"tid_{i}"] = r['tournament_id']
-                                params[f"gid_{i}"] = r['golfer_id']
-                                params[f"pos_{i}"] = r['position']
-                                params[f"score_{i}"] = r['score_to_par']
-                                params[f"status_{i}"] = r['status']
-                                params[f"round_{i}"] = r['round_num']
-                                params[f"thru_{i}"] = r['thru']
-                                params[f"updated_{i}"] = r['updated_at']
-                            
-                            sql = f"""
-                                INSERT INTO tournament_result 
-                                (tournament_id, golfer_id, position, score_to_par, status, round_num, thru, updated_at)
-                                VALUES {', '.join(values_list)}
-                            """
-                            conn.execute(text(sql), params)
-                            conn.commit()
-                        
-                        db.tournaments.update(id=tournament.id, last_synced_at=now)
-                        scoring.calculate_standings(tournament.id)
-                        logger.info(f"Auto-sync complete: {len(results_data)} results")
-                        
-                        # Reload tournament to get updated last_synced_at
-                        tournament = next((t for t in db.tournaments() if t.id == tournament.id), tournament)
+                    # Reload tournament to get updated last_synced_at and status
+                    tournament = next((t for t in db.tournaments() if t.id == tournament.id), tournament)
                 else:
                     # Tournament doesn't match - set a message to inform admins only
                     if user.is_admin:
@@ -323,6 +555,39 @@ def setup_leaderboard_routes(app):
 
         # Create alert for any messages (from URL or auto-sync)
         display_message = message or auto_sync_message
+
+        # Last sync info. It is relative ("5 minutes ago"), so it goes into the ETag below.
+        sync_text = None
+        if tournament.last_synced_at:
+            try:
+                last_sync = datetime.fromisoformat(tournament.last_synced_at.replace('Z', '+00:00'))
+                minutes_ago = int((datetime.now() - last_sync).total_seconds() / 60)
+                if minutes_ago < 1:
+                    sync_text = "Updated just now"
+                elif minutes_ago == 1:
+                    sync_text = "Updated 1 minute ago"
+                else:
+                    sync_text = f"Updated {minutes_ago} minutes ago"
+            except:
+                sync_text = "Sync time unavailable"
+        elif tournament.status == 'active':
+            sync_text = "Never synced"
+        sync_info = Span(sync_text, cls="sync-info") if sync_text else None
+
+        # Answer a refresh of an unchanged page before rendering anything. Without a
+        # standings version (never bumped yet) picks could change unseen: no ETag.
+        etag = None
+        if tournament.standings_version is not None:
+            etag = page_etag(
+                request, user,
+                tournament.id, tournament.status, tournament.last_synced_at, tournament.standings_version,
+                tournament.entry_price, tournament.three_entry_price,
+                view, after, before, q, jump, display_message, [(t.id, t.name, t.status) for t in viewable],
+                sync_text
+            )
+            cached = not_modified(request, etag)
+            if cached:
+                return cached
         message_alert_list = []
         if display_message:
             message_alert_list.append(alert(display_message, "warning"))
@@ -351,169 +616,14 @@ def setup_leaderboard_routes(app):
                 )
             )
 
-        users_by_id = {u.id: u for u in db.users()}
-        golfers_by_id = {g.id: g for g in db.golfers()}
-
-        # Get all picks for this tournament
-        all_picks = [p for p in db.picks() if p.tournament_id == tournament.id]
-
-        # Get standings if they exist - keyed by (user_id, entry_number)
-        standings = [s for s in db.pickem_standings() if s.tournament_id == tournament.id]
-        standings_by_key = {(s.user_id, getattr(s, 'entry_number', 1) or 1): s for s in standings}
-
-        # Count entries per user to know when to show entry numbers
-        entries_per_user = {}
-        for p in all_picks:
-            entries_per_user[p.user_id] = entries_per_user.get(p.user_id, 0) + 1
-
-        # Get results for thru info
-        results = {r.golfer_id: r for r in db.tournament_results() if r.tournament_id == tournament.id}
-
-        def get_golfer_name(golfer_id):
-            g = golfers_by_id.get(golfer_id)
-            return g.name if g else "-"
-
-        # Check if tournament has any results (has it started?)
-        has_results = len(results) > 0
-
-        def pick_row(pick, rank):
-            u = users_by_id.get(pick.user_id)
-            entry_number = getattr(pick, 'entry_number', 1) or 1
-            standing = standings_by_key.get((pick.user_id, entry_number))
-
-            # Show entry number if user has multiple entries
-            display_name = (u.groupme_name or u.username) if u else "Unknown"
-            if entries_per_user.get(pick.user_id, 1) > 1:
-                display_name = f"{display_name} ({entry_number})"
-
-            def cell(golfer_id, score):
-                name = get_golfer_name(golfer_id)
-                result = results.get(golfer_id)
-
-                # Determine display based on score and tournament state
-                if score is None:
-                    if not has_results:
-                        # Tournament hasn't started yet
-                        score_display = "-"
-                        cls = "golfer-cell not-started"
-                    elif result and result.status in ('cut', 'mc'):
-                        # Actually missed the cut
-                        score_display = "MC"
-                        cls = "golfer-cell missed-cut"
-                    elif result and result.status == 'wd':
-                        score_display = "WD"
-                        cls = "golfer-cell withdrawn"
-                    elif result and result.status == 'dq':
-                        score_display = "DQ"
-                        cls = "golfer-cell disqualified"
-                    elif result is None:
-                        # No result for this golfer - hasn't teed off or not in field
-                        score_display = "-"
-                        cls = "golfer-cell not-started"
-                    else:
-                        # Has result but no score - still playing
-                        score_display = "E"
-                        cls = "golfer-cell"
-                else:
-                    score_display = format_score(score)
-                    cls = "golfer-cell"
-                    if score < 0:
-                        cls += " under-par"
-                    elif score > 0:
-                        cls += " over-par"
-
-                # Add thru info if available and tournament is active
-                thru_info = ""
-                if result and result.thru and tournament.status == 'active':
-                    if result.thru == 18:
-                        thru_info = " (F)"
-                    else:
-                        thru_info = f" ({result.thru})"
-
-                return Td(
-                    Div(
-                        Span(name, cls="golfer-name-lb"),
-                        Span(f"{score_display}{thru_info}", cls="golfer-score"),
-                        cls="golfer-cell-content"
-                    ),
-                    cls=cls
-                )
-
-            # Get scores from standing (stored in tier*_position columns)
-            t1_score = standing.tier1_position if standing else None
-            t2_score = standing.tier2_position if standing else None
-            t3_score = standing.tier3_position if standing else None
-            t4_score = standing.tier4_position if standing else None
-
-            total = standing.best_two_total if standing else None
-            if not has_results:
-                # Tournament hasn't started
-                total_display = "-"
-            elif total is None:
-                # Has results but DQ (less than 2 valid scores)
-                total_display = "DQ"
-            else:
-                total_display = format_score(total)
-
-            rank_display = str(rank) if rank is not None else "-"
-            is_current = u and u.id == user.id
-
-            # Table row
-            return Tr(
-                Td(rank_display, cls="rank"),
-                Td(display_name, cls="player-name"),
-                cell(pick.tier1_golfer_id, t1_score),
-                cell(pick.tier2_golfer_id, t2_score),
-                cell(pick.tier3_golfer_id, t3_score),
-                cell(pick.tier4_golfer_id, t4_score),
-                Td(total_display, cls="total"),
-                cls=f"{'current-user' if is_current else ''}"
-            )
-
-        # Sort by standings data and compute fresh ranks (avoids relying on stale DB ranks)
-        def _standing_sort_key(p):
-            entry_num = getattr(p, 'entry_number', 1) or 1
-            s = standings_by_key.get((p.user_id, entry_num))
-            if s is None or s.best_two_total is None:
-                return (True, float('inf'), True, float('inf'), True, float('inf'))
-            total = s.best_two_total
-            has_third = getattr(s, 'has_third_made_cut', False) or False
-            third_score = s.third_best_score if has_third else float('inf')
-            if third_score is None:
-                third_score = float('inf')
-            has_fourth = getattr(s, 'has_fourth_made_cut', False) or False
-            fourth_score = s.fourth_best_score if has_fourth else float('inf')
-            if fourth_score is None:
-                fourth_score = float('inf')
-            return (False, total, not has_third, third_score, not has_fourth, fourth_score)
-
-        if standings:
-            all_picks.sort(key=_standing_sort_key)
-
-        # Compute display ranks with tie-handling
-        _display_ranks = {}
-        _current_rank = 1
-        _prev_tie_key = None
-        for _i, _pick in enumerate(all_picks):
-            _entry_num = getattr(_pick, 'entry_number', 1) or 1
-            _s = standings_by_key.get((_pick.user_id, _entry_num))
-            if _s and _s.best_two_total is not None:
-                _has_third = getattr(_s, 'has_third_made_cut', False) or False
-                _has_fourth = getattr(_s, 'has_fourth_made_cut', False) or False
-                _tie_key = (
-                    _s.best_two_total,
-                    _has_third,
-                    _s.third_best_score if _has_third else None,
-                    _has_fourth,
-                    _s.fourth_best_score if _has_fourth else None,
-                )
-                if _prev_tie_key is None or _tie_key != _prev_tie_key:
-                    _current_rank = _i + 1
-                _display_ranks[(_pick.user_id, _entry_num)] = _current_rank
-                _prev_tie_key = _tie_key
-            else:
-                _display_ranks[(_pick.user_id, _entry_num)] = None  # DQ
-                _prev_tie_key = None
+        # Entries for this tournament (purse, empty state, "jump to my entry"); the
+        # table itself loads one page at a time
+        from sqlalchemy import text
+        with db.db.engine.connect() as conn:
+            all_picks = conn.execute(
+                text("SELECT user_id, entry_number FROM pick WHERE tournament_id = :tid"),
+                {"tid": tournament.id}
+            ).fetchall()
 
         # Status indicator
         status_badge_list = []
@@ -522,24 +632,6 @@ def setup_leaderboard_routes(app):
         elif tournament.status == 'completed':
             status_badge_list.append(Span("Final", cls="badge badge-final"))
 
-        # Last sync info
-        sync_info = None
-        if tournament.last_synced_at:
-            try:
-                last_sync = datetime.fromisoformat(tournament.last_synced_at.replace('Z', '+00:00'))
-                minutes_ago = int((datetime.now() - last_sync).total_seconds() / 60)
-                if minutes_ago < 1:
-                    sync_text = "Updated just now"
-                elif minutes_ago == 1:
-                    sync_text = "Updated 1 minute ago"
-                else:
-                    sync_text = f"Updated {minutes_ago} minutes ago"
-                sync_info = Span(sync_text, cls="sync-info")
-            except:
-                sync_info = Span("Sync time unavailable", cls="sync-info")
-        elif tournament.status == 'active':
-            sync_info = Span("Never synced", cls="sync-info")
-
         # Refresh button (for active tournaments)
         refresh_button = None
         if tournament.status == 'active' and user.is_admin:
@@ -562,15 +654,6 @@ def setup_leaderboard_routes(app):
                 style="display:inline; margin-left: 0.5rem;"
             )
 
-        # Build rows with fresh computed ranks
-        if all_picks:
-            desktop_rows = [
-                pick_row(p, _display_ranks.get((getattr(p, 'user_id'), getattr(p, 'entry_number', 1) or 1)))
-                for p in all_picks
-            ]
-        else:
-            desktop_rows = []
-
         # Build tabs for switching views
         base_url = f"/leaderboard?tournament_id={tournament.id}"
         tabs = Div(
@@ -581,30 +664,63 @@ def setup_leaderboard_routes(app):
             cls="tabs"
         )
 
-        # Build content based on view
+        # Build content based on view. Table pages are cached as HTML by standings version.
         if view == "tournament":
             # Tournament leaderboard - show actual golfer results
-            tournament_content = _build_tournament_leaderboard(db, tournament, results, golfers_by_id)
+            after_cursor, before_cursor = _parse_cursor(after, 4), _parse_cursor(before, 4)
+            tournament_content = NotStr(_cached_fragment(
+                tournament, "tournament",
+                lambda: _build_tournament_leaderboard(db, tournament, after=after_cursor, before=before_cursor),
+                page=(after_cursor, before_cursor)
+            ))
         else:
             # Pick'em standings (default)
+            search = (q or "").strip() or None
+            after_cursor, before_cursor = _parse_cursor(after, 3), _parse_cursor(before, 3)
+            around = _my_entry_cursor(db, tournament, user.id) if jump == "me" else None
+            table_list = []
+            if all_picks:
+                table_list.append(Div(
+                    Form(
+                        Input(type="hidden", name="tournament_id", value=str(tournament.id)),
+                        Input(type="hidden", name="view", value="pickem"),
+                        Input(type="search", name="q", value=search or "", placeholder="Search players"),
+                        Button("Search", type="submit", cls="btn btn-sm btn-secondary"),
+                        *([A("Clear", href=f"{base_url}&view=pickem", cls="btn btn-sm btn-secondary")] if search else []),
+                        action="/leaderboard",
+                        method="get",
+                        cls="leaderboard-search"
+                    ),
+                    *([A("Jump to my entry", href=f"{base_url}&view=pickem&jump=me", cls="btn btn-sm btn-primary")]
+                      if any(p.user_id == user.id for p in all_picks) else []),
+                    cls="leaderboard-page-controls"
+                ))
+                render = lambda: _build_pickem_table(
+                    db, tournament, after=after_cursor, before=before_cursor, around=around, search=search
+                )
+                if search:
+                    # Not cached: every search string would be a new entry
+                    table_html = to_xml(render())
+                else:
+                    table_html = _cached_fragment(tournament, "pickem", render, page=(after_cursor, before_cursor, around))
+                # Highlight the viewer's own entries
+                marker = f'data-user="{user.id}"'
+                table_list.append(NotStr(table_html.replace(marker, f'{marker} class="current-user"')))
+                if (tournament.status == 'active' and not search
+                        and tournament.standings_version is not None and supports_row_versions(db)):
+                    # Changed rows are pushed to the open page as scores come in (or polled
+                    # from /leaderboard/rows where Server-Sent Events aren't available)
+                    table_list.append(Div(
+                        id="pickem-live", data_viewer=str(user.id), data_poll_ms=str(LIVE_ROWS_POLL_SECONDS * 1000)
+                    ))
+                    table_list.append(Script(src=asset_url("live-leaderboard.js"), defer=True))
             tournament_content = Div(
                 P("Best 2 of 4 scores against par. Lowest total wins."),
                 # Leaderboard table
-                *([ Table(
-                    Thead(
-                        Tr(
-                            Th("Rank"), Th("Player"),
-                            Th("Tier 1"), Th("Tier 2"), Th("Tier 3"), Th("Tier 4"),
-                            Th("Best 2", cls="total-header")
-                        )
-                    ),
-                    Tbody(*desktop_rows),
-                    cls="leaderboard-table"
-                ) ] if all_picks else []),
+                *table_list,
                 *([ P("No picks yet for this tournament.") ] if not all_picks else []),
                 *([ A("Make Picks", href="/picks", cls="btn btn-primary") ] if tournament.status == 'active' else []),
             )
-
         # Calculate purse for header display
         from routes.utils import calculate_tournament_purse
         purse = calculate_tournament_purse(tournament, all_picks)
@@ -665,6 +781,96 @@ def setup_leaderboard_routes(app):
                 cls="leaderboard-page"
             ),
             user=user
+        ), *(etag_headers(etag) if etag else ())
+
+    @app.get("/leaderboard/rows")
+    def leaderboard_rows(request, tournament_id: int, since: int):
+        """Pick'em rows changed since a standings version, for polling clients.
+
+        200 with just the changed <tr> rows (X-Standings-Version / X-Standings-Total
+        headers), 204 if nothing changed, or 204 with HX-Refresh when the page
+        should reload instead (tournament finished or unknown).
+        """
+        db = get_db()
+        user = get_current_user(request)
+        if not user:
+            return Response(status_code=401)
+
+        headers = {"Cache-Control": "private, no-cache"}
+        tournament = next((t for t in db.tournaments() if t.id == tournament_id), None)
+        version = tournament.standings_version if tournament else None
+        if version is None or tournament.status != 'active' or not supports_row_versions(db):
+            return Response(status_code=204, headers={**headers, "HX-Refresh": "true"})
+        headers["X-Standings-Version"] = str(version)
+        if since >= version:
+            return Response(status_code=204, headers=headers)
+
+        html, total = render_changed_rows(db, tournament, since)
+        headers["X-Standings-Total"] = str(total)
+        marker = f'data-user="{user.id}"'
+        return HTMLResponse(html.replace(marker, f'{marker} class="current-user"'), headers=headers)
+
+    @app.get("/leaderboard/stream")
+    async def leaderboard_stream(request, tournament_id: int, since: int = None):
+        """Server-Sent Events stream of changed pick'em rows for one tournament."""
+        from services.live_updates import format_event, live_hub, watch
+
+        user = get_current_user(request)
+        if not user:
+            return Response(status_code=401)
+
+        # A reconnecting EventSource resumes from the last event it received
+        last_event_id = request.headers.get("last-event-id", "")
+        if last_event_id.isdigit():
+            since = int(last_event_id)
+
+        # Subscribe before catching up so nothing published in between is missed
+        queue = live_hub.subscribe(tournament_id)
+
+        def catch_up():
+            db = get_db()
+            tournament = db.tournaments[tournament_id]
+            version = tournament.standings_version
+            if version is None or not supports_row_versions(db):
+                return None, None
+            watch(tournament_id, version)
+            if since is not None and since >= version:
+                return version, None
+            if tournament.status != 'active':
+                return version, format_event("reload", event_id=version)
+            html, total = render_changed_rows(db, tournament, since or 0)
+            return version, format_event("standings", {"version": version, "rows": html, "total": total}, event_id=version)
+
+        async def events():
+            try:
+                yield f"retry: {LIVE_RETRY_MS}\n\n"
+                try:
+                    version, message = await run_in_threadpool(catch_up)
+                except Exception as e:
+                    logger.error(f"Live catch-up failed for tournament {tournament_id}: {e}", exc_info=True)
+                    version, message = None, None
+                if version is None:
+                    # Unknown or never-scored tournament, or rows aren't versioned
+                    yield format_event("close")
+                    return
+                if message:
+                    yield message
+                while True:
+                    if await request.is_disconnected():
+                        break
+                    try:
+                        message = await asyncio.wait_for(queue.get(), timeout=LIVE_HEARTBEAT_SECONDS)
+                    except asyncio.TimeoutError:
+                        yield ": ping\n\n"
+                        continue
+                    yield message
+            finally:
+                live_hub.unsubscribe(tournament_id, queue)
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
         )
 
     @app.post("/leaderboard/refresh")
@@ -697,37 +903,25 @@ def setup_leaderboard_routes(app):
 
         # Do the sync
         from services.datagolf import DataGolfClient
-        from services.scoring import ScoringService
 
         client = DataGolfClient()
-        scoring = ScoringService(db)
 
         try:
-            live_data = client.get_live_stats()
+            from etl.live_payload import parse_live_stats
+            live = parse_live_stats(client.get_live_stats())
 
             # Validate tournament name matches
-            api_event_name = live_data.get('event_name', '')
+            api_event_name = live.event_name
             if not _tournament_names_match(tournament.name, api_event_name):
                 logger.warning(f"Refresh skipped: API returning '{api_event_name}', not '{tournament.name}'")
                 msg = f"Can't sync: DataGolf is showing '{api_event_name}', not '{tournament.name}'"
                 return RedirectResponse(f"/leaderboard?tournament_id={tournament_id}&message={quote(msg)}", status_code=303)
 
-            live_stats = live_data.get('live_stats', [])
-            
             # Check if anyone is currently playing (not all finished for the day)
             # A player is "playing" if their thru < 18 for the current round
-            players_on_course = 0
-            players_finished = 0
-            current_round = live_data.get('current_round', 1)
-            
-            for player in live_stats:
-                thru = player.get('thru')
-                if thru is not None:
-                    if thru < 18:
-                        players_on_course += 1
-                    else:
-                        players_finished += 1
-            
+            current_round = live.current_round or 1
+            players_on_course, players_finished = live.on_course_count()
+
             # If no one is on the course but there are results, round is complete
             if players_on_course == 0 and players_finished > 0:
                 logger.info(f"Round {current_round} complete - all {players_finished} players finished")
@@ -744,62 +938,8 @@ def setup_leaderboard_routes(app):
             
             _last_refresh[tournament_id] = now
 
-            golfers_by_dg_id = {g.datagolf_id: g for g in db.golfers()}
-
-            for player in live_stats:
-                dg_id = str(player.get('dg_id', ''))
-                golfer = golfers_by_dg_id.get(dg_id)
-                if not golfer:
-                    continue
-
-                pos_str = player.get('position', '')
-                position = None
-                status = 'active'
-
-                if pos_str:
-                    pos_clean = pos_str.replace('T', '').strip()
-                    if pos_clean.isdigit():
-                        position = int(pos_clean)
-                    elif pos_str.upper() in ('CUT', 'MC'):
-                        status = 'cut'
-                    elif pos_str.upper() in ('WD', 'W/D'):
-                        status = 'wd'
-                    elif pos_str.upper() == 'DQ':
-                        status = 'dq'
-
-                score_to_par = player.get('total')
-                thru = player.get('thru')
-                round_num = player.get('round')
-
-                existing = [r for r in db.tournament_results()
-                            if r.tournament_id == tournament_id and r.golfer_id == golfer.id]
-
-                if existing:
-                    db.tournament_results.update(
-                        id=existing[0].id,
-                        position=position,
-                        score_to_par=score_to_par,
-                        status=status,
-                        round_num=round_num,
-                        thru=thru,
-                        updated_at=datetime.now().isoformat()
-                    )
-                else:
-                    db.tournament_results.insert(
-                        tournament_id=tournament_id,
-                        golfer_id=golfer.id,
-                        position=position,
-                        score_to_par=score_to_par,
-                        status=status,
-                        round_num=round_num,
-                        thru=thru,
-                        updated_at=datetime.now().isoformat()
-                    )
-
-            scoring.calculate_standings(tournament_id)
-            
-            # Update last_synced_at timestamp
-            db.tournaments.update(id=tournament_id, last_synced_at=datetime.now().isoformat())
+            from etl.pipeline import run_live_sync
+            run_live_sync(db, client, tournament, live_data=live)
         except Exception as e:
             logger.error(f"Refresh error: {e}", exc_info=True)
 
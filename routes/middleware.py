@@ -0,0 +1,165 @@
+"""Request middleware."""
+import importlib.util
+import zlib
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.exceptions import ExceptionMiddleware
+from starlette.requests import HTTPConnection
+from starlette.responses import PlainTextResponse
+from starlette.staticfiles import StaticFiles
+
+from config import COMPRESSION_BROTLI_QUALITY, COMPRESSION_GZIP_LEVEL, COMPRESSION_MIN_BYTES
+from services.assets import static_assets
+
+STATIC_PREFIX = "/static"
+HEALTH_PATH = "/health"
+
+
+class AuthMiddleware:
+    """Resolve the session user once per request into request.state.user.
+
+    Installed outermost, so static assets and health checks are answered here
+    directly: no session lookup and none of the FastHTML stack (including its
+    own cookie session middleware).
+    """
+
+    def __init__(self, app, auth_service, static_dir: str = "static"):
+        self.app = app
+        self.auth_service = auth_service
+        # ExceptionMiddleware turns StaticFiles' 404/405 into responses
+        self.static = ExceptionMiddleware(StaticFiles(directory=static_dir))
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path.startswith(STATIC_PREFIX + "/"):
+            if scope["method"] in ("GET", "HEAD"):
+                # Fingerprinted/precompressed assets (services/assets.py)
+                response = static_assets.response(path[len(STATIC_PREFIX) + 1:], Headers(scope=scope))
+                if response is not None:
+                    await response(scope, receive, send)
+                    return
+            static_scope = dict(scope, root_path=scope.get("root_path", "") + STATIC_PREFIX)
+            await self.static(static_scope, receive, send)
+            return
+        if path == HEALTH_PATH:
+            await PlainTextResponse("ok")(scope, receive, send)
+            return
+
+        token = HTTPConnection(scope).cookies.get("session")
+        user = await run_in_threadpool(self.auth_service.get_user_from_token, token) if token else None
+        scope.setdefault("state", {})["user"] = user
+        await self.app(scope, receive, send)
+
+
+BROTLI_AVAILABLE = importlib.util.find_spec("brotli") is not None
+COMPRESSIBLE_TYPES = ("text/html", "application/json")
+
+
+class _Compressor:
+    """Streaming gzip or brotli compressor."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            import brotli
+            self._brotli = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+        else:
+            self._zlib = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Compress a chunk; flush so a streamed chunk can be decoded on arrival."""
+        if self.encoding == "br":
+            out = self._brotli.process(data)
+            return out + (self._brotli.finish() if final else self._brotli.flush())
+        out = self._zlib.compress(data)
+        return out + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+def negotiate_encoding(accept_encoding: str):
+    """'br', 'gzip' or None for an Accept-Encoding header."""
+    accepted = {part.split(";")[0].strip() for part in accept_encoding.lower().split(",")}
+    if BROTLI_AVAILABLE and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def _compressible(message) -> bool:
+    headers = Headers(raw=message["headers"])
+    return (
+        message["status"] not in (204, 206, 304)
+        and "content-encoding" not in headers
+        and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+    )
+
+
+class CompressionMiddleware:
+    """Compress HTML and JSON responses of at least minimum_size bytes.
+
+    Prefers brotli when the brotli package is installed and the client accepts
+    it, else gzip. Other content types (static assets are precompressed, event
+    streams must not be buffered) pass through untouched.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        encoding = None
+        if scope["type"] == "http" and scope["method"] != "HEAD":
+            encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start, compressor, passthrough
+
+            if passthrough or message["type"] not in ("http.response.start", "http.response.body"):
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                if _compressible(message):
+                    start = message  # held until the first body chunk decides
+                else:
+                    passthrough = True
+                    await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                compressor = _Compressor(encoding)
+                body = compressor.compress(body, final=not more_body)
+                headers = MutableHeaders(raw=start["headers"])
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(len(body))
+                await send(start)
+            else:
+                body = compressor.compress(body, final=not more_body)
+
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
@@ -111,33 +111,45 @@ def setup_picks_routes(app):
         is_update = bool(existing)
         action = "updated" if is_update else "created"
 
-        if existing:
-            # Update existing entry
-            db.picks.update(
-                id=existing[0].id,
-                entry_number=entry,
-                tier1_golfer_id=tier1,
-                tier2_golfer_id=tier2,
-                tier3_golfer_id=tier3,
-                tier4_golfer_id=tier4,
-                updated_at=datetime.now().isoformat()
-            )
-        else:
-            # Create new entry
-            db.picks.insert(
-                user_id=user.id,
-                tournament_id=tournament.id,
-                entry_number=entry,
-                tier1_golfer_id=tier1,
-                tier2_golfer_id=tier2,
-                tier3_golfer_id=tier3,
-                tier4_golfer_id=tier4,
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat()
-            )
-
-        # Send GroupMe notification
-        _send_pick_notification(db, user, tournament, entry, tier1, tier2, tier3, tier4, action)
+        # Write the pick and queue its GroupMe notification in one transaction;
+        # the notification is sent in the background (services/notifications.py)
+        from sqlalchemy import text
+        from services.notifications import enqueue_pick_notification
+
+        now = datetime.now().isoformat()
+        params = {
+            "entry": entry,
+            "tier1": tier1,
+            "tier2": tier2,
+            "tier3": tier3,
+            "tier4": tier4,
+            "now": now,
+        }
+        with db.db.engine.begin() as conn:
+            if existing:
+                # Update existing entry
+                conn.execute(
+                    text("""
+                        UPDATE pick SET entry_number = :entry,
+                            tier1_golfer_id = :tier1, tier2_golfer_id = :tier2,
+                            tier3_golfer_id = :tier3, tier4_golfer_id = :tier4,
+                            updated_at = :now
+                        WHERE id = :id
+                    """),
+                    {**params, "id": existing[0].id}
+                )
+            else:
+                # Create new entry
+                conn.execute(
+                    text("""
+                        INSERT INTO pick (user_id, tournament_id, entry_number,
+                            tier1_golfer_id, tier2_golfer_id, tier3_golfer_id, tier4_golfer_id,
+                            created_at, updated_at)
+                        VALUES (:user_id, :tid, :entry, :tier1, :tier2, :tier3, :tier4, :now, :now)
+                    """),
+                    {**params, "user_id": user.id, "tid": tournament.id}
+                )
+            enqueue_pick_notification(conn, user, tournament, entry, [tier1, tier2, tier3, tier4], action)
 
         # Recalculate standings so pick appears with current scores immediately
         try:
@@ -180,6 +192,9 @@ def setup_picks_routes(app):
             if standing:
                 db.pickem_standings.delete(standing[0].id)
 
+            from services.scoring import bump_standings_version
+            bump_standings_version(db, tournament.id)
+
         return RedirectResponse("/picks", status_code=303)
 
 
@@ -342,37 +357,3 @@ def _render_edit_view(tournament, all_user_picks, current_entry, user_pick,
         ),
         user=user
     )
-
-
-def _send_pick_notification(db, user, tournament, entry, tier1, tier2, tier3, tier4, action):
-    """Send GroupMe notification for pick creation/update."""
-    try:
-        from services.groupme import GroupMeClient
-
-        # Get golfer names
-        golfers_by_id = {g.id: g for g in db.golfers()}
-        tier1_name = golfers_by_id.get(tier1).name if tier1 and tier1 in golfers_by_id else "-"
-        tier2_name = golfers_by_id.get(tier2).name if tier2 and tier2 in golfers_by_id else "-"
-        tier3_name = golfers_by_id.get(tier3).name if tier3 and tier3 in golfers_by_id else "-"
-        tier4_name = golfers_by_id.get(tier4).name if tier4 and tier4 in golfers_by_id else "-"
-
-        # Calculate purse
-        all_picks = [p for p in db.picks() if p.tournament_id == tournament.id]
-        from routes.utils import calculate_tournament_purse
-        purse = calculate_tournament_purse(tournament, all_picks)
-        purse_text = f"${purse}" if purse else "Not set"
-
-        # Build message
-        display_name = user.groupme_name or user.username
-        message = f"""🏌️ {display_name} {action} Entry {entry} for {tournament.name}
-Tier 1: {tier1_name}
-Tier 2: {tier2_name}
-Tier 3: {tier3_name}
-Tier 4: {tier4_name}
-💰 Total Purse: {purse_text}"""
-
-        # Send message via GroupMeClient (will check app_settings and env var)
-        client = GroupMeClient(db_module=db)
-        client.send_message(message)
-    except Exception as e:
-        logger.error(f"Failed to send pick notification: {e}", exc_info=True)
@@ -6,7 +6,7 @@ from fasthtml.common import *
 from starlette.responses import RedirectResponse
 
 from components.layout import page_shell, card
-from routes.utils import get_current_user, get_db, format_score
+from routes.utils import get_current_user, get_db, format_score, page_etag, not_modified, etag_headers
 
 logger = logging.getLogger(__name__)
 
@@ -122,6 +122,29 @@ def get_available_years(db):
         return []
 
 
+def get_completed_version(db):
+    """Cheap fingerprint of all completed-tournament data, or None if unavailable.
+
+    standings_version only ever increases, so its sum changes whenever any
+    completed tournament's standings (or a player's name) change.
+    """
+    import sqlalchemy as sa
+
+    query = """
+    SELECT COUNT(*), SUM(COALESCE(standings_version, 0)),
+           SUM(COALESCE(entry_price, 0)), SUM(COALESCE(three_entry_price, 0))
+    FROM tournament
+    WHERE status = 'completed'
+    """
+
+    try:
+        with db.db.engine.connect() as conn:
+            return tuple(conn.execute(sa.text(query)).fetchone())
+    except Exception as e:
+        logger.warning(f"Could not compute season version: {e}")
+        return None
+
+
 def setup_season_leaderboard_routes(app):
     """Register season leaderboard routes."""
 
@@ -151,6 +174,16 @@ def setup_season_leaderboard_routes(app):
         if not year:
             year = current_year if current_year in available_years else available_years[0]
 
+        # Completed tournaments only change when standings are recalculated (which
+        # bumps standings_version), a tournament completes, or pricing changes
+        etag = None
+        version = get_completed_version(db)
+        if version is not None:
+            etag = page_etag(request, user, year, available_years, version)
+            cached = not_modified(request, etag)
+            if cached:
+                return cached
+
         # Get standings for selected year
         standings = get_season_standings(db, year)
 
@@ -275,4 +308,4 @@ def setup_season_leaderboard_routes(app):
             "Season Leaderboard",
             content,
             user=user
-        )
+        ), *(etag_headers(etag) if etag else ())
@@ -1,5 +1,8 @@
 """Route utilities and shared helpers."""
-from starlette.responses import RedirectResponse
+import hashlib
+
+from fasthtml.common import HttpHeader
+from starlette.responses import RedirectResponse, Response
 
 from components.layout import page_shell, card
 
@@ -26,9 +29,12 @@ def get_auth_service():
 
 
 def get_current_user(request):
-    """Get current user from session cookie."""
-    token = request.cookies.get('session')
-    return _auth_service.get_user_from_token(token)
+    """Get current user, as resolved by AuthMiddleware (or from the session cookie)."""
+    try:
+        return request.state.user
+    except AttributeError:
+        # Not routed through AuthMiddleware (e.g. a request built in a script)
+        return _auth_service.get_user_from_token(request.cookies.get('session'))
 
 
 def require_auth(func):
@@ -53,6 +59,37 @@ def require_admin(func):
     return wrapper
 
 
+def page_etag(request, user, *parts) -> str:
+    """Weak ETag for a page built from parts.
+
+    Also covers what every page varies on: the viewer (nav shows their name and
+    admin link), the stylesheet URL (changes on deploy) and htmx requests.
+    """
+    from services.assets import asset_url
+
+    key = (
+        user.id, user.groupme_name, bool(user.is_admin), asset_url("style.css"),
+        request.headers.get("hx-request"), *parts
+    )
+    return f'W/"{hashlib.sha1(repr(key).encode()).hexdigest()[:20]}"'
+
+
+def not_modified(request, etag: str):
+    """304 response if If-None-Match matches etag (weak comparison), else None."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if "*" in tags or etag.removeprefix("W/") in tags:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+    return None
+
+
+def etag_headers(etag: str) -> tuple:
+    """Headers to return alongside a page so browsers revalidate with If-None-Match."""
+    return HttpHeader("ETag", etag), HttpHeader("Cache-Control", "private, no-cache")
+
+
 def format_score(score):
     """Format golf score with +/- sign."""
     if score is None:
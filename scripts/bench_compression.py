@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Benchmark response compression on a large pick'em leaderboard.
+
+Builds a throwaway SQLite database with a completed tournament and N entries,
+then requests /leaderboard through the full app with each Accept-Encoding and
+reports bytes on the wire and server CPU per request:
+
+    python scripts/bench_compression.py --entries 500 --requests 20
+
+CPU is process time for the whole request (rendering included); the
+"compress" column is the share spent in the compressor alone.
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def seed(db_module, entries: int, field_size: int = 150):
+    """A completed tournament with a full field, results and standings."""
+    from services.auth import hash_password
+
+    rng = random.Random(0)
+    now = datetime.now().isoformat()
+    tournament = db_module.tournaments.insert(
+        name="Benchmark Open", status="completed", start_date="2026-04-09", end_date="2026-04-12",
+        picks_locked=True, last_synced_at=now, entry_price=10, three_entry_price=25
+    )
+    golfers = [db_module.golfers.insert(name=f"Golfer Number {i}", datagolf_id=str(90000 + i)) for i in range(field_size)]
+    for i, golfer in enumerate(golfers):
+        db_module.tournament_field.insert(tournament_id=tournament.id, golfer_id=golfer.id, tier=min(i // 30 + 1, 4))
+        db_module.tournament_results.insert(
+            tournament_id=tournament.id, golfer_id=golfer.id, position=i + 1 if i < 70 else None,
+            score_to_par=rng.randint(-15, 10), status="finished" if i < 70 else "cut", round_num=4, thru=18
+        )
+
+    password_hash = hash_password("benchmark")
+    for i in range(entries):
+        user = db_module.users.insert(
+            username=f"player{i}", password_hash=password_hash, display_name=f"Player {i}",
+            groupme_name=f"Player {i}", is_admin=(i == 0), created_at=now
+        )
+        tiers = [rng.choice(golfers[t * 30:(t + 1) * 30]).id for t in range(4)]
+        db_module.picks.insert(
+            user_id=user.id, tournament_id=tournament.id, entry_number=1,
+            tier1_golfer_id=tiers[0], tier2_golfer_id=tiers[1], tier3_golfer_id=tiers[2], tier4_golfer_id=tiers[3],
+            created_at=now
+        )
+        db_module.pickem_standings.insert(
+            tournament_id=tournament.id, user_id=user.id, entry_number=1,
+            tier1_position=rng.randint(1, 70), tier2_position=rng.randint(1, 70),
+            tier3_position=rng.randint(1, 70), tier4_position=rng.randint(1, 70),
+            best_two_total=rng.randint(2, 140), rank=i + 1, updated_at=now
+        )
+    return tournament
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+    os.chdir(ROOT)
+
+    import app as app_module
+    import db as db_module
+    from starlette.testclient import TestClient
+    from routes import middleware
+
+    logging.disable(logging.CRITICAL)
+    app_module.scheduler.pause()
+
+    tournament = seed(db_module, args.entries)
+    client = TestClient(app_module.app)
+    response = client.post("/login", data={"groupme_name": "Player 0", "password": "benchmark"}, follow_redirects=False)
+    assert response.status_code == 303, "login failed"
+
+    # Time the compressor on its own by wrapping it
+    compress_seconds = [0.0]
+    original = middleware._Compressor.compress
+
+    def timed(self, data, final):
+        started = time.process_time()
+        try:
+            return original(self, data, final)
+        finally:
+            compress_seconds[0] += time.process_time() - started
+
+    middleware._Compressor.compress = timed
+
+    url = f"/leaderboard?tournament_id={tournament.id}"
+    encodings = ["identity", "gzip"] + (["br"] if middleware.BROTLI_AVAILABLE else [])
+    print(f"{args.entries}-entry leaderboard, {args.requests} requests each")
+    print(f"{'encoding':<10}{'bytes':>10}{'ratio':>8}{'cpu ms/req':>12}{'compress ms':>13}")
+
+    identity_bytes = None
+    for encoding in encodings:
+        compress_seconds[0] = 0.0
+        started = time.process_time()
+        for _ in range(args.requests):
+            # Read the raw stream so the test client doesn't decode the body for us
+            with client.stream("GET", url, headers={"Accept-Encoding": encoding}) as response:
+                wire = b"".join(response.iter_raw())
+        cpu_ms = (time.process_time() - started) * 1000 / args.requests
+        assert response.headers.get("content-encoding", "identity") == encoding, response.headers
+        identity_bytes = identity_bytes or len(wire)
+        print(f"{encoding:<10}{len(wire):>10}{len(wire) / identity_bytes:>8.2f}{cpu_ms:>12.1f}"
+              f"{compress_seconds[0] * 1000 / args.requests:>13.2f}")
+
+    if not middleware.BROTLI_AVAILABLE:
+        print("(brotli not installed; pip install brotli to include it)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Local DataGolf stub server that replays recorded cassettes.
+
+Serves the same paths as https://feeds.datagolf.com from a cassette directory
+(see services/datagolf_cassettes.py) on an accelerated clock, so the ETL
+runner, the leaderboard auto-sync and benchmarks can run offline:
+
+    python scripts/datagolf_stub.py data/cassettes/2026-masters --speed 120 --port 8765
+    DATAGOLF_BASE_URL=http://localhost:8765 python etl/runner.py
+
+GET /_replay/status reports the virtual clock.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.datagolf_cassettes import CassettePlayer
+
+logger = logging.getLogger("datagolf_stub")
+
+
+def make_handler(player):
+    """Build a request handler class bound to a cassette player."""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            endpoint = url.path.strip("/")
+
+            if endpoint == "_replay/status":
+                return self._send_json(200, {
+                    "virtual_now": player.now().isoformat(),
+                    "speed": player.speed,
+                    "first_recorded_at": player.first_recorded_at.isoformat(),
+                    "last_recorded_at": player.last_recorded_at.isoformat(),
+                    "finished": player.finished(),
+                })
+
+            params = dict(parse_qsl(url.query))
+            try:
+                body = player.response_for(endpoint, params)
+            except KeyError as e:
+                return self._send_json(404, {"error": str(e)})
+            return self._send_json(200, body)
+
+        def log_message(self, format, *args):
+            logger.info(f"{self.address_string()} {format % args}")
+
+    return StubHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cassette_dir", help="Directory of recorded cassettes")
+    parser.add_argument("--speed", type=float, default=60.0, help="Virtual seconds per wall second (default: 60)")
+    parser.add_argument("--start", help="Virtual start time, ISO format (default: first recording)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    start = datetime.fromisoformat(args.start) if args.start else None
+    player = CassettePlayer(args.cassette_dir, speed=args.speed, start=start)
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(player))
+    logger.info(f"DataGolf stub listening on http://{args.host}:{args.port} ({args.speed}x)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("DataGolf stub stopped")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
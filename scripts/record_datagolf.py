@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Record DataGolf feeds into a cassette directory for later replay.
+
+Polls every feed the app uses (schedule, field-updates, rankings, player list,
+live stats, in-play) at a fixed interval until stopped, e.g. for a whole
+tournament week:
+
+    python scripts/record_datagolf.py data/cassettes/2026-masters --interval 5
+
+Use --once to take a single snapshot. Replay with scripts/datagolf_stub.py or
+services.datagolf_cassettes.ReplayDataGolfClient.
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.datagolf import DataGolfClient
+from services.http import close_http_clients
+
+logger = logging.getLogger("record_datagolf")
+
+# Reference feeds change rarely; record them once per this many polls
+REFERENCE_EVERY = 12
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cassette_dir", help="Directory to write cassettes into")
+    parser.add_argument("--interval", type=float, default=5.0, help="Minutes between polls (default: 5)")
+    parser.add_argument("--once", action="store_true", help="Record one snapshot and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    client = DataGolfClient(record_dir=args.cassette_dir)
+    live_feeds = [client.get_live_stats, client.get_live_predictions, client.get_field_updates]
+    reference_feeds = [client.get_schedule, client.get_rankings, client.get_player_list]
+
+    poll = 0
+    try:
+        while True:
+            feeds = live_feeds + (reference_feeds if poll % REFERENCE_EVERY == 0 else [])
+            for fetch in feeds:
+                try:
+                    fetch()
+                except Exception as e:
+                    logger.warning(f"{fetch.__name__} failed: {e}")
+            logger.info(f"Recorded {len(feeds)} feeds into {args.cassette_dir}")
+            poll += 1
+            if args.once:
+                break
+            time.sleep(args.interval * 60)
+    except KeyboardInterrupt:
+        logger.info("Recording stopped")
+    finally:
+        close_http_clients()
+
+
+if __name__ == "__main__":
+    main()
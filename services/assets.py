@@ -0,0 +1,121 @@
+"""Fingerprinted, precompressed static assets.
+
+At startup every file under static/ is read once, hashed and compressed:
+
+    static/style.css -> /static/style.3f9a1c0d2b7e.css
+
+Pages link the fingerprinted URL (asset_url), which is served with
+`Cache-Control: public, max-age=31536000, immutable`; a new deploy that
+changes the file changes the URL, so browsers never need to revalidate.
+The plain URL still works but must revalidate (ETag / 304).
+
+Text assets are kept gzip-compressed and, when the optional brotli package is
+installed, brotli-compressed too; the variant is picked from Accept-Encoding.
+"""
+import gzip
+import hashlib
+import importlib.util
+import logging
+import mimetypes
+import os
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR = "static"
+URL_PREFIX = "/static/"
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+
+class Asset:
+    """One static file: bytes, precompressed variants and validators."""
+
+    def __init__(self, name: str, content: bytes):
+        self.name = name
+        self.digest = hashlib.sha256(content).hexdigest()[:12]
+        self.etag = f'"{self.digest}"'
+        self.media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        self.variants = {"identity": content}
+
+        if self.media_type.startswith(COMPRESSIBLE_TYPES):
+            self._add_variant("gzip", gzip.compress(content, compresslevel=9, mtime=0))
+            if importlib.util.find_spec("brotli") is not None:
+                import brotli
+                self._add_variant("br", brotli.compress(content, quality=11))
+
+    def _add_variant(self, encoding: str, data: bytes):
+        if len(data) < len(self.variants["identity"]):
+            self.variants[encoding] = data
+
+    @property
+    def fingerprinted_name(self) -> str:
+        root, ext = os.path.splitext(self.name)
+        return f"{root}.{self.digest}{ext}"
+
+    def pick_encoding(self, accept_encoding: str) -> str:
+        accepted = {part.split(";")[0].strip() for part in accept_encoding.lower().split(",")}
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and encoding in accepted:
+                return encoding
+        return "identity"
+
+
+class AssetManifest:
+    """All static assets, by plain and fingerprinted name."""
+
+    def __init__(self, directory: str = STATIC_DIR):
+        self.directory = directory
+        self._by_name = {}
+        self._by_path = {}
+
+    def build(self):
+        """(Re)read and compress everything under the static directory."""
+        by_name, by_path = {}, {}
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                full_path = os.path.join(root, filename)
+                name = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+                with open(full_path, "rb") as f:
+                    asset = Asset(name, f.read())
+                by_name[name] = asset
+                by_path[name] = (asset, False)
+                by_path[asset.fingerprinted_name] = (asset, True)
+        self._by_name, self._by_path = by_name, by_path
+        logger.info(f"Static assets ready: {', '.join(a.fingerprinted_name for a in by_name.values()) or 'none'}")
+
+    def url(self, name: str) -> str:
+        """Fingerprinted URL for a static file (plain URL if unknown)."""
+        asset = self._by_name.get(name)
+        return URL_PREFIX + (asset.fingerprinted_name if asset else name)
+
+    def response(self, path: str, headers: Headers):
+        """Response for a /static/<path> request, or None if it isn't a known asset."""
+        found = self._by_path.get(path)
+        if found is None:
+            return None
+        asset, fingerprinted = found
+
+        response_headers = {
+            "Cache-Control": IMMUTABLE if fingerprinted else REVALIDATE,
+            "ETag": asset.etag,
+            "Vary": "Accept-Encoding",
+        }
+        if asset.etag in [tag.strip() for tag in headers.get("if-none-match", "").split(",")]:
+            return Response(status_code=304, headers=response_headers)
+
+        encoding = asset.pick_encoding(headers.get("accept-encoding", ""))
+        if encoding != "identity":
+            response_headers["Content-Encoding"] = encoding
+        return Response(asset.variants[encoding], media_type=asset.media_type, headers=response_headers)
+
+
+static_assets = AssetManifest()
+
+
+def asset_url(name: str) -> str:
+    """URL to link a static file with, e.g. asset_url('style.css')."""
+    return static_assets.url(name)
@@ -1,12 +1,55 @@
-"""Authentication service - sessions, password hashing, invites."""
+"""Authentication service - sessions, password hashing, invites.
+
+Two session modes (SESSION_MODE):
+
+  db      the cookie is a random token; each request looks it up in the
+          session table (behind a short-lived per-process cache)
+  signed  the cookie is "<payload>.<hmac>" signed with SECRET_KEY, carrying
+          the session id, user id and expiry. It is checked in
+          memory against a revocation set of logged-out/deleted sessions that
+          is re-read from the session table every
+          SESSION_REVOCATION_REFRESH_SECONDS, so a cached user costs no
+          queries at all. Uses session.revoked_at, which is added on
+          startup (or by migrations/003_add_session_revoked_at). Without
+          a SECRET_KEY set, db mode is used instead.
+"""
+import base64
 import hashlib
+import hmac
+import json
 import secrets
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from config import SESSION_DAYS
+from config import (
+    SECRET_KEY,
+    SESSION_CACHE_SIZE,
+    SESSION_CACHE_TTL_SECONDS,
+    SESSION_DAYS,
+    SESSION_MODE,
+    SESSION_PURGE_BATCH_SIZE,
+    SESSION_REVOCATION_REFRESH_SECONDS,
+)
+from services.settings import settings_service
 
 logger = logging.getLogger(__name__)
 
+# Former built-in SECRET_KEY default; public, so never accepted for signing
+_INSECURE_SECRET_KEYS = {"", "dev-secret-change-in-production"}
+
+
+def _session_mode() -> str:
+    """SESSION_MODE, or "db" if signed cookies would be signed with a known key."""
+    if SESSION_MODE == "signed" and SECRET_KEY in _INSECURE_SECRET_KEYS:
+        logger.error("SESSION_MODE=signed requires SECRET_KEY to be set to a random value; using db sessions")
+        return "db"
+    return SESSION_MODE
+
+
+session_mode = _session_mode()
+
 
 def hash_password(password: str) -> str:
     """Hash password with SHA-256 and random salt."""
@@ -48,6 +91,168 @@ def is_session_valid(expires_at: str) -> bool:
         return False
 
 
+class SessionCache:
+    """Bounded LRU of session token -> (user, session expiry).
+
+    Entries are trusted for at most ttl_seconds, so a change made by another
+    process (logout, deletion, admin flag) is picked up within that window;
+    changes made in this process invalidate the affected entries immediately.
+    """
+
+    def __init__(self, max_size: int = SESSION_CACHE_SIZE, ttl_seconds: float = SESSION_CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str):
+        """Cached user for a token, or None if absent, stale or expired."""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            user, expires_at, cached_at = entry
+            if time.monotonic() - cached_at > self.ttl_seconds or datetime.now() >= expires_at:
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return user
+
+    def put(self, token: str, user, expires_at: datetime):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[token] = (user, expires_at, time.monotonic())
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_token(self, token: str):
+        with self._lock:
+            self._entries.pop(token, None)
+
+    def invalidate_user(self, user_id: int):
+        """Drop every cached session belonging to a user."""
+        with self._lock:
+            for token in [t for t, (user, _, _) in self._entries.items() if user.id == user_id]:
+                del self._entries[token]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+session_cache = SessionCache()
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _signature(payload: str) -> str:
+    return _b64encode(hmac.new(SECRET_KEY.encode(), payload.encode(), hashlib.sha256).digest())
+
+
+def sign_session_token(session_id: int, user_id: int, expires_at: datetime) -> str:
+    """Build a signed session cookie value."""
+    payload = _b64encode(json.dumps(
+        {"sid": session_id, "uid": user_id, "exp": int(expires_at.timestamp())},
+        separators=(",", ":")
+    ).encode())
+    return f"{payload}.{_signature(payload)}"
+
+
+def read_session_token(token: str):
+    """Payload dict of a signed session cookie, or None if forged, malformed or expired."""
+    payload, _, signature = (token or "").partition(".")
+    if not payload or not signature or not hmac.compare_digest(signature, _signature(payload)):
+        return None
+    try:
+        claims = json.loads(_b64decode(payload))
+        if time.time() >= claims["exp"]:
+            return None
+        return claims
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+class RevocationList:
+    """Ids of revoked, not yet expired sessions, re-read periodically.
+
+    Revocations made in this process apply immediately; those made elsewhere
+    within refresh_seconds.
+    """
+
+    def __init__(self, refresh_seconds: float = SESSION_REVOCATION_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._ids = set()
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def is_revoked(self, db, session_id: int) -> bool:
+        with self._lock:
+            due = self._loaded_at is None or time.monotonic() - self._loaded_at > self.refresh_seconds
+        if due:
+            self._refresh(db)
+        with self._lock:
+            return session_id in self._ids
+
+    def add(self, session_ids):
+        with self._lock:
+            self._ids.update(session_ids)
+
+    def _refresh(self, db):
+        from sqlalchemy import text
+
+        try:
+            with db.db.engine.connect() as conn:
+                ids = {row[0] for row in conn.execute(
+                    text("SELECT id FROM session WHERE revoked_at IS NOT NULL AND expires_at > :now"),
+                    {"now": datetime.now().isoformat()}
+                )}
+        except Exception as e:
+            # Keep serving the last known set rather than logging everyone out
+            logger.error(f"Failed to refresh session revocations: {e}")
+            ids = None
+        with self._lock:
+            if ids is not None:
+                self._ids = ids
+            self._loaded_at = time.monotonic()
+
+
+revocations = RevocationList()
+
+
+def purge_expired_sessions(db, batch_size: int = SESSION_PURGE_BATCH_SIZE) -> int:
+    """Delete expired sessions in batches of batch_size. Returns rows deleted.
+
+    Each batch is its own short transaction, picked through the expires_at
+    index, so a large backlog never holds a long lock. Revoked sessions are
+    kept until they expire: the revocation list needs them until then.
+    """
+    from sqlalchemy import text
+
+    now = datetime.now().isoformat()
+    deleted = 0
+    while True:
+        with db.db.engine.begin() as conn:
+            result = conn.execute(
+                text("""
+                    DELETE FROM session WHERE id IN (
+                        SELECT id FROM session WHERE expires_at < :now LIMIT :limit
+                    )
+                """),
+                {"now": now, "limit": batch_size}
+            )
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
+
+
 class AuthService:
     """Authentication service for user management."""
 
@@ -56,27 +261,19 @@ class AuthService:
 
     def get_invite_secret(self) -> str:
         """Get current invite secret, create if doesn't exist."""
-        settings = list(self.db.app_settings())
-        for s in settings:
-            if s.key == 'invite_secret':
-                return s.value
+        secret = settings_service.invite_secret(self.db)
+        if secret:
+            return secret
 
         # Create new invite secret
         secret = generate_invite_secret()
-        self.db.app_settings.insert(key='invite_secret', value=secret)
+        settings_service.set(self.db, 'invite_secret', secret)
         return secret
 
     def reset_invite_secret(self) -> str:
         """Generate and save new invite secret."""
         new_secret = generate_invite_secret()
-        settings = list(self.db.app_settings())
-        for s in settings:
-            if s.key == 'invite_secret':
-                self.db.app_settings.update(id=s.id, value=new_secret)
-                return new_secret
-
-        # Create if doesn't exist
-        self.db.app_settings.insert(key='invite_secret', value=new_secret)
+        settings_service.set(self.db, 'invite_secret', new_secret)
         return new_secret
 
     def validate_invite(self, provided_secret: str) -> bool:
@@ -135,15 +332,18 @@ class AuthService:
         # Create session
         logger.info(f"Login successful for user '{groupme_name}' (id={user.id})")
         token = generate_session_token()
-        
+        expires_at = get_session_expiry()
+
         try:
-            self.db.sessions.insert(
+            session = self.db.sessions.insert(
                 user_id=user.id,
                 token=token,
-                expires_at=get_session_expiry(),
+                expires_at=expires_at,
                 created_at=datetime.now().isoformat()
             )
             logger.debug(f"Session created successfully for user {user.id}")
+            if session_mode == "signed":
+                token = sign_session_token(session.id, user.id, datetime.fromisoformat(expires_at))
         except Exception as e:
             logger.error(f"Failed to create session: {e}", exc_info=True)
             return None, "Login failed. Please try again."
@@ -155,21 +355,107 @@ class AuthService:
         if not token:
             return None
 
-        sessions = [s for s in self.db.sessions() if s.token == token]
-        if not sessions:
+        user = session_cache.get(token)
+        if user is not None:
+            if session_mode != "signed" or "." not in token:
+                return user
+            claims = read_session_token(token)
+            if claims and not revocations.is_revoked(self.db, claims["sid"]):
+                return user
+            session_cache.invalidate_token(token)
+            return None
+
+        if session_mode == "signed" and "." in token:
+            return self._get_user_from_signed_token(token)
+
+        from sqlalchemy import text
+        from db.models import User
+
+        # One indexed lookup (idx_session_token) joined to the owning user
+        with self.db.db.engine.connect() as conn:
+            row = conn.execute(
+                text("""
+                    SELECT s.id AS session_id, s.expires_at AS session_expires_at,
+                           u.id, u.username, u.password_hash, u.display_name,
+                           u.groupme_name, u.is_admin, u.created_at
+                    FROM session s JOIN "user" u ON u.id = s.user_id
+                    WHERE s.token = :token
+                """),
+                {"token": token}
+            ).mappings().first()
+        if row is None:
             return None
 
-        session = sessions[0]
-        if not is_session_valid(session.expires_at):
+        if not is_session_valid(row["session_expires_at"]):
             # Clean up expired session
-            self.db.sessions.delete(session.id)
+            self.db.sessions.delete(row["session_id"])
+            return None
+
+        user = User(**{k: v for k, v in row.items() if not k.startswith("session_")})
+        session_cache.put(token, user, datetime.fromisoformat(row["session_expires_at"]))
+        return user
+
+    def _get_user_from_signed_token(self, token: str):
+        """Validate a signed cookie in memory; only an uncached user costs a query."""
+        from sqlalchemy import text
+        from db.models import User
+
+        claims = read_session_token(token)
+        if not claims or revocations.is_revoked(self.db, claims["sid"]):
+            return None
+
+        with self.db.db.engine.connect() as conn:
+            row = conn.execute(
+                text('SELECT id, username, password_hash, display_name, groupme_name, is_admin, created_at '
+                     'FROM "user" WHERE id = :id'),
+                {"id": claims["uid"]}
+            ).mappings().first()
+        if row is None:
             return None
 
-        users = [u for u in self.db.users() if u.id == session.user_id]
-        return users[0] if users else None
+        user = User(**row)
+        session_cache.put(token, user, datetime.fromtimestamp(claims["exp"]))
+        return user
+
+    def invalidate_user(self, user_id: int):
+        """Forget cached sessions for a user after it is changed or deleted."""
+        session_cache.invalidate_user(user_id)
+
+    def revoke_user_sessions(self, user_id: int):
+        """End every session of a user (e.g. before deleting it)."""
+        from sqlalchemy import text
+
+        with self.db.db.engine.begin() as conn:
+            if session_mode == "signed":
+                # Signed cookies stay valid until expiry unless marked revoked
+                ids = [row[0] for row in conn.execute(
+                    text("SELECT id FROM session WHERE user_id = :uid AND revoked_at IS NULL"),
+                    {"uid": user_id}
+                )]
+                conn.execute(
+                    text("UPDATE session SET revoked_at = :now WHERE user_id = :uid AND revoked_at IS NULL"),
+                    {"uid": user_id, "now": datetime.now().isoformat()}
+                )
+                revocations.add(ids)
+            else:
+                conn.execute(text("DELETE FROM session WHERE user_id = :uid"), {"uid": user_id})
+        session_cache.invalidate_user(user_id)
 
     def logout(self, token: str):
-        """Delete session."""
-        sessions = [s for s in self.db.sessions() if s.token == token]
-        for session in sessions:
-            self.db.sessions.delete(session.id)
+        """End a session: delete it, or for a signed cookie mark it revoked."""
+        from sqlalchemy import text
+
+        session_cache.invalidate_token(token)
+        if session_mode == "signed" and "." in token:
+            claims = read_session_token(token)
+            if claims:
+                with self.db.db.engine.begin() as conn:
+                    conn.execute(
+                        text("UPDATE session SET revoked_at = :now WHERE id = :sid"),
+                        {"sid": claims["sid"], "now": datetime.now().isoformat()}
+                    )
+                revocations.add([claims["sid"]])
+            return
+
+        with self.db.db.engine.begin() as conn:
+            conn.execute(text("DELETE FROM session WHERE token = :token"), {"token": token})
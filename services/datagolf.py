@@ -1,24 +1,34 @@
 """DataGolf API client."""
-import httpx
-from config import DATAGOLF_API_KEY
+from config import DATAGOLF_API_KEY, DATAGOLF_BASE_URL, DATAGOLF_RECORD_DIR
+from services.http import get_http_client
 
 
 class DataGolfClient:
     """Client for DataGolf API."""
 
-    BASE_URL = "https://feeds.datagolf.com"
+    BASE_URL = DATAGOLF_BASE_URL
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, record_dir: str = None):
         self.api_key = api_key or DATAGOLF_API_KEY
-        self._client = httpx.Client(timeout=30.0)
+        self._client = get_http_client("datagolf", timeout=30.0)
+
+        # Optionally save every response as a cassette for offline replay
+        self._recorder = None
+        record_dir = record_dir or DATAGOLF_RECORD_DIR
+        if record_dir:
+            from services.datagolf_cassettes import CassetteRecorder
+            self._recorder = CassetteRecorder(record_dir)
 
     def _get(self, endpoint: str, params: dict = None) -> dict:
         """Make authenticated GET request."""
-        params = params or {}
-        params["key"] = self.api_key
-        response = self._client.get(f"{self.BASE_URL}/{endpoint}", params=params)
+        params = dict(params or {})
+        query = {**params, "key": self.api_key}
+        response = self._client.get(f"{self.BASE_URL}/{endpoint}", params=query)
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+        if self._recorder:
+            self._recorder.record(endpoint, params, data)
+        return data
 
     def get_schedule(self, tour: str = "pga") -> list:
         """Get tour schedule."""
@@ -0,0 +1,136 @@
+"""Record and replay DataGolf API responses.
+
+A cassette is one JSON file per API response, named by the time it was
+recorded:
+
+    {cassette_dir}/20260410T143012.512345_preds-live-tournament-stats.json
+
+    {"recorded_at": "...", "endpoint": "...", "params": {...}, "body": ...}
+
+CassetteRecorder writes them (DataGolfClient uses it when DATAGOLF_RECORD_DIR
+is set). CassettePlayer plays a directory back on a virtual clock that can run
+faster than real time, so a whole tournament week can be replayed in minutes.
+ReplayDataGolfClient serves the player in-process; scripts/datagolf_stub.py
+serves it over HTTP for anything that talks to DATAGOLF_BASE_URL.
+"""
+import bisect
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from services.datagolf import DataGolfClient
+
+logger = logging.getLogger(__name__)
+
+
+def _params_key(endpoint: str, params: dict) -> tuple:
+    """Lookup key for a request, ignoring the API key."""
+    clean = {k: str(v) for k, v in (params or {}).items() if k != "key"}
+    return endpoint.strip("/"), json.dumps(clean, sort_keys=True)
+
+
+class CassetteRecorder:
+    """Save DataGolf responses as timestamped cassette files."""
+
+    def __init__(self, cassette_dir):
+        self.cassette_dir = Path(cassette_dir)
+        self.cassette_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, params: dict, body) -> Path:
+        """Write one response. Never raises; a failed write is only logged."""
+        recorded_at = datetime.now()
+        slug = endpoint.strip("/").replace("/", "-")
+        path = self.cassette_dir / f"{recorded_at.strftime('%Y%m%dT%H%M%S.%f')}_{slug}.json"
+        cassette = {
+            "recorded_at": recorded_at.isoformat(),
+            "endpoint": endpoint.strip("/"),
+            "params": {k: v for k, v in (params or {}).items() if k != "key"},
+            "body": body,
+        }
+        try:
+            with self._lock:
+                path.write_text(json.dumps(cassette))
+        except Exception as e:
+            logger.warning(f"Failed to record DataGolf cassette {path.name}: {e}")
+        return path
+
+
+class CassettePlayer:
+    """Play back a cassette directory on an accelerated virtual clock.
+
+    The virtual clock starts at `start` (default: the earliest recording) when
+    the player is created and advances `speed` times faster than wall time.
+    Each request gets the latest response recorded at or before the virtual
+    time, or the earliest one if the clock hasn't reached any recording yet.
+    """
+
+    def __init__(self, cassette_dir, speed: float = 1.0, start: datetime = None):
+        self.cassette_dir = Path(cassette_dir)
+        self.speed = speed
+        self._tapes = {}  # (endpoint, params) -> ([recorded_at], [body])
+
+        recordings = []
+        for path in sorted(self.cassette_dir.glob("*.json")):
+            try:
+                cassette = json.loads(path.read_text())
+                recorded_at = datetime.fromisoformat(cassette["recorded_at"])
+            except Exception as e:
+                logger.warning(f"Skipping unreadable cassette {path.name}: {e}")
+                continue
+            key = _params_key(cassette["endpoint"], cassette.get("params"))
+            recordings.append((recorded_at, key, cassette["body"]))
+
+        if not recordings:
+            raise ValueError(f"No cassettes found in {self.cassette_dir}")
+
+        recordings.sort(key=lambda r: r[0])
+        for recorded_at, key, body in recordings:
+            times, bodies = self._tapes.setdefault(key, ([], []))
+            times.append(recorded_at)
+            bodies.append(body)
+
+        self.first_recorded_at = recordings[0][0]
+        self.last_recorded_at = recordings[-1][0]
+        self._virtual_start = start or self.first_recorded_at
+        self._wall_start = time.monotonic()
+        logger.info(
+            f"Loaded {len(recordings)} cassettes for {len(self._tapes)} endpoints "
+            f"({self.first_recorded_at} to {self.last_recorded_at}) at {speed}x"
+        )
+
+    def now(self) -> datetime:
+        """Current virtual time."""
+        elapsed = (time.monotonic() - self._wall_start) * self.speed
+        return self._virtual_start + timedelta(seconds=elapsed)
+
+    def finished(self) -> bool:
+        """True once the virtual clock has passed the last recording."""
+        return self.now() >= self.last_recorded_at
+
+    def response_for(self, endpoint: str, params: dict = None):
+        """Recorded body for a request at the current virtual time.
+
+        Raises:
+            KeyError: if nothing was recorded for this endpoint and params.
+        """
+        key = _params_key(endpoint, params)
+        if key not in self._tapes:
+            raise KeyError(f"No cassette for {key[0]} {key[1]}")
+        times, bodies = self._tapes[key]
+        idx = bisect.bisect_right(times, self.now()) - 1
+        return bodies[max(idx, 0)]
+
+
+class ReplayDataGolfClient(DataGolfClient):
+    """Drop-in DataGolfClient that serves responses from cassettes instead of the API."""
+
+    def __init__(self, cassette_dir, speed: float = 1.0, start: datetime = None):
+        self.player = CassettePlayer(cassette_dir, speed=speed, start=start)
+
+    def _get(self, endpoint: str, params: dict = None):
+        """Serve the recorded response for the current virtual time."""
+        return self.player.response_for(endpoint, params)
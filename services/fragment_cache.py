@@ -0,0 +1,73 @@
+"""Rendered-HTML cache for expensive page fragments.
+
+The leaderboard tables are rebuilt from hundreds of FT objects on every view
+even though they only change when a sync or a pick recalculates standings.
+leaderboard_fragments keeps the serialized HTML keyed by
+
+    (tournament_id, view, tournament.standings_version, tournament.status)
+
+standings_version is bumped in the database whenever standings are
+recalculated (services/scoring.py), so a sync in the ETL runner changes the key
+seen by every web worker; old entries simply age out of the LRU. Anything
+per-user (the current-user highlight) is applied after the cache.
+"""
+import logging
+import threading
+from collections import OrderedDict
+
+from fasthtml.common import to_xml
+
+from config import FRAGMENT_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class FragmentCache:
+    """Bounded LRU of key -> rendered HTML, with hit/miss counters."""
+
+    def __init__(self, max_entries: int = FRAGMENT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_render(self, key: tuple, render) -> str:
+        """HTML for key, calling render() (which returns FT) on a miss."""
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return html
+            self._misses += 1
+
+        html = to_xml(render())
+        with self._lock:
+            self._entries[key] = html
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return html
+
+    def invalidate(self, tournament_id: int = None):
+        """Drop entries for one tournament (keys start with its id), or all."""
+        with self._lock:
+            if tournament_id is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == tournament_id]:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        """Snapshot: entries, hits, misses, hit_rate (0-1)."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+            }
+
+
+leaderboard_fragments = FragmentCache()
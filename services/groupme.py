@@ -1,11 +1,87 @@
 """GroupMe API client for bot messaging and member verification."""
-import httpx
 import logging
+import threading
+import time
 from typing import Optional
 
+from config import GROUPME_MEMBER_CACHE_SECONDS, GROUPME_MEMBER_MISS_REFRESH_SECONDS
+from services.http import get_http_client
+
 logger = logging.getLogger(__name__)
 
 
+class _MemberDirectory:
+    """Cached, case-folded nickname index of one GroupMe group's members.
+
+    Lookups are set membership checks. The member list is fetched once, then
+    refreshed in a background thread when older than the TTL (callers keep
+    getting the previous list meanwhile). A name that isn't found triggers a
+    synchronous re-fetch, at most once per miss-refresh interval, so someone
+    who just joined the group can register straight away while a burst of
+    sign-ups still costs only a handful of API calls.
+    """
+
+    def __init__(self, fetch, ttl_seconds: float, miss_refresh_seconds: float):
+        self._fetch = fetch  # () -> list of nicknames; raises on failure
+        self.ttl_seconds = ttl_seconds
+        self.miss_refresh_seconds = miss_refresh_seconds
+        self._nicknames = None
+        self._fetched_at = 0.0
+        self._generation = 0
+        self._fetch_lock = threading.Lock()
+        self._refreshing = False
+
+    def _refresh(self):
+        """Fetch the member list (single-flight). Keeps the old index on failure."""
+        generation = self._generation
+        try:
+            with self._fetch_lock:
+                if self._generation != generation:
+                    return  # Another caller fetched while we waited
+                started = time.monotonic()
+                try:
+                    nicknames = {name.casefold() for name in self._fetch() if name}
+                except Exception as e:
+                    logger.error(f"Failed to fetch GroupMe members: {e}")
+                    return
+                self._nicknames = nicknames
+                self._fetched_at = started
+                self._generation += 1
+                logger.info(f"Cached {len(nicknames)} GroupMe member nicknames")
+        finally:
+            # On every path, or no background refresh would ever start again
+            self._refreshing = False
+
+    def _refresh_in_background(self):
+        if self._refreshing:
+            return
+        self._refreshing = True
+        threading.Thread(target=self._refresh, name="groupme-members", daemon=True).start()
+
+    def contains(self, nickname: str) -> Optional[bool]:
+        """True/False for a nickname, or None if the member list can't be fetched."""
+        key = nickname.casefold()
+        age = time.monotonic() - self._fetched_at
+
+        if self._nicknames is None:
+            self._refresh()
+            if self._nicknames is None:
+                return None
+        elif age > self.ttl_seconds:
+            self._refresh_in_background()
+
+        if key in self._nicknames:
+            return True
+
+        if time.monotonic() - self._fetched_at > self.miss_refresh_seconds:
+            self._refresh()
+        return key in self._nicknames
+
+
+_directories = {}
+_directories_lock = threading.Lock()
+
+
 class GroupMeClient:
     """Client for GroupMe API."""
 
@@ -22,10 +98,8 @@ class GroupMeClient:
         # Check app_settings first if db_module provided
         if db_module:
             try:
-                for setting in db_module.app_settings():
-                    if setting.key == 'groupme_bot_id':
-                        bot_id = setting.value
-                        break
+                from services.settings import settings_service
+                bot_id = settings_service.groupme_bot_id(db_module) or bot_id
             except Exception as e:
                 logger.warning(f"Failed to fetch bot_id from app_settings: {e}")
 
@@ -52,9 +126,8 @@ class GroupMeClient:
         try:
             url = f"{self.BASE_URL}/bots/post"
             payload = {"text": text, "bot_id": self.bot_id}
-            with httpx.Client(timeout=self.TIMEOUT) as client:
-                response = client.post(url, json=payload)
-                response.raise_for_status()
+            response = get_http_client("groupme", timeout=self.TIMEOUT).post(url, json=payload)
+            response.raise_for_status()
             logger.info(f"GroupMe message sent: {text[:50]}...")
             return True
         except Exception as e:
@@ -64,6 +137,9 @@ class GroupMeClient:
     def verify_member(self, groupme_name: str, group_id: str, access_token: str) -> bool:
         """Verify if a user is a member of the group.
 
+        Checks a cached nickname index (see _MemberDirectory) rather than
+        fetching the group on every call. Matching is case-insensitive.
+
         Args:
             groupme_name: User's GroupMe display name
             group_id: GroupMe group ID
@@ -76,24 +152,31 @@ class GroupMeClient:
             logger.warning("GroupMe access_token or group_id not configured, skipping verification")
             return True  # Allow registration to proceed
 
-        try:
-            url = f"{self.BASE_URL}/groups/{group_id}"
-            headers = {"X-Access-Token": access_token}
-            with httpx.Client(timeout=self.TIMEOUT) as client:
-                response = client.get(url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-
-            members = data.get("response", {}).get("members", [])
-
-            # Check if groupme_name matches any member's nickname
-            for member in members:
-                if member.get("nickname", "").lower() == groupme_name.lower():
-                    logger.info(f"GroupMe member verified: {groupme_name}")
-                    return True
-
-            logger.warning(f"GroupMe member not found: {groupme_name}")
-            return False
-        except Exception as e:
-            logger.error(f"Failed to verify GroupMe member: {e}")
+        directory = self._member_directory(group_id, access_token)
+        is_member = directory.contains(groupme_name)
+        if is_member is None:
             return True  # Don't block registration on verification failure
+        if is_member:
+            logger.info(f"GroupMe member verified: {groupme_name}")
+        else:
+            logger.warning(f"GroupMe member not found: {groupme_name}")
+        return is_member
+
+    def _member_directory(self, group_id: str, access_token: str) -> _MemberDirectory:
+        """Shared member directory for a group, created on first use."""
+        with _directories_lock:
+            directory = _directories.get(group_id)
+            if directory is None:
+                def fetch():
+                    url = f"{self.BASE_URL}/groups/{group_id}"
+                    headers = {"X-Access-Token": access_token}
+                    response = get_http_client("groupme", timeout=self.TIMEOUT).get(url, headers=headers)
+                    response.raise_for_status()
+                    members = response.json().get("response", {}).get("members", [])
+                    return [member.get("nickname", "") for member in members]
+
+                directory = _MemberDirectory(
+                    fetch, GROUPME_MEMBER_CACHE_SECONDS, GROUPME_MEMBER_MISS_REFRESH_SECONDS
+                )
+                _directories[group_id] = directory
+            return directory
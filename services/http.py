@@ -0,0 +1,134 @@
+"""Shared HTTP clients for outbound API calls (DataGolf, GroupMe).
+
+One pooled httpx.Client per named upstream is kept for the life of the
+process, so requests reuse kept-alive TCP/TLS connections instead of paying
+a new handshake each time. Per-host request counts, errors and latency are
+recorded for the admin metrics page.
+"""
+import importlib.util
+import logging
+import threading
+import time
+
+import httpx
+
+from config import (
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP2_ENABLED,
+)
+
+logger = logging.getLogger(__name__)
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+_metrics = {}
+_metrics_lock = threading.Lock()
+
+
+def _record(host: str, elapsed: float, error: str = None):
+    """Record one request against a host."""
+    with _metrics_lock:
+        m = _metrics.setdefault(host, {
+            'requests': 0,
+            'errors': 0,
+            'total_ms': 0.0,
+            'max_ms': 0.0,
+            'last_error': None,
+        })
+        elapsed_ms = elapsed * 1000
+        m['requests'] += 1
+        m['total_ms'] += elapsed_ms
+        m['max_ms'] = max(m['max_ms'], elapsed_ms)
+        if error:
+            m['errors'] += 1
+            m['last_error'] = error
+
+
+class _MetricsTransport(httpx.BaseTransport):
+    """Transport wrapper that times each request and counts failures."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        start = time.perf_counter()
+        try:
+            response = self._transport.handle_request(request)
+        except Exception as e:
+            _record(host, time.perf_counter() - start, error=type(e).__name__)
+            raise
+        error = f"HTTP {response.status_code}" if response.status_code >= 400 else None
+        _record(host, time.perf_counter() - start, error=error)
+        return response
+
+    def close(self):
+        self._transport.close()
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package."""
+    if not HTTP2_ENABLED:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP2_ENABLED is set but the h2 package is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+def get_http_client(name: str, timeout: float = 30.0) -> httpx.Client:
+    """Get the shared pooled client for a named upstream, creating it if needed.
+
+    The client is thread-safe and must not be closed by callers; use
+    close_http_clients() on process exit.
+    """
+    client = _clients.get(name)
+    if client is not None and not client.is_closed:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(name)
+        if client is None or client.is_closed:
+            limits = httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            )
+            http2 = _http2_available()
+            transport = _MetricsTransport(httpx.HTTPTransport(limits=limits, http2=http2))
+            client = httpx.Client(timeout=timeout, transport=transport)
+            _clients[name] = client
+            logger.info(f"Created shared HTTP client '{name}' (http2={http2})")
+        return client
+
+
+def close_http_clients():
+    """Close all shared clients and their pooled connections."""
+    with _clients_lock:
+        for name, client in _clients.items():
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client '{name}': {e}")
+        _clients.clear()
+
+
+def get_http_metrics() -> dict:
+    """Snapshot of per-host request metrics.
+
+    Returns dict of host -> {requests, errors, avg_ms, max_ms, last_error}.
+    """
+    with _metrics_lock:
+        return {
+            host: {
+                'requests': m['requests'],
+                'errors': m['errors'],
+                'avg_ms': m['total_ms'] / m['requests'] if m['requests'] else 0.0,
+                'max_ms': m['max_ms'],
+                'last_error': m['last_error'],
+            }
+            for host, m in _metrics.items()
+        }
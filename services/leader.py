@@ -0,0 +1,138 @@
+"""Lease-based leader election for scheduled jobs.
+
+Every web worker starts a BackgroundScheduler and the standalone ETL runner
+schedules the same tournament jobs, so without coordination each job runs
+once per process. Each job instead takes a named lease (a row in
+scheduler_lease) before doing any work:
+
+  - acquire_lease() claims the row if it is free, expired, or already ours,
+    with a single conditional UPDATE so two processes can't both win
+  - renew_leases() runs on a short interval in every process and extends the
+    leases this process holds, so the holder stays leader between runs
+  - a holder that dies stops heartbeating; its leases expire after
+    LEASE_TTL_SECONDS and the next process to run the job takes over
+
+A DB row (rather than a PostgreSQL advisory lock) works on SQLite too and
+lets the admin metrics page show who holds what.
+"""
+import logging
+import os
+import socket
+import threading
+from datetime import datetime, timedelta, timezone
+
+from config import LEASE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Identifies this process in scheduler_lease.holder
+HOLDER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+_held = set()
+_held_lock = threading.Lock()
+
+
+def _timestamp(dt: datetime) -> str:
+    """Fixed-width UTC timestamp so string comparison orders correctly."""
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+
+def acquire_lease(db, name: str, ttl_seconds: int = None) -> bool:
+    """Try to become (or stay) the holder of a lease. Returns True if held."""
+    from sqlalchemy import text
+
+    now = datetime.now(timezone.utc)
+    params = {
+        "name": name,
+        "holder": HOLDER_ID,
+        "now": _timestamp(now),
+        "expires": _timestamp(now + timedelta(seconds=ttl_seconds or LEASE_TTL_SECONDS)),
+    }
+
+    try:
+        with db.db.engine.begin() as conn:
+            conn.execute(
+                text("""
+                    INSERT INTO scheduler_lease (name, holder, acquired_at, heartbeat_at, expires_at)
+                    VALUES (:name, NULL, NULL, NULL, :now)
+                    ON CONFLICT (name) DO NOTHING
+                """),
+                params
+            )
+            result = conn.execute(
+                text("""
+                    UPDATE scheduler_lease SET
+                        acquired_at = CASE WHEN holder = :holder THEN acquired_at ELSE :now END,
+                        holder = :holder,
+                        heartbeat_at = :now,
+                        expires_at = :expires
+                    WHERE name = :name
+                      AND (holder = :holder OR holder IS NULL OR expires_at < :now)
+                """),
+                params
+            )
+            acquired = result.rowcount == 1
+    except Exception as e:
+        logger.error(f"Lease check for '{name}' failed: {e}", exc_info=True)
+        return False
+
+    with _held_lock:
+        if acquired and name not in _held:
+            logger.info(f"Acquired lease '{name}' as {HOLDER_ID}")
+            _held.add(name)
+        elif not acquired and name in _held:
+            logger.warning(f"Lost lease '{name}'")
+            _held.discard(name)
+    return acquired
+
+
+def renew_leases(db):
+    """Heartbeat: extend every lease this process holds."""
+    with _held_lock:
+        names = list(_held)
+    for name in names:
+        acquire_lease(db, name)
+
+
+def release_leases(db):
+    """Give up every lease this process holds, e.g. on shutdown."""
+    from sqlalchemy import text
+
+    with _held_lock:
+        names = list(_held)
+        _held.clear()
+    if not names:
+        return
+    try:
+        with db.db.engine.begin() as conn:
+            for name in names:
+                conn.execute(
+                    text("UPDATE scheduler_lease SET holder = NULL WHERE name = :name AND holder = :holder"),
+                    {"name": name, "holder": HOLDER_ID}
+                )
+        logger.info(f"Released leases: {', '.join(sorted(names))}")
+    except Exception as e:
+        logger.warning(f"Failed to release leases: {e}")
+
+
+def get_leases(db) -> list:
+    """All leases for display: dicts with name, holder, timestamps, 'expired' and 'mine'."""
+    from sqlalchemy import text
+
+    now = _timestamp(datetime.now(timezone.utc))
+    with db.db.engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT name, holder, acquired_at, heartbeat_at, expires_at FROM scheduler_lease ORDER BY name"
+        )).fetchall()
+    return [
+        {
+            "name": name,
+            "holder": holder,
+            "acquired_at": acquired_at,
+            "heartbeat_at": heartbeat_at,
+            "expires_at": expires_at,
+            "expired": holder is None or (expires_at or "") < now,
+            "mine": holder == HOLDER_ID,
+        }
+        for name, holder, acquired_at, heartbeat_at, expires_at in rows
+    ]
@@ -0,0 +1,152 @@
+"""Server-Sent Events fan-out of live leaderboard changes.
+
+Open leaderboard pages subscribe to /leaderboard/stream for one tournament.
+Each connection is an async generator waiting on its own small queue, so
+hundreds of idle viewers cost no threads and no queries.
+
+Standings are recalculated wherever a sync runs (the ETL runner, an admin
+refresh, a page's auto-sync). Each recalculation bumps
+tournament.standings_version and stamps changed rows with it (see
+services/scoring.py). In every web worker, publish_standings_changes runs on a
+short interval. For tournaments that have subscribers it reads the version
+once, renders the changed rows once, and pushes the same event to every
+subscriber:
+
+    id: 42
+    event: standings
+    data: {"version": 42, "rows": "<tr ...>...</tr>", "total": 312}
+
+A "reload" event tells pages to reload (the tournament finished, or the client
+fell too far behind). Comment lines are sent as heartbeats, and clients
+reconnect with Last-Event-ID to catch up on what they missed.
+"""
+import asyncio
+import json
+import logging
+import threading
+
+from config import LIVE_QUEUE_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def format_event(event: str, data: dict = None, event_id=None) -> str:
+    """One SSE message."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data or {}, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+class LiveHub:
+    """Per-tournament subscriber queues; publish() is safe to call from any thread."""
+
+    def __init__(self, queue_size: int = LIVE_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers = {}  # tournament_id -> {queue: loop}
+        self._lock = threading.Lock()
+
+    def subscribe(self, tournament_id: int) -> asyncio.Queue:
+        """Register a connection (call from the event loop)."""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(tournament_id, {})[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, tournament_id: int, queue: asyncio.Queue):
+        with self._lock:
+            subscribers = self._subscribers.get(tournament_id, {})
+            subscribers.pop(queue, None)
+            if not subscribers:
+                self._subscribers.pop(tournament_id, None)
+
+    def tournament_ids(self) -> list:
+        """Tournaments that currently have at least one subscriber."""
+        with self._lock:
+            return list(self._subscribers)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def publish(self, tournament_id: int, message: str):
+        """Queue an already formatted SSE message for every subscriber of a tournament."""
+        with self._lock:
+            targets = list(self._subscribers.get(tournament_id, {}).items())
+        for queue, loop in targets:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, message)
+            except RuntimeError:
+                # Loop closed (worker shutting down)
+                pass
+
+    @staticmethod
+    def _deliver(queue: asyncio.Queue, message: str):
+        if queue.full():
+            # Slow client: drop its backlog and have it reload instead
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(format_event("reload"))
+            return
+        queue.put_nowait(message)
+
+
+live_hub = LiveHub()
+
+# tournament_id -> last standings_version published by this process
+_published = {}
+
+
+def watch(tournament_id: int, version: int):
+    """Note the version a new subscriber has caught up to, if nothing was published yet."""
+    _published.setdefault(tournament_id, version)
+
+
+def publish_standings_changes(db_module):
+    """Push rows changed since the last run to subscribers of each watched tournament."""
+    from sqlalchemy import text
+    from routes.leaderboard import render_changed_rows
+    from services.scoring import supports_row_versions
+
+    tournament_ids = live_hub.tournament_ids()
+    for tournament_id in list(_published):
+        if tournament_id not in tournament_ids:
+            del _published[tournament_id]
+    if not tournament_ids or not supports_row_versions(db_module):
+        return
+
+    try:
+        params = {f"id_{i}": t for i, t in enumerate(tournament_ids)}
+        with db_module.db.engine.connect() as conn:
+            rows = conn.execute(
+                text(f"SELECT id, status, standings_version FROM tournament "
+                     f"WHERE id IN ({', '.join(':' + k for k in params)})"),
+                params
+            ).fetchall()
+    except Exception as e:
+        logger.error(f"Live update check failed: {e}")
+        return
+
+    for tournament_id, status, version in rows:
+        if version is None:
+            continue
+        last = _published.get(tournament_id)
+        _published[tournament_id] = version
+        if last is None or version == last:
+            # Nothing new (or first look: subscribers caught up when they connected)
+            continue
+        if status != 'active':
+            live_hub.publish(tournament_id, format_event("reload", event_id=version))
+            continue
+        try:
+            html, total = render_changed_rows(db_module, db_module.tournaments[tournament_id], last)
+        except Exception as e:
+            logger.error(f"Failed to render live rows for tournament {tournament_id}: {e}", exc_info=True)
+            continue
+        live_hub.publish(
+            tournament_id,
+            format_event("standings", {"version": version, "rows": html, "total": total}, event_id=version)
+        )
+        logger.debug(f"Published standings v{version} for tournament {tournament_id}")
@@ -0,0 +1,285 @@
+"""Notification outbox: queue GroupMe messages and send them in the background.
+
+Routes don't talk to GroupMe directly for pick notifications. They call
+enqueue_pick_notification() on the same connection/transaction that writes
+the pick, so the notification exists if and only if the pick does. The
+dispatcher (dispatch_notifications, run by the notification job) renders and
+sends pending rows, retrying failures with exponential backoff:
+
+    attempt n fails -> next try after NOTIFY_BACKOFF_SECONDS * 2**(n-1),
+                       capped at NOTIFY_BACKOFF_MAX_SECONDS
+    NOTIFY_MAX_ATTEMPTS failures -> status 'failed' (kept for inspection)
+
+A GroupMe outage therefore delays messages instead of losing them, and pick
+submission never waits on the GroupMe API.
+
+Digest mode (GROUPME_DIGEST_WINDOW_SECONDS > 0, or GROUPME_DIGEST_UNTIL_LOCK)
+coalesces a tournament's pick events into one message once the oldest has
+waited a full window, or as soon as picks lock:
+
+    🏌️ The Masters: 5 new entries, 3 edits
+    From: Alice, Bob, ...
+    💰 Purse now: $120
+
+Posts are also spaced at least GROUPME_MIN_POST_INTERVAL_SECONDS apart.
+"""
+import json
+import logging
+from datetime import datetime, timedelta
+
+from config import (
+    GROUPME_DIGEST_UNTIL_LOCK,
+    GROUPME_DIGEST_WINDOW_SECONDS,
+    GROUPME_MIN_POST_INTERVAL_SECONDS,
+    NOTIFY_BACKOFF_MAX_SECONDS,
+    NOTIFY_BACKOFF_SECONDS,
+    NOTIFY_MAX_ATTEMPTS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_pick_notification(conn, user, tournament, entry: int, golfer_ids: list, action: str):
+    """Queue a pick created/updated notification on the caller's connection (no commit)."""
+    from sqlalchemy import text
+
+    now = datetime.now().isoformat()
+    payload = {
+        "display_name": user.groupme_name or user.username,
+        "entry": entry,
+        "action": action,
+        "golfer_ids": golfer_ids,
+    }
+    conn.execute(
+        text("""
+            INSERT INTO notification_outbox
+            (kind, tournament_id, payload, status, attempts, next_attempt_at, created_at)
+            VALUES ('pick', :tid, :payload, 'pending', 0, :now, :now)
+        """),
+        {"tid": tournament.id, "payload": json.dumps(payload), "now": now}
+    )
+
+
+def _golfer_names(conn, golfer_ids) -> dict:
+    """golfer id -> name for just the given ids."""
+    from sqlalchemy import text
+
+    ids = sorted({g for g in golfer_ids if g})
+    if not ids:
+        return {}
+    params = {f"id_{i}": g for i, g in enumerate(ids)}
+    rows = conn.execute(
+        text(f"SELECT id, name FROM golfer WHERE id IN ({', '.join(':' + k for k in params)})"),
+        params
+    ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def _tournament_purse(conn, tournament):
+    """Current purse for a tournament, from its picks."""
+    from sqlalchemy import text
+    from routes.utils import calculate_tournament_purse
+
+    picks = conn.execute(
+        text("SELECT user_id, entry_number FROM pick WHERE tournament_id = :tid"),
+        {"tid": tournament.id}
+    ).fetchall()
+    return calculate_tournament_purse(tournament, picks)
+
+
+def render_pick_message(conn, tournament, payload: dict) -> str:
+    """Build the GroupMe text for a queued pick notification."""
+    names = _golfer_names(conn, payload.get("golfer_ids", []))
+    tier_names = [names.get(g, "-") if g else "-" for g in payload.get("golfer_ids", [])]
+    tier_names += ["-"] * (4 - len(tier_names))
+
+    purse = _tournament_purse(conn, tournament)
+    purse_text = f"${purse}" if purse else "Not set"
+
+    return f"""🏌️ {payload['display_name']} {payload['action']} Entry {payload['entry']} for {tournament.name}
+Tier 1: {tier_names[0]}
+Tier 2: {tier_names[1]}
+Tier 3: {tier_names[2]}
+Tier 4: {tier_names[3]}
+💰 Total Purse: {purse_text}"""
+
+
+def render_pick_digest(conn, tournament, payloads: list) -> str:
+    """Build one GroupMe text summarizing several queued pick notifications."""
+    created = sum(1 for p in payloads if p.get("action") == "created")
+    edited = len(payloads) - created
+
+    parts = []
+    if created:
+        parts.append(f"{created} new {'entry' if created == 1 else 'entries'}")
+    if edited:
+        parts.append(f"{edited} {'edit' if edited == 1 else 'edits'}")
+
+    names = list(dict.fromkeys(p["display_name"] for p in payloads))
+    purse = _tournament_purse(conn, tournament)
+
+    lines = [f"🏌️ {tournament.name}: {', '.join(parts)}", f"From: {', '.join(names)}"]
+    if purse:
+        lines.append(f"💰 Purse now: ${purse}")
+    return "\n".join(lines)
+
+
+def _backoff(attempts: int) -> timedelta:
+    return timedelta(seconds=min(NOTIFY_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0), NOTIFY_BACKOFF_MAX_SECONDS))
+
+
+def _digest_enabled() -> bool:
+    return GROUPME_DIGEST_WINDOW_SECONDS > 0 or GROUPME_DIGEST_UNTIL_LOCK
+
+
+def _batches(rows, tournaments, now: datetime) -> list:
+    """Group due rows into the messages to send now.
+
+    Without digest mode every row is its own message. With it, a tournament's
+    rows go out together once picks are locked or, unless holding until lock,
+    once the oldest row has waited a full window; otherwise they stay queued.
+    Rows of a deleted tournament (None in tournaments) are returned right away
+    so they can be marked failed.
+    """
+    if not _digest_enabled():
+        return [[row] for row in rows]
+
+    by_tournament = {}
+    for row in rows:
+        by_tournament.setdefault(row.tournament_id, []).append(row)
+
+    batches = []
+    window = timedelta(seconds=GROUPME_DIGEST_WINDOW_SECONDS)
+    for tournament_id, group in by_tournament.items():
+        oldest = min(datetime.fromisoformat(row.created_at) for row in group)
+        tournament = tournaments[tournament_id]
+        locked = tournament is None or bool(tournament.picks_locked)
+        if locked or (not GROUPME_DIGEST_UNTIL_LOCK and now - oldest >= window):
+            batches.append(group)
+    return batches
+
+
+def _load_tournaments(db, tournament_ids) -> dict:
+    """tournament_id -> tournament, or None for a tournament that was deleted."""
+    from fastsql import NotFoundError
+
+    tournaments = {}
+    for tournament_id in tournament_ids:
+        try:
+            tournaments[tournament_id] = db.tournaments[tournament_id]
+        except NotFoundError:
+            tournaments[tournament_id] = None
+    return tournaments
+
+
+def _last_post_at(conn):
+    """When the outbox last posted anything, across all processes."""
+    from sqlalchemy import text
+
+    last = conn.execute(text("SELECT MAX(sent_at) FROM notification_outbox WHERE status = 'sent'")).scalar()
+    return datetime.fromisoformat(last) if last else None
+
+
+def _mark(db, row_ids, status: str, attempts: int, error: str = None):
+    from sqlalchemy import text
+
+    now = datetime.now()
+    with db.db.engine.begin() as conn:
+        conn.execute(
+            text("""
+                UPDATE notification_outbox SET
+                    status = :status, attempts = :attempts, next_attempt_at = :next,
+                    last_error = :error, sent_at = :sent_at
+                WHERE id = :id
+            """),
+            [
+                {
+                    "id": row_id,
+                    "status": status,
+                    "attempts": attempts,
+                    "next": (now + _backoff(attempts)).isoformat(),
+                    "error": error,
+                    "sent_at": now.isoformat() if status == "sent" else None,
+                }
+                for row_id in row_ids
+            ]
+        )
+
+
+def dispatch_notifications(db, client=None, limit: int = 200) -> dict:
+    """Send due outbox rows. Returns dict with 'sent', 'retrying', 'failed', 'skipped'
+    (counted per queued notification) and 'messages' (GroupMe posts made).
+
+    Only one process should run this at a time (the job takes a lease).
+    """
+    from sqlalchemy import text
+    from services.groupme import GroupMeClient
+
+    counts = {"sent": 0, "retrying": 0, "failed": 0, "skipped": 0, "messages": 0}
+    now = datetime.now()
+
+    with db.db.engine.connect() as conn:
+        due = conn.execute(
+            text("""
+                SELECT id, kind, tournament_id, payload, attempts, created_at FROM notification_outbox
+                WHERE status = 'pending' AND next_attempt_at <= :now
+                ORDER BY id LIMIT :limit
+            """),
+            {"now": now.isoformat(), "limit": limit}
+        ).fetchall()
+        last_post = _last_post_at(conn) if due else None
+    if not due:
+        return counts
+
+    client = client or GroupMeClient(db_module=db)
+    tournaments = _load_tournaments(db, {row.tournament_id for row in due})
+
+    for batch in _batches(due, tournaments, now):
+        row_ids = [row.id for row in batch]
+        attempts = max(row.attempts for row in batch) + 1
+        tournament = tournaments[batch[0].tournament_id]
+
+        if tournament is None:
+            # Nothing to render; retrying can't help
+            _mark(db, row_ids, "failed", attempts, "Tournament no longer exists")
+            counts["failed"] += len(batch)
+            continue
+
+        if not client.bot_id:
+            _mark(db, row_ids, "skipped", attempts)
+            counts["skipped"] += len(batch)
+            continue
+
+        # Respect GroupMe rate limits; whatever is left goes out on the next run
+        if last_post and (datetime.now() - last_post).total_seconds() < GROUPME_MIN_POST_INTERVAL_SECONDS:
+            break
+
+        status, error = None, None
+        try:
+            payloads = [json.loads(row.payload) for row in batch]
+            with db.db.engine.connect() as conn:
+                if len(payloads) == 1:
+                    message = render_pick_message(conn, tournament, payloads[0])
+                else:
+                    message = render_pick_digest(conn, tournament, payloads)
+            if client.send_message(message):
+                status = "sent"
+                last_post = datetime.now()
+                counts["messages"] += 1
+            else:
+                error = "GroupMe send failed"
+        except Exception as e:
+            logger.error(f"Failed to dispatch notifications {row_ids}: {e}", exc_info=True)
+            error = str(e)[:500]
+
+        if status is None:
+            status = "failed" if attempts >= NOTIFY_MAX_ATTEMPTS else "pending"
+        _mark(db, row_ids, status, attempts, error)
+        counts["retrying" if status == "pending" else status] += len(batch)
+
+    if any(counts.values()):
+        logger.info(
+            f"Notification dispatch: {counts['messages']} messages, {counts['sent']} sent, "
+            f"{counts['retrying']} retrying, {counts['failed']} failed, {counts['skipped']} skipped"
+        )
+    return counts
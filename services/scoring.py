@@ -1,7 +1,81 @@
 """Scoring service - Calculate pick'em standings."""
+import hashlib
+import logging
 from datetime import datetime
 from sqlalchemy import text
 
+logger = logging.getLogger(__name__)
+
+
+def bump_standings_version(db_module, tournament_id: int = None, user_id: int = None):
+    """Mark a tournament's leaderboard (or every tournament's) as changed.
+
+    Leaderboard fragments are cached by tournament.standings_version; call this
+    after anything that changes what the tables show. Pass user_id when only
+    that user's rows changed (e.g. a new display name) so live updates resend
+    them. Never raises: a failed bump is logged, and the cached tables are
+    still dropped in this process.
+    """
+    from services.fragment_cache import leaderboard_fragments
+
+    leaderboard_fragments.invalidate(tournament_id)
+    sql = "UPDATE tournament SET standings_version = COALESCE(standings_version, 0) + 1"
+    params = {}
+    if tournament_id is not None:
+        sql += " WHERE id = :tid"
+        params["tid"] = tournament_id
+    try:
+        with db_module.db.engine.begin() as conn:
+            conn.execute(text(sql), params)
+            if user_id is not None and supports_row_versions(db_module):
+                conn.execute(
+                    text("""
+                        UPDATE pickem_standing SET changed_version = (
+                            SELECT standings_version FROM tournament WHERE tournament.id = pickem_standing.tournament_id
+                        ) WHERE user_id = :uid
+                    """),
+                    {"uid": user_id}
+                )
+    except Exception as e:
+        logger.warning(f"Could not bump standings_version: {e}")
+
+
+_row_versions_supported = None
+
+
+def supports_row_versions(db_module) -> bool:
+    """Whether pickem_standing has the changed_version and row_hash columns.
+
+    They are added on startup (db/models.py ADDED_COLUMNS) or by migration 005;
+    this is False only if that failed. Without them standings are saved
+    unversioned and live leaderboard updates are off. Checked once per process.
+    """
+    global _row_versions_supported
+    if _row_versions_supported is None:
+        import sqlalchemy as sa
+
+        try:
+            inspector = sa.inspect(db_module.db.engine)
+            standing_columns = {c['name'] for c in inspector.get_columns('pickem_standing')}
+            _row_versions_supported = {'changed_version', 'row_hash'} <= standing_columns
+        except Exception as e:
+            logger.warning(f"Could not inspect standings columns: {e}")
+            return False
+        if not _row_versions_supported:
+            logger.warning("Standings row versions unavailable; run migration 005 for live leaderboard updates")
+    return _row_versions_supported
+
+
+def _row_hash(standing: dict, has_results: bool) -> str:
+    """Fingerprint of everything a leaderboard row displays (player name and entry
+    suffix, scores, rank, golfer status/thru)."""
+    key = (
+        standing['display_name'],
+        standing['tier1_score'], standing['tier2_score'], standing['tier3_score'], standing['tier4_score'],
+        standing['best_two_total'], standing['rank'], standing['golfer_state'], has_results,
+    )
+    return hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+
 
 class ScoringService:
     """Service for calculating pick'em standings."""
@@ -32,17 +106,31 @@ class ScoringService:
         results = {r.golfer_id: r for r in self.db.tournament_results()
                    if r.tournament_id == tournament_id}
 
+        # Names as the leaderboard shows them (part of each row's change fingerprint)
+        users_by_id = {u.id: u for u in self.db.users()}
+        entries_per_user = {}
+        for pick in picks:
+            entries_per_user[pick.user_id] = entries_per_user.get(pick.user_id, 0) + 1
+
         standings = []
         for pick in picks:
             # Get entry_number (default to 1 for legacy picks)
             entry_number = getattr(pick, 'entry_number', 1) or 1
+            u = users_by_id.get(pick.user_id)
+            display_name = (u.groupme_name or u.username) if u else "Unknown"
+            if entries_per_user[pick.user_id] > 1:
+                display_name = f"{display_name} ({entry_number})"
 
             # Get score against par for each tier
             scores = []
             tier_scores = {}
 
+            golfer_state = []
+
             for tier in [1, 2, 3, 4]:
                 golfer_id = getattr(pick, f'tier{tier}_golfer_id')
+                result = results.get(golfer_id) if golfer_id else None
+                golfer_state.append((result.status, result.thru) if result else None)
                 if golfer_id and golfer_id in results:
                     result = results[golfer_id]
                     # Only count if not missed cut/WD/DQ
@@ -86,6 +174,8 @@ class ScoringService:
                 'has_third_made_cut': has_third_made_cut,
                 'fourth_best_score': fourth_best_score,
                 'has_fourth_made_cut': has_fourth_made_cut,
+                'golfer_state': tuple(golfer_state),
+                'display_name': display_name,
             })
 
         # Sort with tiebreaker rules
@@ -142,7 +232,33 @@ class ScoringService:
         # Delete all existing standings for this tournament and bulk insert fresh ones.
         # This avoids stale duplicate rows that cause the leaderboard to show wrong scores
         # when the upsert-by-first-record pattern skips over extra copies.
+        versioned = supports_row_versions(self.db)
         with self.db.db.engine.connect() as conn:
+            if versioned:
+                # Bump the version in the same transaction and stamp each row with the
+                # version it last changed in, so clients can fetch only changed rows
+                previous = {
+                    (row[0], row[1]): (row[2], row[3])
+                    for row in conn.execute(
+                        text("SELECT user_id, entry_number, changed_version, row_hash "
+                             "FROM pickem_standing WHERE tournament_id = :tid"),
+                        {"tid": tournament_id}
+                    )
+                }
+                conn.execute(
+                    text("UPDATE tournament SET standings_version = COALESCE(standings_version, 0) + 1 "
+                         "WHERE id = :tid"),
+                    {"tid": tournament_id}
+                )
+                version = conn.execute(
+                    text("SELECT standings_version FROM tournament WHERE id = :tid"), {"tid": tournament_id}
+                ).scalar()
+                for s in standings:
+                    s['row_hash'] = _row_hash(s, bool(results))
+                    old_version, old_hash = previous.get((s['user_id'], s['entry_number']), (None, None))
+                    unchanged = old_hash == s['row_hash'] and old_version is not None
+                    s['changed_version'] = old_version if unchanged else version
+
             conn.execute(text("DELETE FROM pickem_standing WHERE tournament_id = :tid"),
                          {"tid": tournament_id})
 
@@ -152,7 +268,8 @@ class ScoringService:
                 for i, s in enumerate(standings):
                     values_list.append(
                         f"(:tid_{i}, :uid_{i}, :en_{i}, :t1_{i}, :t2_{i}, :t3_{i}, :t4_{i}, "
-                        f":bt_{i}, :rank_{i}, :t3s_{i}, :h3_{i}, :t4s_{i}, :h4_{i}, :ua_{i})"
+                        f":bt_{i}, :rank_{i}, :t3s_{i}, :h3_{i}, :t4s_{i}, :h4_{i}, :ua_{i}"
+                        + (f", :cv_{i}, :rh_{i})" if versioned else ")")
                     )
                     params.update({
                         f"tid_{i}": tournament_id,
@@ -170,13 +287,22 @@ class ScoringService:
                         f"h4_{i}": s['has_fourth_made_cut'],
                         f"ua_{i}": now,
                     })
+                    if versioned:
+                        params[f"cv_{i}"] = s['changed_version']
+                        params[f"rh_{i}"] = s['row_hash']
                 conn.execute(text(
                     "INSERT INTO pickem_standing "
                     "(tournament_id, user_id, entry_number, tier1_position, tier2_position, "
                     "tier3_position, tier4_position, best_two_total, rank, third_best_score, "
-                    "has_third_made_cut, fourth_best_score, has_fourth_made_cut, updated_at) "
+                    "has_third_made_cut, fourth_best_score, has_fourth_made_cut, updated_at"
+                    + (", changed_version, row_hash) " if versioned else ") ") +
                     f"VALUES {', '.join(values_list)}"
                 ), params)
             conn.commit()
 
+        if versioned:
+            from services.fragment_cache import leaderboard_fragments
+            leaderboard_fragments.invalidate(tournament_id)
+        else:
+            bump_standings_version(self.db, tournament_id)
         return standings
@@ -0,0 +1,116 @@
+"""Cached access to the app_setting table.
+
+Settings (GroupMe bot id, invite secret) are read on hot paths: every
+GroupMeClient construction, every registration's invite check, the admin
+page. settings_service loads the whole table once and serves reads from
+memory.
+
+Writes go through set(), which also bumps a 'settings_version' row in the
+same transaction. Each process re-reads that one row at most every
+SETTINGS_VERSION_CHECK_SECONDS and reloads the table if it changed, so a
+bot id saved in one web worker reaches the others (and the ETL runner)
+within a few seconds.
+"""
+import logging
+import threading
+import time
+import uuid
+from typing import Optional
+
+from config import SETTINGS_VERSION_CHECK_SECONDS
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'settings_version'
+
+
+class SettingsService:
+    """In-memory cache of app_setting with cross-process invalidation."""
+
+    def __init__(self, version_check_seconds: float = SETTINGS_VERSION_CHECK_SECONDS):
+        self.version_check_seconds = version_check_seconds
+        self._values = None
+        self._version = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, db, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Value of a setting, or default if it isn't set."""
+        return self._current(db).get(key, default)
+
+    def set(self, db, key: str, value: str):
+        """Save a setting and bump the version so other processes reload."""
+        from sqlalchemy import text
+
+        version = uuid.uuid4().hex
+        with db.db.engine.begin() as conn:
+            for k, v in ((key, value), (VERSION_KEY, version)):
+                result = conn.execute(
+                    text("UPDATE app_setting SET value = :value WHERE key = :key"),
+                    {"key": k, "value": v}
+                )
+                if result.rowcount == 0:
+                    conn.execute(
+                        text("INSERT INTO app_setting (key, value) VALUES (:key, :value)"),
+                        {"key": k, "value": v}
+                    )
+
+        with self._lock:
+            if self._values is not None:
+                self._values[key] = value
+                self._values[VERSION_KEY] = version
+                self._version = version
+
+    def invalidate(self):
+        """Drop the cache; the next read reloads the table."""
+        with self._lock:
+            self._values = None
+
+    # Typed accessors
+
+    def groupme_bot_id(self, db) -> Optional[str]:
+        return self.get(db, 'groupme_bot_id') or None
+
+    def invite_secret(self, db) -> Optional[str]:
+        return self.get(db, 'invite_secret') or None
+
+    def _current(self, db) -> dict:
+        with self._lock:
+            values = self._values
+            due = time.monotonic() - self._checked_at > self.version_check_seconds
+
+        if values is None:
+            return self._load(db)
+        if due:
+            if self._read_version(db) != self._version:
+                return self._load(db)
+            with self._lock:
+                self._checked_at = time.monotonic()
+        return values
+
+    def _read_version(self, db) -> Optional[str]:
+        from sqlalchemy import text
+
+        with db.db.engine.connect() as conn:
+            return conn.execute(
+                text("SELECT value FROM app_setting WHERE key = :key"),
+                {"key": VERSION_KEY}
+            ).scalar()
+
+    def _load(self, db) -> dict:
+        from sqlalchemy import text
+
+        with db.db.engine.connect() as conn:
+            rows = conn.execute(text("SELECT key, value FROM app_setting ORDER BY id DESC")).fetchall()
+        # Newest-first so that for a duplicated key the oldest row wins, as before
+        values = {key: value for key, value in rows}
+
+        with self._lock:
+            self._values = values
+            self._version = values.get(VERSION_KEY)
+            self._checked_at = time.monotonic()
+        logger.debug(f"Loaded {len(values)} app settings")
+        return values
+
+
+settings_service = SettingsService()
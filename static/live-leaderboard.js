@@ -0,0 +1,77 @@
+// Live pick'em standings: apply changed rows pushed over /leaderboard/stream,
+// or polled from /leaderboard/rows where EventSource isn't available.
+// A paginated table only holds rows ranked inside its page's rank window.
+(function () {
+  var live = document.getElementById("pickem-live");
+  var table = document.getElementById("pickem-table");
+  if (!live || !table) return;
+
+  var body = table.tBodies[0];
+  var viewer = live.dataset.viewer;
+  var tournament = encodeURIComponent(table.dataset.tournament);
+  var rankMin = table.dataset.rankMin ? Number(table.dataset.rankMin) : -Infinity;
+  var rankMax = table.dataset.rankMax ? Number(table.dataset.rankMax) : Infinity;
+  var source = null;
+
+  function reload() {
+    if (source) source.close();
+    window.location.reload();
+  }
+
+  function apply(rowsHtml, version, total) {
+    if (rowsHtml) {
+      var parsed = document.createElement("tbody");
+      parsed.innerHTML = rowsHtml;
+      Array.prototype.slice.call(parsed.rows).forEach(function (row) {
+        if (row.dataset.user === viewer) row.classList.add("current-user");
+        var rank = Number(row.dataset.rank);
+        var inPage = rank >= rankMin && rank <= rankMax;
+        var existing = body.querySelector('tr[data-entry="' + row.dataset.entry + '"]');
+        if (existing && inPage) body.replaceChild(row, existing);
+        else if (existing) body.removeChild(existing);
+        else if (inPage) body.appendChild(row);
+      });
+
+      // Stable re-sort by rank; rows keep their relative order within a tie
+      var rows = Array.prototype.slice.call(body.rows);
+      rows.forEach(function (row, i) { row._order = i; });
+      rows.sort(function (a, b) {
+        return (Number(a.dataset.rank) - Number(b.dataset.rank)) || (a._order - b._order);
+      });
+      rows.forEach(function (row) { body.appendChild(row); });
+    }
+    table.dataset.version = version;
+
+    // Entries were added or removed: the changed rows can't account for that
+    if (total !== Number(table.dataset.total)) reload();
+  }
+
+  if (window.EventSource) {
+    source = new EventSource("/leaderboard/stream?tournament_id=" + tournament +
+      "&since=" + encodeURIComponent(table.dataset.version));
+    source.addEventListener("reload", reload);
+    source.addEventListener("close", function () { source.close(); });
+    source.addEventListener("standings", function (event) {
+      var data = JSON.parse(event.data);
+      apply(data.rows, data.version, data.total);
+    });
+    return;
+  }
+
+  function poll() {
+    var request = new XMLHttpRequest();
+    request.open("GET", "/leaderboard/rows?tournament_id=" + tournament +
+      "&since=" + encodeURIComponent(table.dataset.version));
+    request.onload = function () {
+      if (request.getResponseHeader("HX-Refresh") === "true") return reload();
+      if (request.status === 200) {
+        apply(request.responseText, request.getResponseHeader("X-Standings-Version"),
+          Number(request.getResponseHeader("X-Standings-Total")));
+      }
+      setTimeout(poll, Number(live.dataset.pollMs));
+    };
+    request.onerror = function () { setTimeout(poll, Number(live.dataset.pollMs)); };
+    request.send();
+  }
+  setTimeout(poll, Number(live.dataset.pollMs));
+})();
@@ -0,0 +1,73 @@
+"""Restart tests: the app must keep working after it adds missing columns on startup.
+
+Each start runs in its own interpreter, since config and db bind DATABASE_URL
+at import time.
+"""
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+def _start(database_url, body):
+    """Run one app start (init_db) followed by body in a fresh interpreter."""
+    script = "import db\ndb.init_db()\n" + textwrap.dedent(body)
+    env = dict(os.environ, DATABASE_URL=database_url, SESSION_MODE="db")
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=REPO_DIR, env=env,
+        capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def _create_pre_migration_db(database_url):
+    """Create the tables, then drop every ADDED_COLUMNS column as an old database lacks them."""
+    _start(database_url, """
+        import sqlalchemy as sa
+        from sqlalchemy import text
+        from db.models import ADDED_COLUMNS
+        inspector = sa.inspect(db.db.engine)
+        with db.db.engine.connect() as conn:
+            for table, column, _ in ADDED_COLUMNS:
+                if column not in {c['name'] for c in inspector.get_columns(table)}:
+                    continue
+                conn.execute(text(f'ALTER TABLE "{table}" DROP COLUMN {column}'))
+            conn.commit()
+    """)
+
+
+LOGIN = """
+    from services.auth import AuthService, hash_password
+    if not [u for u in db.users() if u.groupme_name == "Restart"]:
+        db.users.insert(username="restart", password_hash=hash_password("pw"), groupme_name="Restart")
+    token, error = AuthService(db).login("Restart", "pw")
+    assert token and not error, error
+    assert [s for s in db.sessions() if s.token == token]
+"""
+
+
+STANDINGS = """
+    standing = db.pickem_standings.insert(tournament_id=1, user_id=1, entry_number=1, rank=1)
+    assert [s for s in db.pickem_standings() if s.id == standing.id]
+    db.pickem_standings.delete(standing.id)
+"""
+
+
+def test_login_survives_restarts(tmp_path):
+    database_url = f"sqlite:///{tmp_path / 'restart.db'}"
+    _create_pre_migration_db(database_url)
+
+    # First start adds the missing columns, the next ones map them
+    for _ in range(3):
+        _start(database_url, LOGIN)
+
+
+def test_standings_survive_restarts(tmp_path):
+    database_url = f"sqlite:///{tmp_path / 'restart.db'}"
+    _create_pre_migration_db(database_url)
+
+    for _ in range(3):
+        _start(database_url, STANDINGS)